@@ -0,0 +1,80 @@
+"""
+Measure the time it takes to import the extension.
+
+Sphinx itself is imported beforehand, so that only the cost added by the
+extension is measured. Each measurement runs in a fresh interpreter and the
+fastest run is reported.
+
+Fails if the import exceeds the time budget, or if any module that is meant to
+be imported lazily was loaded.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --budget-ms 150 --repeat 10
+"""
+from typing import List, Optional, Dict, Any
+import sys
+import json
+import argparse
+import subprocess
+
+# Modules that must not be loaded by merely importing the extension
+LAZY_MODULES = (
+    "myst_parser",
+    "markdown_it",
+    "peakrdl_html",
+    "peakrdl.config.loader",
+    "peakrdl.process_input",
+    "systemrdl",
+    "sphinx.builders.html",
+)
+
+MEASURE_SCRIPT = """
+import sys, json, time
+import sphinx.application
+start = time.perf_counter()
+import sphinx_peakrdl
+elapsed = time.perf_counter() - start
+lazy = json.loads(sys.argv[1])
+print(json.dumps({
+    "ms": elapsed * 1000,
+    "loaded": [m for m in lazy if m in sys.modules],
+}))
+"""
+
+
+def measure() -> Dict[str, Any]:
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_SCRIPT, json.dumps(LAZY_MODULES)],
+        stdout=subprocess.PIPE, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measurements. Default: 5")
+    parser.add_argument(
+        "--budget-ms", type=float, default=300,
+        help="Fail if importing the extension takes longer than this many milliseconds. Default: 300"
+    )
+    options = parser.parse_args(argv)
+
+    runs = [measure() for _ in range(options.repeat)]
+    best = min(run["ms"] for run in runs)
+    loaded = runs[0]["loaded"]
+    print(f"import sphinx_peakrdl: {best:.1f} ms (best of {options.repeat})")
+
+    failed = False
+    if loaded:
+        print(f"Modules that should be imported lazily were loaded: {', '.join(loaded)}")
+        failed = True
+    if best > options.budget_ms:
+        print(f"Exceeds budget of {options.budget_ms:.1f} ms")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
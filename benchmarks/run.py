@@ -0,0 +1,206 @@
+"""
+Benchmark the extension by building synthetic Sphinx projects.
+
+Each scenario generates a synthetic design and Sphinx project, then runs a
+cold build (empty build directory) followed by a warm rebuild (no changes).
+Per-phase timing and memory are collected using the extension's built-in
+profiling report (see the 'peakrdl_profile' config value).
+
+Usage:
+    python benchmarks/run.py --output baseline.json
+    python benchmarks/run.py --compare baseline.json --threshold 0.2
+    python benchmarks/run.py --scenario custom --regs-per-block 256 --depth 1
+"""
+from typing import Dict, Any, List, Optional
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import platform
+import subprocess
+from dataclasses import replace
+
+from synth import DesignParams, PRESETS, generate_project
+
+# Metrics that are compared against the baseline
+COMPARED_METRICS = ("wall", "peak_mem")
+
+
+def run_build(project_dir: str, build_dir: str, profile_dir: str) -> Dict[str, Any]:
+    """
+    Run sphinx-build in a subprocess and return its measurements
+    """
+    cmd = [
+        sys.executable, "-m", "sphinx",
+        "-b", "html", "-q",
+        "-D", f"peakrdl_profile={profile_dir}",
+        project_dir, build_dir,
+    ]
+    start = time.perf_counter()
+    result = subprocess.run(
+        cmd, cwd=project_dir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, check=False
+    )
+    wall = time.perf_counter() - start
+    if result.returncode != 0:
+        sys.stdout.buffer.write(result.stdout)
+        raise RuntimeError(f"sphinx-build failed for project: {project_dir}")
+
+    with open(os.path.join(profile_dir, "peakrdl-profile.json"), "r", encoding="utf-8") as f:
+        profile = json.load(f)
+
+    return {
+        "wall": wall,
+        "phases": profile["phases"],
+    }
+
+
+def run_scenario(params: DesignParams, work_dir: str, repeat: int) -> Dict[str, Any]:
+    """
+    Run cold and warm builds of a scenario.
+    If repeated, the fastest of each build is kept.
+    """
+    project_dir = os.path.join(work_dir, "project")
+    build_dir = os.path.join(work_dir, "build")
+    profile_dir = os.path.join(work_dir, "profile")
+    generate_project(params, project_dir)
+
+    results: Dict[str, Any] = {}
+    for _ in range(repeat):
+        shutil.rmtree(build_dir, ignore_errors=True)
+        for build in ("cold", "warm"):
+            r = run_build(project_dir, build_dir, profile_dir)
+            if build not in results or r["wall"] < results[build]["wall"]:
+                results[build] = r
+
+    return {
+        "params": params.as_dict(),
+        "builds": results,
+    }
+
+
+def get_metrics(results: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Flatten benchmark results into a dictionary of named metrics
+    """
+    metrics = {}
+    for scenario_name, scenario in results["scenarios"].items():
+        for build_name, build in scenario["builds"].items():
+            prefix = f"{scenario_name}/{build_name}"
+            metrics[f"{prefix}/total/wall"] = build["wall"]
+            for phase_name, phase in build["phases"].items():
+                for metric in COMPARED_METRICS:
+                    metrics[f"{prefix}/{phase_name}/{metric}"] = phase[metric]
+    return metrics
+
+
+def compare(baseline: Dict[str, Any], results: Dict[str, Any], threshold: float, min_wall: float) -> List[str]:
+    """
+    Compare results against a baseline.
+    Returns a list of regressions that exceed the threshold.
+    """
+    base_metrics = get_metrics(baseline)
+    new_metrics = get_metrics(results)
+
+    regressions = []
+    print(f"{'metric':<70} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, new in sorted(new_metrics.items()):
+        base = base_metrics.get(name)
+        if base is None:
+            continue
+
+        if name.endswith("/wall") and max(base, new) < min_wall:
+            # Too short to be measured reliably
+            continue
+
+        change = (new - base) / base if base else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<70} {base:12.4g} {new:12.4g} {change:+8.1%}{flag}")
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--scenario", action="append", choices=list(PRESETS) + ["custom"],
+        help="Scenario to run. Can be specified multiple times. Default: all presets"
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Number of times to repeat each build")
+    parser.add_argument("--output", "-o", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Compare results against this baseline JSON file")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2,
+        help="Relative increase that is considered a regression. Default: 0.2"
+    )
+    parser.add_argument(
+        "--min-wall", type=float, default=0.05,
+        help="Ignore timing metrics shorter than this many seconds. Default: 0.05"
+    )
+    parser.add_argument("--keep", help="Keep generated projects and builds in this directory")
+
+    # Parameters of the 'custom' scenario
+    custom_group = parser.add_argument_group("custom scenario")
+    for name, default in DesignParams().as_dict().items():
+        opt = "--" + name.replace("_", "-")
+        if isinstance(default, bool):
+            custom_group.add_argument(opt, action="store_true", default=None)
+        else:
+            custom_group.add_argument(opt, type=type(default), default=None)
+
+    options = parser.parse_args(argv)
+
+    scenarios = options.scenario or list(PRESETS)
+    custom_params = {
+        name: getattr(options, name)
+        for name in DesignParams().as_dict()
+        if getattr(options, name) is not None
+    }
+
+    results: Dict[str, Any] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scenarios": {},
+    }
+
+    work_root = options.keep or tempfile.mkdtemp(prefix="sphinx-peakrdl-bench-")
+    try:
+        for scenario_name in scenarios:
+            if scenario_name == "custom":
+                params = replace(DesignParams(), **custom_params)
+            else:
+                params = PRESETS[scenario_name]
+            print(f"Running scenario: {scenario_name}", file=sys.stderr)
+            results["scenarios"][scenario_name] = run_scenario(
+                params, os.path.join(work_root, scenario_name), options.repeat
+            )
+    finally:
+        if not options.keep:
+            shutil.rmtree(work_root, ignore_errors=True)
+
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if options.compare:
+        with open(options.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, results, options.threshold, options.min_wall)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) exceed {options.threshold:.0%}")
+            return 1
+        print("\nNo regressions")
+    elif not options.output:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+"""
+Synthetic SystemRDL design and Sphinx project generator.
+
+Generates a design with a controllable number of registers, fields per
+register, array sizes, hierarchy depth and description complexity, along with
+a Sphinx project that documents it using rdl:docnode, rdl:doctree and dense
+pages of rdl:ref cross-references.
+"""
+from typing import List
+import os
+import textwrap
+from dataclasses import dataclass, asdict
+
+
+@dataclass
+class DesignParams:
+    # Number of distinct register types. Register instances cycle through these
+    reg_types: int = 8
+    # Number of registers in each leaf block
+    regs_per_block: int = 32
+    # Number of fields in each register (max 32)
+    fields_per_reg: int = 4
+    # Array size of every other register. 0 disables register arrays
+    array_size: int = 4
+    # Number of addrmap levels below the top-level
+    depth: int = 2
+    # Number of child blocks in each non-leaf addrmap
+    blocks_per_level: int = 2
+    # Use long markdown-heavy descriptions
+    markdown_heavy: bool = False
+    # Number of rdl:ref references on the cross-reference page
+    n_refs: int = 500
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+PRESETS = {
+    "small": DesignParams(
+        reg_types=4, regs_per_block=8, fields_per_reg=4, array_size=2,
+        depth=1, blocks_per_level=2, n_refs=100,
+    ),
+    "medium": DesignParams(),
+    "large": DesignParams(
+        reg_types=32, regs_per_block=64, fields_per_reg=8, array_size=8,
+        depth=3, blocks_per_level=3, n_refs=5000,
+    ),
+    "markdown": DesignParams(
+        reg_types=16, regs_per_block=32, fields_per_reg=8, array_size=0,
+        depth=2, blocks_per_level=2, markdown_heavy=True, n_refs=500,
+    ),
+}
+
+
+def _desc(name: str, markdown_heavy: bool) -> str:
+    if not markdown_heavy:
+        return f"Description of {name}."
+
+    # Avoid double-quotes since these are embedded in RDL strings
+    return textwrap.dedent(f"""\
+        The **{name}** component controls *several* aspects of the block.
+
+        Writing to it has the following effects:
+
+        - Updates the `{name}` shadow copy
+        - Triggers a **synchronization** event
+        - Clears any pending status in [the user manual](https://example.com)
+
+        | Mode | Behavior              |
+        |------|-----------------------|
+        | 0    | Disabled              |
+        | 1    | Enabled, *one-shot*   |
+        | 2    | Enabled, `continuous` |
+
+        ```c
+        // Example usage
+        write_reg({name}, 0x1);
+        ```
+
+        1. First, configure the block.
+        2. Then, enable {name}.
+        """)
+
+
+def generate_rdl(p: DesignParams) -> str:
+    """
+    Generate the SystemRDL source for a synthetic design
+    """
+    if not 1 <= p.fields_per_reg <= 32:
+        raise ValueError("fields_per_reg must be between 1 and 32")
+
+    lines: List[str] = []
+    field_width = 32 // p.fields_per_reg
+
+    # Register types
+    for t in range(p.reg_types):
+        lines.append(f"reg reg_t{t} {{")
+        lines.append(f'    name = "Register type {t}";')
+        lines.append(f'    desc = "{_desc(f"reg_t{t}", p.markdown_heavy)}";')
+        for f in range(p.fields_per_reg):
+            lsb = f * field_width
+            msb = lsb + field_width - 1
+            sw = "rw" if (f + t) % 3 else "r"
+            lines.append("    field {")
+            lines.append(f'        name = "Field {f}";')
+            lines.append(f'        desc = "{_desc(f"f{f}", p.markdown_heavy)}";')
+            lines.append(f"        sw = {sw}; hw = r;")
+            lines.append(f"    }} f{f}[{msb}:{lsb}] = {f % 2};")
+        lines.append("};")
+        lines.append("")
+
+    # Leaf block
+    lines.append(f"addrmap blk_l{p.depth} {{")
+    for r in range(p.regs_per_block):
+        t = r % p.reg_types
+        if p.array_size and r % 2:
+            lines.append(f"    reg_t{t} reg{r}[{p.array_size}];")
+        else:
+            lines.append(f"    reg_t{t} reg{r};")
+    lines.append("};")
+    lines.append("")
+
+    # Hierarchy of blocks
+    for level in range(p.depth - 1, -1, -1):
+        name = "top" if level == 0 else f"blk_l{level}"
+        lines.append(f"addrmap {name} {{")
+        lines.append(f'    desc = "{_desc(name, p.markdown_heavy)}";')
+        for b in range(p.blocks_per_level):
+            lines.append(f"    blk_l{level + 1} blk{b};")
+        lines.append("};")
+        lines.append("")
+
+    if p.depth == 0:
+        # Wrap the leaf block in a top-level addrmap
+        lines.append("addrmap top { blk_l0 blk0; };")
+
+    return "\n".join(lines)
+
+
+def get_leaf_block_path(p: DesignParams) -> str:
+    return ".".join(["top"] + ["blk0"] * max(p.depth, 1))
+
+
+def get_ref_targets(p: DesignParams) -> List[str]:
+    """
+    Get a list of register and field paths in the first leaf block
+    """
+    leaf = get_leaf_block_path(p)
+    targets = []
+    for r in range(p.regs_per_block):
+        targets.append(f"{leaf}.reg{r}")
+        for f in range(p.fields_per_reg):
+            targets.append(f"{leaf}.reg{r}.f{f}")
+    return targets
+
+
+CONF_PY = """\
+extensions = ["sphinx_peakrdl"]
+exclude_patterns = ["_build"]
+peakrdl_input_files = ["design.rdl"]
+"""
+
+
+def generate_project(p: DesignParams, project_dir: str) -> None:
+    """
+    Write a Sphinx project that documents a synthetic design into project_dir
+    """
+    os.makedirs(project_dir, exist_ok=True)
+
+    def write(filename: str, content: str) -> None:
+        with open(os.path.join(project_dir, filename), "w", encoding="utf-8") as f:
+            f.write(content)
+
+    write("design.rdl", generate_rdl(p))
+    write("conf.py", CONF_PY)
+
+    write("index.rst", textwrap.dedent("""\
+        Synthetic Design
+        ================
+
+        .. toctree::
+
+            docnode
+            doctree
+            refs
+        """))
+
+    # One docnode per register in the first leaf block
+    leaf = get_leaf_block_path(p)
+    docnode = ["Docnodes", "========", ""]
+    for r in range(p.regs_per_block):
+        docnode.append(f".. rdl:docnode:: {leaf}.reg{r}")
+        docnode.append("")
+    write("docnode.rst", "\n".join(docnode))
+
+    write("doctree.rst", "Doctree\n=======\n\n.. rdl:doctree:: top\n")
+
+    # Dense page of cross-references
+    targets = get_ref_targets(p)
+    refs = ["References", "==========", ""]
+    para: List[str] = []
+    for i in range(p.n_refs):
+        target = targets[i % len(targets)]
+        if i % 3 == 0:
+            para.append(f":rdl:doc-ref:`{target}`")
+        elif i % 3 == 1:
+            para.append(f":rdl:ref:`~{target}`")
+        else:
+            para.append(f":rdl:html-ref:`{target}`")
+        if len(para) == 10:
+            refs.append(", ".join(para))
+            refs.append("")
+            para = []
+    if para:
+        refs.append(", ".join(para))
+        refs.append("")
+    write("refs.rst", "\n".join(refs))
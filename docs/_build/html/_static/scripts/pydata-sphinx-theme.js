@@ -0,0 +1,2 @@
+(()=>{"use strict";function e(e){"loading"!=document.readyState?e():document.addEventListener("DOMContentLoaded",e)}const t=e=>"string"==typeof e&&/^[v\d]/.test(e)&&o.test(e),n=(e,t,n)=>{u(n);const o=((e,t)=>{const n=r(e),o=r(t),s=n.pop(),a=o.pop(),i=c(n,o);return 0!==i?i:s&&a?c(s.split("."),a.split(".")):s||a?s?-1:1:0})(e,t);return d[n].includes(o)},o=/^[v^~<>=]*?(\d+)(?:\.([x*]|\d+)(?:\.([x*]|\d+)(?:\.([x*]|\d+))?(?:-([\da-z\-]+(?:\.[\da-z\-]+)*))?(?:\+[\da-z\-]+(?:\.[\da-z\-]+)*)?)?)?$/i,r=e=>{if("string"!=typeof e)throw new TypeError("Invalid argument expected string");const t=e.match(o);if(!t)throw new Error(`Invalid argument not valid semver ('${e}' received)`);return t.shift(),t},s=e=>"*"===e||"x"===e||"X"===e,a=e=>{const t=parseInt(e,10);return isNaN(t)?e:t},i=(e,t)=>{if(s(e)||s(t))return 0;const[n,o]=((e,t)=>typeof e!=typeof t?[String(e),String(t)]:[e,t])(a(e),a(t));return n>o?1:n<o?-1:0},c=(e,t)=>{for(let n=0;n<Math.max(e.length,t.length);n++){const o=i(e[n]||"0",t[n]||"0");if(0!==o)return o}return 0},d={">":[1],">=":[0,1],"=":[0],"<=":[-1,0],"<":[-1]},l=Object.keys(d),u=e=>{if("string"!=typeof e)throw new TypeError("Invalid operator type, expected string but got "+typeof e);if(-1===l.indexOf(e))throw new Error(`Invalid operator, expected one of ${l.join("|")}`)};var m=window.matchMedia("(prefers-color-scheme: dark)");function h(e){document.documentElement.dataset.theme=m.matches?"dark":"light"}function p(e){"light"!==e&&"dark"!==e&&"auto"!==e&&(console.error(`Got invalid theme mode: ${e}. Resetting to auto.`),e="auto");var t=m.matches?"dark":"light";document.documentElement.dataset.mode=e;var n="auto"==e?t:e;document.documentElement.dataset.theme=n,document.querySelectorAll(".dropdown-menu").forEach(e=>{"dark"===n?e.classList.add("dropdown-menu-dark"):e.classList.remove("dropdown-menu-dark")}),localStorage.setItem("mode",e),localStorage.setItem("theme",n),console.log(`[PST]: Changed to ${e} mode using the ${n} theme.`),m.onchange="auto"==e?h:""}function f(e){const t="active";document.querySelectorAll(".theme-change-button").forEach(n=>{n.dataset.mode===e?n.classList.add(t):n.classList.remove(t)})}function g(e){const t=e.currentTarget.dataset.mode;p(t),f(t)}var v=()=>{let e=document.querySelectorAll("form.bd-search");return e.length?(1==e.length?e[0]:document.querySelector(":not(#pst-search-dialog) > form.bd-search")).querySelector("input"):void 0},y=()=>{const e=v(),t=document.getElementById("pst-search-dialog");t&&(e===t.querySelector("input")?t.open?t.close():t.showModal():document.activeElement===e?e.blur():(e.focus(),e.select(),e.scrollIntoView({block:"center"})))},w=0===navigator.platform.indexOf("Mac")||"iPhone"===navigator.platform;const b=({currentTarget:e,clientX:t,clientY:n})=>{if(!e.open)return;const{left:o,right:r,top:s,bottom:a}=e.getBoundingClientRect();(t<o||r<t||n<s||a<n)&&e.close()};var E=()=>{if(!DOCUMENTATION_OPTIONS.search_as_you_type)return;let e=document.querySelector("#search-results");e&&e.remove(),e=document.createElement("section"),e.classList.add("empty"),e.tabIndex=-1,e.addEventListener("keydown",e=>{"Escape"===e.key&&(e.preventDefault(),e.stopPropagation(),y(),E())}),e.id="search-results",document.querySelector("#pst-search-dialog").appendChild(e);const t=document.documentElement.dataset.content_root,n=new MutationObserver(()=>{Array.from(document.querySelectorAll("#search-results .search a")).forEach(e=>{e.tabIndex=0;const n=e.getAttribute("href");n.startsWith(t)||(e.href=`${t}${n}`)})});let o=!1;new MutationObserver(()=>{if(o)return;const e=document.querySelector("#search-results .search");e&&(n.observe(e,{childList:!0}),o=!0)}).observe(e,{childList:!0})},S=()=>"dirhtml"==DOCUMENTATION_OPTIONS.BUILDER?DOCUMENTATION_OPTIONS.pagename.endsWith("index")?`${DOCUMENTATION_OPTIONS.pagename.substring(0,DOCUMENTATION_OPTIONS.pagename.length-5)}`:`${DOCUMENTATION_OPTIONS.pagename}/`:`${DOCUMENTATION_OPTIONS.pagename}.html`;async function T(e){document.querySelector("#bd-header-version-warning").remove();const t=DOCUMENTATION_OPTIONS.VERSION,n=new Date,o=JSON.parse(localStorage.getItem("pst_banner_pref")||"{}");console.debug(`[PST] Dismissing the version warning banner on ${t} starting ${n}.`),o[t]=n,localStorage.setItem("pst_banner_pref",JSON.stringify(o))}async function O(e){e.preventDefault();const t=S();let n=e.currentTarget.getAttribute("href"),o=n.replace(t,"");try{(await fetch(n,{method:"HEAD"})).ok?location.href=n:location.href=o}catch(e){location.href=o}}async function _(){var e=document.querySelectorAll(".version-switcher__button");const o=e.length>0,r=DOCUMENTATION_OPTIONS.hasOwnProperty("theme_switcher_json_url"),s=DOCUMENTATION_OPTIONS.show_version_warning_banner;if(r&&(o||s)){const o=await async function(e){const t=S();try{var n=new URL(e)}catch(o){if(!(o instanceof TypeError))throw o;{"file:"==window.location.protocol&&console.info("[PST] looks like you're viewing this site from a local filesystem, so the version switcher won't work unless you've disabled CORS. See https://pydata-sphinx-theme.readthedocs.io/en/stable/user_guide/version-dropdown.html");const o=t?window.location.href.indexOf(t):-1,r=-1==o?window.location.href:window.location.href.substring(0,o);n=new URL(e,r)}}const o=await fetch(n);return await o.json()}(DOCUMENTATION_OPTIONS.theme_switcher_json_url);o&&(function(e,t){const n=S();t.forEach(e=>{e.dataset.activeVersionName="",e.dataset.activeVersion=""});const o=(e=e.map(e=>(e.match=e.version==DOCUMENTATION_OPTIONS.theme_switcher_version_match,e.preferred=e.preferred||!1,"name"in e||(e.name=e.version),e))).map(e=>e.preferred&&e.match).some(Boolean);var r=!1;e.forEach(e=>{const s=document.createElement("a");s.setAttribute("class","dropdown-item list-group-item list-group-item-action py-1"),s.setAttribute("href",`${e.url}${n}`),s.setAttribute("role","option");const a=document.createElement("span");a.textContent=`${e.name}`,s.appendChild(a),s.dataset.versionName=e.name,s.dataset.version=e.version;let i=o&&e.preferred,c=!o&&!r&&e.match;(i||c)&&(s.classList.add("active"),t.forEach(t=>{t.innerText=e.name,t.dataset.activeVersionName=e.name,t.dataset.activeVersion=e.version}),r=!0),document.querySelectorAll(".version-switcher__menu").forEach(e=>{let t=s.cloneNode(!0);t.onclick=O,e.append(t)})})}(o,e),s&&function(e){var o=DOCUMENTATION_OPTIONS.VERSION,r=e.filter(e=>e.preferred);if(1!==r.length){const e=0==r.length?"No":"Multiple";return void console.log(`[PST] ${e} versions marked "preferred" found in versions JSON, ignoring.`)}const s=r[0].version,a=r[0].url,i=t(o)&&t(s);if(i&&n(o,s,"="))return void console.log("[PST]: This is the preferred version of the docs, not showing the warning banner.");const c=JSON.parse(localStorage.getItem("pst_banner_pref")||"{}")[o];if(null!=c){const e=new Date(c),t=(new Date-e)/864e5;if(t<14)return void console.info(`[PST] Suppressing version warning banner; was dismissed ${Math.floor(t)} day(s) ago`)}const d=document.querySelector("#bd-header-version-warning"),l=document.createElement("div"),u=document.createElement("div"),m=document.createElement("strong"),h=document.createElement("a"),p=document.createElement("a");l.classList="bd-header-announcement__content  ms-auto me-auto",u.classList="sidebar-message",h.classList="btn text-wrap font-weight-bold ms-3 my-1 align-baseline pst-button-link-to-stable-version",h.href=`${a}${S()}`,h.innerText="Switch to stable version",h.onclick=O,p.classList="ms-3 my-1 align-baseline";const f=document.createElement("i");p.append(f),f.classList="fa-solid fa-xmark",p.onclick=T,u.innerText="This is documentation for ";const g=o.includes("dev")||o.includes("rc")||o.includes("pre"),v=i&&n(o,s,">");g||v?m.innerText="an unstable development version":i&&n(o,s,"<")?m.innerText=`an old version (${o})`:m.innerText=o?`version ${o}`:"an unknown version",d.appendChild(l),d.append(p),l.appendChild(u),u.appendChild(m),u.appendChild(document.createTextNode(".")),u.appendChild(h),d.classList.remove("d-none")}(o))}}function I(){const e=()=>{document.querySelectorAll(["pre",".nboutput > .output_area",".cell_output > .output",".jp-RenderedHTMLCommon",".pst-scrollable-table-container"].join(", ")).forEach(e=>{e.tabIndex=e.scrollWidth>e.clientWidth||e.scrollHeight>e.clientHeight?0:-1})},t=L(e,300);window.addEventListener("resize",t),new MutationObserver(t).observe(document.getElementById("main-content"),{subtree:!0,childList:!0}),e()}function L(e,t){let n=null;return(...o)=>{clearTimeout(n),n=setTimeout(()=>{e(...o)},t)}}async function N(){const e=document.querySelector(".bd-header-announcement"),t=JSON.parse(localStorage.getItem("pst_announcement_banner_pref")||"{}").closed;if(null!=t){const n=new Date(t),o=(new Date-n)/864e5;if(o<14)return console.info(`[PST] Suppressing announcement banner; was dismissed ${Math.floor(o)} day(s) ago`),void e.remove()}const{pstAnnouncementUrl:n}=e?e.dataset:null;if(!n)return;try{const t=await fetch(n);if(!t.ok)throw new Error(`[PST]: HTTP response status not ok: ${t.status} ${t.statusText}`);let o=await t.text();if(o=o.trim(),0===o.length)return void console.log(`[PST]: Empty announcement at: ${n}`);e.innerHTML=`<div class="bd-header-announcement__content">${o}</div>`,e.classList.remove("d-none")}catch(e){console.log(`[PST]: Failed to load announcement at: ${n}`),console.error(e)}console.debug("[PST] Adding close button to announcement banner");const o=document.createElement("a");o.classList="ms-3 my-1 align-baseline";const r=document.createElement("i");o.append(r),r.classList="fa-solid fa-xmark",o.onclick=A,e.append(o)}async function A(e){document.querySelector(".bd-header-announcement").remove();const t=new Date,n=JSON.parse(localStorage.getItem("pst_announcement_banner_pref")||"{}");console.debug(`[PST] Dismissing the announcement banner starting ${t}.`),n.closed=t.toISOString(),localStorage.setItem("pst_announcement_banner_pref",JSON.stringify(n))}e(async function(){await Promise.allSettled([_(),N()]);const e=document.querySelector(".pst-async-banner-revealer");if(!e)return;e.classList.remove("d-none");const t=Array.from(e.children).reduce((e,t)=>e+t.offsetHeight,0);e.style.setProperty("height",`${t}px`),setTimeout(()=>{e.style.setProperty("height","auto")},320)}),e(function(){const e=document.documentElement.dataset.mode;p(e),f(e),document.querySelectorAll(".theme-change-button").forEach(e=>{e.addEventListener("click",g)})}),e(function(){if(!document.querySelector(".bd-docs-nav"))return;var e=document.querySelector("div.bd-sidebar");let t=parseInt(sessionStorage.getItem("sidebar-scroll-top"),10);if(isNaN(t)){var n=document.querySelector(".bd-docs-nav").querySelectorAll(".active");if(n.length>0){var o=n[n.length-1],r=o.getBoundingClientRect().y-e.getBoundingClientRect().y;if(o.getBoundingClientRect().y>.5*window.innerHeight){let t=.25;e.scrollTop=r-e.clientHeight*t,console.log("[PST]: Scrolled sidebar using last active link...")}}}else e.scrollTop=t,console.log("[PST]: Scrolled sidebar using stored browser position...");window.addEventListener("beforeunload",()=>{sessionStorage.setItem("sidebar-scroll-top",e.scrollTop)})}),e(()=>{(()=>{let e=document.querySelectorAll(".search-button__kbd-shortcut");w&&e.forEach(e=>e.querySelector("kbd.kbd-shortcut__modifier").innerText="⌘")})(),window.addEventListener("keydown",e=>{let t=v();e.shiftKey||e.altKey||(w?!e.metaKey||e.ctrlKey:e.metaKey||!e.ctrlKey)||!/^k$/i.test(e.key)?document.activeElement===t&&/Escape/i.test(e.key)&&(y(),E()):(e.preventDefault(),y())},!0),document.querySelectorAll(".search-button__button").forEach(e=>{e.onclick=y});const e=document.getElementById("pst-search-dialog");e&&e.addEventListener("click",b)}),e(()=>{if(!DOCUMENTATION_OPTIONS.search_as_you_type)return;if(window.location.pathname.endsWith("/search.html"))return;if(!Search)return;E();let e=null,t="";const n=document.querySelector("#pst-search-dialog input[name=q]");n.addEventListener("keyup",()=>{const o=n.value;if(""===o)return t="",void E();o!==t&&(E(),t=o,e&&window.clearTimeout(e),e=window.setTimeout(()=>{Search.performSearch(o),document.querySelector("#search-results").classList.remove("empty"),e=null},300))})}),e(function(){const e=document.getElementById("pst-primary-sidebar"),t=document.getElementById("pst-secondary-sidebar"),n=document.getElementById("pst-primary-sidebar-modal"),o=document.getElementById("pst-secondary-sidebar-modal"),r=document.querySelector(".primary-toggle"),s=document.querySelector(".secondary-toggle"),a=(e,t)=>{Array.from(e.childNodes).forEach(e=>t.appendChild(e)),Array.from(e.classList).forEach(n=>{e.classList.remove(n),t.classList.add(n)})};[[r,n,e],[s,o,t]].forEach(([e,t,n])=>{e&&t&&n&&(e.addEventListener("click",e=>{e.preventDefault(),e.stopPropagation();const o=document.activeElement;a(n,t),t.showModal(),t.addEventListener("close",()=>{o&&o.focus&&o.focus()},{once:!0})}),t.addEventListener("click",b),t.addEventListener("keydown",e=>{"Escape"===e.key&&(e.preventDefault(),e.stopPropagation(),t.close())}),t.addEventListener("close",()=>{a(t,n)}))})}),e(function(){const e=document.querySelector("#pst-page-toc-nav");if(!e)return;const t=Array.from(e.querySelectorAll(".toc-entry")),n=Array.from(e.querySelectorAll("a"));if(0===n.length)return;let o=!1;function r(e){if(e.length>1){const t=n.find(t=>t.hash===e);t&&(o=!0,setTimeout(()=>{o=!1},1e3),s(t))}}function s(e){n.forEach(t=>{t===e?(t.classList.add("active"),t.setAttribute("aria-current","true")):(t.classList.remove("active"),t.removeAttribute("aria-current"))}),t.forEach(t=>{t.contains(e)?t.classList.add("active"):t.classList.remove("active")})}r(window.location.hash),window.addEventListener("hashchange",()=>{r(window.location.hash)}),window.addEventListener("click",e=>{const t=e.target.closest("a");t&&t.hash===window.location.hash&&t.origin===window.location.origin&&r(t.hash)});const a=new Map;let i;function c(){i&&i.disconnect();const e=document.querySelector("#pst-header").getBoundingClientRect().height;i=new IntersectionObserver(function(e){if(o)return;const t=e.filter(e=>e.isIntersecting).pop();if(!t)return;const n=t.target;s(a.get(n))},{root:null,rootMargin:`-${e}px 0px -70% 0px`,threshold:0}),Array.from(a.keys()).forEach(e=>{i.observe(e)})}n.forEach(e=>{const t=function(e){const t=e.getAttribute("href");if(!t.startsWith("#"))return;const n=t.substring(1);if(!n)return;const o=document.getElementById(n);return o.querySelector(":is(h1,h2,h3,h4,h5,h6)")||o}(e);t&&a.set(t,e)}),window.addEventListener("resize",L(c,300)),c()}),e(()=>{try{!function(){const e=document.getElementById("pst-collapse-sidebar-button"),t=document.getElementById("pst-primary-sidebar");if(!e||!t)return;const n=Array.from(t.children),o=new bootstrap.Tooltip(e,{title:e.querySelector(".pst-expand-sidebar-label").textContent,trigger:"manual",placement:"left",fallbackPlacements:["right"],offset:[0,12]}),r=()=>{"false"===e.getAttribute("aria-expanded")&&o.show()},s=()=>{o.hide()};e.addEventListener("click",()=>{if("true"===e.dataset.busy)return;e.dataset.busy="true";const o=window.matchMedia("(prefers-reduced-motion)").matches;"true"===e.getAttribute("aria-expanded")?function(o){n.forEach(e=>e.style.width=e.getBoundingClientRect().width+"px");const r=()=>{e.setAttribute("aria-expanded","false"),e.dataset.busy=!1};o?(t.classList.add("pst-squeeze"),r()):(t.addEventListener("transitionend",function e(){r(),t.removeEventListener("transitionend",e)}),t.classList.add("pst-squeeze"))}(o):function(o){s();const r=()=>{n.forEach(e=>e.style.width=null),e.setAttribute("aria-expanded","true"),e.dataset.busy=!1};o?(t.classList.remove("pst-squeeze"),r()):(t.addEventListener("transitionend",function e(){r(),t.removeEventListener("transitionend",e)}),t.classList.remove("pst-squeeze"))}(o)}),e.addEventListener("focus",r),e.addEventListener("mouseenter",r),e.addEventListener("mouseleave",s),e.addEventListener("blur",s)}()}catch(e){console.log("[PST] Error setting up collapse sidebar button"),console.error(e)}}),"complete"===document.readyState?I():window.addEventListener("load",I)})();
+//# sourceMappingURL=pydata-sphinx-theme.js.map
\ No newline at end of file
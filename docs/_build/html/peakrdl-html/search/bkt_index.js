@@ -0,0 +1 @@
+var SearchBucketIndex = [267651219];
\ No newline at end of file
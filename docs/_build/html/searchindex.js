@@ -0,0 +1 @@
+Search.setIndex({"alltitles":{"Basic cross-references":[[5,"basic-cross-references"]],"Configure":[[6,"configure"]],"Configuring":[[0,null]],"Control link text":[[5,"control-link-text"]],"Controlling where a link takes you":[[5,"controlling-where-a-link-takes-you"]],"Cross-reference settings":[[0,"cross-reference-settings"]],"Cross-references":[[1,null]],"Get Started":[[6,"get-started"]],"Inline Documentation":[[7,null]],"Inline docnode/doctree settings":[[0,"inline-docnode-doctree-settings"]],"Install":[[6,"install"]],"Introduction":[[6,null]],"Links":[[6,"links"]],"Note":[[3,null]],"PeakRDL compilation settings":[[0,"peakrdl-compilation-settings"]],"PeakRDL-HTML output settings":[[0,"peakrdl-html-output-settings"]],"Profiling settings":[[0,"profiling-settings"]],"Register map export settings":[[0,"register-map-export-settings"]],"Start cross-referencing!":[[6,"start-cross-referencing"]],"Using Cross-references":[[5,null]],"Using relative paths":[[5,"using-relative-paths"]],"Using the docnode directive":[[2,null]],"Using the doctree directive":[[3,null]],"Using the regmap directive":[[4,null]],"ctrl":[[3,"my_soc.thingamabob.ctrl"]],"my_soc":[[2,"my_soc"]],"status":[[3,"my_soc.thingamabob.status"]],"thingamabob":[[3,"my_soc.thingamabob"]]},"docnames":["configuring","cross-references","examples/docnode","examples/doctree","examples/regmap","examples/xrefs","index","inline-documentation"],"envversion":{"sphinx":66,"sphinx.domains.c":3,"sphinx.domains.changeset":1,"sphinx.domains.citation":1,"sphinx.domains.cpp":9,"sphinx.domains.index":1,"sphinx.domains.javascript":3,"sphinx.domains.math":2,"sphinx.domains.python":4,"sphinx.domains.rst":2,"sphinx.domains.std":2,"sphinx.ext.todo":2},"filenames":["configuring.rst","cross-references.rst","examples/docnode.rst","examples/doctree.rst","examples/regmap.rst","examples/xrefs.rst","index.rst","inline-documentation.rst"],"indexentries":{":link-to:: (directive option)":[[7,"directive-option-rdl-docnode-link-to",false],[7,"directive-option-rdl-doctree-link-to",false],[7,"directive-option-rdl-regmap-link-to",false]],":match: (directive option)":[[7,"directive-option-rdl-regmap-match",false]],":max-rows: (directive option)":[[7,"directive-option-rdl-regmap-max-rows",false]],":no-wrap-section:: (directive option)":[[7,"directive-option-rdl-docnode-no-wrap-section",false]],":paginate: (directive option)":[[7,"directive-option-rdl-doctree-paginate",false]],":sort: (directive option)":[[7,"directive-option-rdl-regmap-sort",false]],":wrap-section:: (directive option)":[[7,"directive-option-rdl-docnode-wrap-section",false]],"configuration value":[[0,"confval-peakrdl_cache_design",false],[0,"confval-peakrdl_cache_importers",false],[0,"confval-peakrdl_cfg_toml",false],[0,"confval-peakrdl_compile_background",false],[0,"confval-peakrdl_compile_workers",false],[0,"confval-peakrdl_default_link_to",false],[0,"confval-peakrdl_defines",false],[0,"confval-peakrdl_desc_cache_size",false],[0,"confval-peakrdl_designs",false],[0,"confval-peakrdl_doc_wrap_section",false],[0,"confval-peakrdl_export_compress",false],[0,"confval-peakrdl_export_formats",false],[0,"confval-peakrdl_generated_dir",false],[0,"confval-peakrdl_generated_pages",false],[0,"confval-peakrdl_html_background",false],[0,"confval-peakrdl_html_enable",false],[0,"confval-peakrdl_html_extra_doc_properties",false],[0,"confval-peakrdl_html_incremental",false],[0,"confval-peakrdl_html_title",false],[0,"confval-peakrdl_incdirs",false],[0,"confval-peakrdl_input_files",false],[0,"confval-peakrdl_inventories",false],[0,"confval-peakrdl_inventory",false],[0,"confval-peakrdl_inventory_timeout",false],[0,"confval-peakrdl_parameters",false],[0,"confval-peakrdl_prerender_desc",false],[0,"confval-peakrdl_profile",false],[0,"confval-peakrdl_profile_cprofile",false],[0,"confval-peakrdl_profile_memory",false],[0,"confval-peakrdl_regmap_max_rows",false],[0,"confval-peakrdl_resident_design",false],[0,"confval-peakrdl_top_component",false],[0,"confval-peakrdl_xref_cache_size",false]],"peakrdl_cache_design":[[0,"confval-peakrdl_cache_design",false]],"peakrdl_cache_importers":[[0,"confval-peakrdl_cache_importers",false]],"peakrdl_cfg_toml":[[0,"confval-peakrdl_cfg_toml",false]],"peakrdl_compile_background":[[0,"confval-peakrdl_compile_background",false]],"peakrdl_compile_workers":[[0,"confval-peakrdl_compile_workers",false]],"peakrdl_default_link_to":[[0,"confval-peakrdl_default_link_to",false]],"peakrdl_defines":[[0,"confval-peakrdl_defines",false]],"peakrdl_desc_cache_size":[[0,"confval-peakrdl_desc_cache_size",false]],"peakrdl_designs":[[0,"confval-peakrdl_designs",false]],"peakrdl_doc_wrap_section":[[0,"confval-peakrdl_doc_wrap_section",false]],"peakrdl_export_compress":[[0,"confval-peakrdl_export_compress",false]],"peakrdl_export_formats":[[0,"confval-peakrdl_export_formats",false]],"peakrdl_generated_dir":[[0,"confval-peakrdl_generated_dir",false]],"peakrdl_generated_pages":[[0,"confval-peakrdl_generated_pages",false]],"peakrdl_html_background":[[0,"confval-peakrdl_html_background",false]],"peakrdl_html_enable":[[0,"confval-peakrdl_html_enable",false]],"peakrdl_html_extra_doc_properties":[[0,"confval-peakrdl_html_extra_doc_properties",false]],"peakrdl_html_incremental":[[0,"confval-peakrdl_html_incremental",false]],"peakrdl_html_title":[[0,"confval-peakrdl_html_title",false]],"peakrdl_incdirs":[[0,"confval-peakrdl_incdirs",false]],"peakrdl_input_files":[[0,"confval-peakrdl_input_files",false]],"peakrdl_inventories":[[0,"confval-peakrdl_inventories",false]],"peakrdl_inventory":[[0,"confval-peakrdl_inventory",false]],"peakrdl_inventory_timeout":[[0,"confval-peakrdl_inventory_timeout",false]],"peakrdl_parameters":[[0,"confval-peakrdl_parameters",false]],"peakrdl_prerender_desc":[[0,"confval-peakrdl_prerender_desc",false]],"peakrdl_profile":[[0,"confval-peakrdl_profile",false]],"peakrdl_profile_cprofile":[[0,"confval-peakrdl_profile_cprofile",false]],"peakrdl_profile_memory":[[0,"confval-peakrdl_profile_memory",false]],"peakrdl_regmap_max_rows":[[0,"confval-peakrdl_regmap_max_rows",false]],"peakrdl_resident_design":[[0,"confval-peakrdl_resident_design",false]],"peakrdl_top_component":[[0,"confval-peakrdl_top_component",false]],"peakrdl_xref_cache_size":[[0,"confval-peakrdl_xref_cache_size",false]],"rdl:doc-ref (role)":[[1,"role-rdl-doc-ref",false]],"rdl:docnode (directive)":[[7,"directive-option-rdl-docnode-link-to",false],[7,"directive-option-rdl-docnode-no-wrap-section",false],[7,"directive-option-rdl-docnode-wrap-section",false],[7,"directive-rdl-docnode",false]],"rdl:doctree (directive)":[[7,"directive-option-rdl-doctree-link-to",false],[7,"directive-option-rdl-doctree-paginate",false],[7,"directive-rdl-doctree",false]],"rdl:html-ref (role)":[[1,"role-rdl-html-ref",false]],"rdl:ref (role)":[[1,"role-rdl-ref",false]],"rdl:regmap (directive)":[[7,"directive-option-rdl-regmap-link-to",false],[7,"directive-option-rdl-regmap-match",false],[7,"directive-option-rdl-regmap-max-rows",false],[7,"directive-option-rdl-regmap-sort",false],[7,"directive-rdl-regmap",false]],"rdl:relative-to (directive)":[[1,"directive-rdl-relative-to",false]]},"objects":{"":[[1,0,1,"role-rdl-doc-ref","rdl:doc-ref"],[7,1,1,"directive-rdl-docnode","rdl:docnode"],[7,2,1,"directive-option-rdl-docnode-link-to","rdl:docnode:link-to:"],[7,2,1,"directive-option-rdl-docnode-no-wrap-section","rdl:docnode:no-wrap-section:"],[7,2,1,"directive-option-rdl-docnode-wrap-section","rdl:docnode:wrap-section:"],[7,1,1,"directive-rdl-doctree","rdl:doctree"],[7,2,1,"directive-option-rdl-doctree-link-to","rdl:doctree:link-to:"],[7,2,1,"directive-option-rdl-doctree-paginate","rdl:doctree:paginate"],[1,0,1,"role-rdl-html-ref","rdl:html-ref"],[1,0,1,"role-rdl-ref","rdl:ref"],[7,1,1,"directive-rdl-regmap","rdl:regmap"],[7,2,1,"directive-option-rdl-regmap-link-to","rdl:regmap:link-to:"],[7,2,1,"directive-option-rdl-regmap-match","rdl:regmap:match"],[7,2,1,"directive-option-rdl-regmap-max-rows","rdl:regmap:max-rows"],[7,2,1,"directive-option-rdl-regmap-sort","rdl:regmap:sort"],[1,1,1,"directive-rdl-relative-to","rdl:relative-to"],[0,3,1,"-","peakrdl_cache_design"],[0,3,1,"-","peakrdl_cache_importers"],[0,3,1,"-","peakrdl_cfg_toml"],[0,3,1,"-","peakrdl_compile_background"],[0,3,1,"-","peakrdl_compile_workers"],[0,3,1,"-","peakrdl_default_link_to"],[0,3,1,"-","peakrdl_defines"],[0,3,1,"-","peakrdl_desc_cache_size"],[0,3,1,"-","peakrdl_designs"],[0,3,1,"-","peakrdl_doc_wrap_section"],[0,3,1,"-","peakrdl_export_compress"],[0,3,1,"-","peakrdl_export_formats"],[0,3,1,"-","peakrdl_generated_dir"],[0,3,1,"-","peakrdl_generated_pages"],[0,3,1,"-","peakrdl_html_background"],[0,3,1,"-","peakrdl_html_enable"],[0,3,1,"-","peakrdl_html_extra_doc_properties"],[0,3,1,"-","peakrdl_html_incremental"],[0,3,1,"-","peakrdl_html_title"],[0,3,1,"-","peakrdl_incdirs"],[0,3,1,"-","peakrdl_input_files"],[0,3,1,"-","peakrdl_inventories"],[0,3,1,"-","peakrdl_inventory"],[0,3,1,"-","peakrdl_inventory_timeout"],[0,3,1,"-","peakrdl_parameters"],[0,3,1,"-","peakrdl_prerender_desc"],[0,3,1,"-","peakrdl_profile"],[0,3,1,"-","peakrdl_profile_cprofile"],[0,3,1,"-","peakrdl_profile_memory"],[0,3,1,"-","peakrdl_regmap_max_rows"],[0,3,1,"-","peakrdl_resident_design"],[0,3,1,"-","peakrdl_top_component"],[0,3,1,"-","peakrdl_xref_cache_size"]]},"objnames":{"0":["rst","role","reStructuredText role"],"1":["rst","directive","reStructuredText directive"],"2":["rst","directive:option","reStructuredText directive-option"],"3":["std","confval","configuration value"]},"objtypes":{"0":"rst:role","1":"rst:directive","2":"rst:directive:option","3":"std:confval"},"terms":{"0x0":[2,3],"0x01000":4,"0x01004":4,"0x02000":4,"0x02004":4,"0x02008":4,"0x0200c":4,"0x1000":[2,3],"0x10000":[2,4],"0x10004":4,"0x1004":3,"0x11000":4,"0x11004":4,"0x11008":4,"0x11200":4,"0x11204":4,"0x11208":4,"0x11400":4,"0x11404":4,"0x11408":4,"0x11600":4,"0x11604":4,"0x11608":4,"0x11800":4,"0x11804":4,"0x11808":4,"0x11a00":4,"0x11a04":4,"0x11a08":4,"0x11c00":4,"0x11c04":4,"0x11c08":4,"0x11e00":4,"0x11e04":4,"0x11e08":4,"0x12000":4,"0x12004":4,"0x12008":4,"0x12200":4,"0x12204":4,"0x12208":4,"0x12400":4,"0x12404":4,"0x12408":4,"0x12600":4,"0x12604":4,"0x12608":4,"0x2000":2,"0x4":3,"0xc":3,"A":0,"At":0,"By":5,"Each":[0,7],"For":[0,2,6,7],"Here":5,"If":[0,3,5,7],"In":[0,7],"It":[0,1],"My":1,"Same":[1,7],"That":7,"The":[0,1,2,3,4,5],"Their":7,"These":[0,1],"They":0,"This":[0,1,2,3,6,7],"To":[0,2,3,4,5],"When":0,"You":0,"_build":0,"_peakrdl":0,"abl":0,"absolut":[0,1,2,3,4,7],"accept":0,"access":[0,3],"accur":0,"add":0,"addit":[0,7],"address":[0,2,3,4,7],"addrmap":[0,7],"alloc":0,"allow":1,"along":[0,7],"alongsid":0,"also":[0,7],"alway":[1,3],"amaz":5,"ancestor":7,"ani":[0,3,7],"annoy":1,"anywher":5,"array":[0,7],"asdf":0,"assign":0,"attempt":0,"autobuild":0,"automat":[0,6],"avail":0,"avoid":0,"awesom":1,"back":1,"background":0,"bar":0,"base_uri":0,"becom":[0,7],"befor":[0,1,5,7],"behavior":[0,7],"benefit":0,"better":1,"beyond":3,"bit":[0,3],"block":[0,7],"block_version_str":0,"bob":3,"bobbing_r":3,"bool":0,"bring":0,"build":[0,6,7],"builder":0,"built":[0,7],"button":[2,3,4,5],"byte":0,"cach":0,"call":0,"can":[0,1,2,5,6,7],"capabl":6,"case":[0,7],"catastroph":3,"caus":3,"cfg":0,"chang":[0,7],"channel":7,"check":[0,5,6],"child":[0,7],"choos":[0,5],"chosen":0,"click":[2,3,4,5],"collect":0,"column":0,"com":0,"command":0,"compar":0,"compat":0,"complet":[0,7],"compon":[0,3,4,5],"compress":0,"concurr":0,"conf":[0,6],"config":0,"configur":5,"consider":0,"constant":0,"contain":[0,7],"content":[0,1,2,5,6,7],"control":[0,1,3,4],"conveni":3,"copi":0,"correspond":0,"counterpart":0,"cprofil":0,"cpus":0,"creat":6,"creation":7,"critic":3,"critical_bobbing_failur":3,"critical_internal_fault":3,"crumbtrail":0,"csv":0,"ctrl":[0,4,5,6,7],"cumbersom":[1,5],"current":7,"custom":[1,5],"data":[0,4],"date":0,"declar":0,"default":[0,5,7],"defin":[0,7],"depend":[0,1],"depth":0,"deriv":7,"describ":[0,7],"descript":0,"design":[0,1],"design_nam":0,"desir":[5,6,7],"detail":5,"determin":[0,7],"devic":[5,6],"dict":0,"dictionari":0,"differ":7,"direct":[0,1,7],"directori":[0,7],"dirhtml":0,"disabl":0,"discov":0,"display":[1,5],"dma":[0,7],"dma_pkg":0,"doc":[0,1,2,3,5,6,7],"docnod":[1,7],"doctre":7,"document":[0,1,2,3,4,5,6],"doe":[0,3],"don":3,"done":0,"download":0,"dynam":[1,7],"easier":1,"either":0,"elabor":0,"element":[6,7],"emb":5,"emit":[0,7],"empti":0,"en":[3,5,6],"enabl":[0,5,6],"encabul":[2,4],"enclos":0,"end":0,"ensur":0,"entir":[0,3,5,7],"entri":0,"environ":0,"equival":0,"error":[5,6],"especi":7,"ethernet_mac":6,"ever":0,"everi":[0,4,5,7],"everyth":[1,5],"exampl":[0,2,5,6,7],"except":[1,7],"exclud":0,"exist":[1,5,7],"explicit":[0,5],"extens":[0,6],"fail":3,"failur":3,"fall":1,"fals":0,"fetch":0,"field":0,"file":[0,6,7],"finish":0,"first":[0,1,7],"flag":0,"flat":[4,7],"float":0,"flow":6,"fnmatch":[0,7],"focus":5,"follow":[0,1,2,3,4,6],"foo":0,"form":1,"format":0,"forward":0,"fot":7,"front":0,"full":[0,1,5,7],"generat":[0,6,7],"get":7,"github":[2,3,4,5],"grammet":[4,5],"guid":[1,6],"gz":0,"gzip":0,"handl":0,"head":[0,7],"header":[2,3,4,5],"heavi":0,"hide":0,"hierarch":[0,7],"hierarchi":[0,1,7],"high":2,"howev":7,"html":[1,5,6,7],"html_titl":0,"https":0,"hz":3,"ident":0,"identifi":[2,3,4],"idl":3,"ignor":0,"import":0,"incdir":0,"includ":[0,7],"independ":0,"index":0,"individu":7,"inject":0,"inlin":[1,5,6],"input":[0,6],"input_fil":0,"insert":[0,1,2,3,4,6,7],"inspect":0,"instal":0,"instanc":[0,4,7],"instanti":0,"instead":[0,7],"int":0,"integr":6,"intend":0,"interpret":0,"intersphinx":0,"intersphinx_map":0,"inv":0,"invalid":0,"inventori":0,"inventory_loc":0,"invoc":0,"ip":0,"issu":[3,6],"j":0,"json":0,"jsonl":0,"keep":0,"kept":0,"key":0,"kind":0,"larg":0,"last":[0,1,5],"latenc":0,"later":0,"layout":2,"least":0,"left":7,"less":0,"let":1,"level":[0,2],"limit":[0,7],"line":0,"link":[0,1,2,3,7],"list":[0,6,7],"live":0,"load":0,"local":[0,1],"locat":0,"long":1,"longer":0,"look":0,"lsb":0,"m":6,"machin":0,"macro":0,"main":0,"maintain":0,"make":[0,1],"manag":1,"mani":0,"manifest":0,"map":[3,6,7],"markdown":0,"match":[0,5,7],"max":[0,7],"maximum":0,"may":[0,3],"measur":4,"memori":0,"menu":[2,3,4,5],"meter":4,"million":[0,7],"mode":7,"model":[1,2,7],"modif":0,"modifi":0,"much":1,"multipl":7,"my_block":1,"my_ip":1,"my_regist":1,"my_soc":[3,4,5,6,7],"myst":7,"n":7,"n_channel":0,"name":[0,1,2,3,4],"namespac":0,"narrow":7,"need":[0,5],"never":0,"new":[0,7],"next":7,"node":[0,1,2,7],"none":0,"note":[0,6,7],"novalu":0,"number":[0,7],"observ":3,"offlin":6,"offset":[2,3],"one":[0,2,7],"onli":[0,1,5,7],"option":[0,2,3,4,5,7],"order":[0,7],"ordinari":0,"otherwis":0,"outcom":0,"output":[2,3,4,5,6,7],"overlap":0,"overrid":[0,7],"overwritten":0,"packag":0,"page":[0,2,3,4,5,6,7],"pagin":[0,7],"panic":3,"parallel":0,"paramet":0,"pars":7,"part":[0,7],"particular":5,"pass":0,"path":[0,1,2,3,6,7],"pattern":[0,7],"pdf":[6,7],"peak":0,"peakrdl":[1,6,7],"peakrdl_":0,"peakrdl_cache_design":0,"peakrdl_cache_import":0,"peakrdl_cfg_toml":0,"peakrdl_compile_background":0,"peakrdl_compile_work":0,"peakrdl_default_link_to":[0,1],"peakrdl_defin":0,"peakrdl_desc_cache_s":0,"peakrdl_design":[0,1],"peakrdl_doc_wrap_sect":[0,7],"peakrdl_export_compress":0,"peakrdl_export_format":[0,7],"peakrdl_generated_dir":[0,7],"peakrdl_generated_pag":0,"peakrdl_html_background":0,"peakrdl_html_en":0,"peakrdl_html_extra_doc_properti":0,"peakrdl_html_increment":0,"peakrdl_html_titl":0,"peakrdl_incdir":0,"peakrdl_input_fil":[0,6],"peakrdl_inventori":0,"peakrdl_inventory_timeout":0,"peakrdl_paramet":0,"peakrdl_prerender_desc":0,"peakrdl_profil":0,"peakrdl_profile_cprofil":0,"peakrdl_profile_memori":0,"peakrdl_regmap_max_row":[0,7],"peakrdl_resident_design":0,"peakrdl_top_compon":0,"peakrdl_xref_cache_s":0,"per":0,"peripher":[2,3],"phase":0,"pip":6,"plugin":0,"point":[1,5],"pool":0,"posit":0,"power":5,"prefer":[1,5,7],"prefix":[0,1],"preprocesor":0,"preview":0,"previous":[0,7],"print":0,"process":[0,6],"produc":[2,3,4],"prof":0,"program":1,"project":[0,6,7],"properti":0,"prose":1,"provid":[0,6,7],"pstat":0,"publish":[0,7],"py":[0,6],"pypi":6,"python":0,"python3":6,"r":3,"rate":3,"rather":0,"rdl":[0,1,2,3,4,5,6,7],"re":0,"read":[0,3],"readabl":0,"realli":6,"rebuild":0,"record":[0,7],"recurs":7,"ref":[0,1,5,6],"refer":[2,6,7],"referenc":[0,1,7],"reg":0,"regardless":[0,1],"regener":0,"regfil":[0,7],"regist":[1,2,3,4,5,6,7],"regmap":[0,7],"relat":[0,1],"releas":6,"reli":7,"rememb":0,"remov":0,"render":0,"repeat":0,"report":0,"repositori":6,"requir":0,"reset":[0,3],"resid":0,"resolut":0,"resolv":[0,3],"rest":0,"restart":0,"restructuredtext":[6,7],"result":[1,5,6],"reus":0,"rewritten":0,"role":[1,5],"root":0,"row":[0,7],"rule":0,"run":0,"rw":3,"s":[0,2,3,4,5,6],"scalarreload":4,"scan":7,"scope":1,"script":0,"search":[0,1],"second":0,"section":[0,7],"see":[0,7],"segment":[1,5],"select":0,"separ":[0,7],"sequenc":6,"set":[1,3,5,6,7],"sever":[0,1,5,7],"shall":0,"share":0,"show":[0,1,2,3,4,5],"signific":0,"similar":[0,7],"sinc":[0,7],"singl":2,"situat":3,"size":0,"skip":0,"slow":0,"soc":[0,2],"soft":3,"softwar":[0,6],"soon":0,"sort":7,"sourc":[0,2,3,4,5,6],"specif":[1,7],"specifi":[0,1,5,7],"sphinx":[0,6,7],"sphinx_peakrdl":6,"split":7,"srst":3,"start":0,"startup":6,"statist":0,"status":[4,5,6],"still":7,"str":0,"stride":7,"stub":0,"style":0,"subdirectori":0,"subsequ":0,"success":0,"suffix":[0,7],"summari":0,"support":0,"suppress":7,"syntax":[0,7],"system":4,"systemrdl":0,"t":3,"tabl":[0,4,7],"taret":7,"target":[0,3,4,5],"tech":2,"temporarili":1,"text":[0,1],"thingamabob":[2,4,5,6,7],"thingamabob_top":6,"three":2,"time":[0,5],"timeout":0,"titl":0,"toctre":[0,7],"togeth":7,"toml":0,"tool":0,"top":[0,2],"top_compon":0,"total":7,"trace":0,"tracemalloc":0,"tracker":6,"tri":3,"true":0,"truncat":[0,1,5],"tupl":0,"turbo":2,"turboencabul":[2,4,5,6],"turn":3,"type":[0,5],"uart":[0,2,4],"unchang":0,"unindex":0,"uniqu":0,"unless":0,"unrol":7,"unset":0,"unus":0,"upgrad":0,"uri":0,"url":0,"use":[0,1,6,7],"user":0,"v1":0,"valu":0,"veri":[1,2],"verilog":0,"version":0,"view":[2,3,4,5],"w":3,"wait":0,"walk":0,"wall":0,"want":[0,6,7],"warn":[0,7],"way":[1,3,5],"well":0,"whether":[0,1],"whi":7,"whose":[0,7],"width":0,"will":[0,1,5,7],"within":[0,6,7],"without":[0,5],"work":0,"worker":0,"worthwhil":0,"wrap":[0,7],"write":[0,6],"written":0},"titles":["Configuring","Cross-references","Using the docnode directive","Using the doctree directive","Using the regmap directive","Using Cross-references","Introduction","Inline Documentation"],"titleterms":{"basic":5,"compil":0,"configur":[0,6],"control":5,"cross":[0,1,5,6],"ctrl":3,"direct":[2,3,4],"docnod":[0,2],"doctre":[0,3],"document":7,"export":0,"get":6,"html":0,"inlin":[0,7],"instal":6,"introduct":6,"link":[5,6],"map":0,"my_soc":2,"note":3,"output":0,"path":5,"peakrdl":0,"profil":0,"refer":[0,1,5],"referenc":6,"regist":0,"regmap":4,"relat":5,"set":0,"start":6,"status":3,"take":5,"text":5,"thingamabob":3,"use":[2,3,4,5]}})
\ No newline at end of file
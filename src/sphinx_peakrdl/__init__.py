@@ -4,7 +4,14 @@ from .__about__ import __version__
 from . import config
 from . import build
 from . import html
+from . import export
+from . import incremental
+from . import inventory
+from . import pages
+from . import profiling
 from .domain import PeakRDLDomain
+from .markdown import render
+from .markdown import prerender
 
 if TYPE_CHECKING:
     from sphinx.application import Sphinx
@@ -14,8 +21,21 @@ def setup(app: "Sphinx") -> "ExtensionMetadata":
     config.setup_config(app)
 
     app.connect("config-inited", config.elaborate_config_callback)
-    app.connect("env-before-read-docs", build.compile_input_callback)
+    app.connect("config-inited", build.start_compile_callback)
+    app.connect("config-inited", profiling.config_inited_callback)
+    app.connect("builder-inited", build.compile_input_callback)
+    app.connect("builder-inited", pages.generate_pages_callback)
+    app.connect("builder-inited", inventory.load_inventories_callback)
+    app.connect("env-get-outdated", incremental.get_outdated_callback)
+    app.connect("env-get-outdated", pages.get_outdated_callback)
+    app.connect("source-read", pages.note_doc_source_callback)
+    app.connect("env-before-read-docs", html.start_html_export_callback)
+    app.connect("env-before-read-docs", prerender.prerender_descs_callback)
     app.connect("html-collect-pages", html.write_html_callback)
+    app.connect("html-collect-pages", export.write_export_callback)
+    app.connect("build-finished", inventory.write_inventory_callback)
+    app.connect("build-finished", render.report_cache_stats_callback)
+    app.connect("build-finished", profiling.build_finished_callback)
 
     app.add_domain(PeakRDLDomain)
 
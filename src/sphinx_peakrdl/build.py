@@ -1,52 +1,304 @@
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional, Dict, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+import os
+import argparse
 
 from sphinx.util import logging
-from systemrdl import RDLCompiler
-from systemrdl.messages import RDLCompileError
-from peakrdl.process_input import load_file
 
 from . import design_state as DS
-from .utils import status_iterator, progress_message
+from . import cache
+from . import profiling
+from .designs import DesignSpec, Design, get_design_specs, add_design, clear_designs
+from .importers import ImporterSet, get_input_extensions
+from .utils import status_iterator, progress_message, LRUCache
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
     from sphinx.application import Sphinx
-    from sphinx.environment import BuildEnvironment
+    from sphinx.config import Config
+    from systemrdl.node import RootNode
+    from peakrdl.plugins.importer import ImporterPlugin
 
 log = logging.getLogger("config")
 
-def compile_input_callback(app: "Sphinx", env: "BuildEnvironment", docnames: List[str]) -> None:
+
+class DesignCompileError(Exception):
+    """
+    Compiling a design failed.
+    Compiler messages were already printed.
     """
-    Called by the 'env-before-read-docs' event.
+    def __init__(self, design_name: Optional[str], file: Optional[str]) -> None:
+        super().__init__(design_name, file)
+        self.design_name = design_name
+
+        # Input file that failed, or None if elaboration failed
+        self.file = file
+
 
-    Compile/import and elaborate all input
+CompileResult = Tuple["RootNode", List[str], cache.PreCompileSnapshot]
+
+
+def compile_design(spec: DesignSpec, importers: List["ImporterPlugin"], argparse_options: argparse.Namespace, show_progress: bool = False) -> CompileResult:
     """
-    rdlc = RDLCompiler()
+    Compile/import and elaborate a design.
 
-    files = app.config.peakrdl_input_files
-    if not files:
-        return
-    for file in status_iterator(files, "Reading PeakRDL sources...", length=len(files)):
+    Returns the elaborated root node, a list of all files that were included
+    while compiling, and the state of the sources before compiling started.
+    """
+    # The compiler is expensive to import, and not needed if the design is
+    # loaded from the cache
+    # pylint: disable=import-outside-toplevel
+    from systemrdl.messages import RDLCompileError
+    from peakrdl.process_input import load_file
+    from .compiler import TrackingRDLCompiler
+
+    pre_snapshot = cache.PreCompileSnapshot(spec.input_files, spec.incdirs)
+    rdlc = TrackingRDLCompiler()
+    files: Any = spec.input_files
+    if show_progress:
+        files = status_iterator(files, "Reading PeakRDL sources...", length=len(files))
+    for file in files:
         try:
-            load_file(
-                rdlc,
-                DS.importers,
-                file,
-                app.config.peakrdl_defines,
-                app.config.peakrdl_incdirs,
-                DS.argparse_options,
-            )
+            with profiling.phase(f"load_file:{file}"):
+                load_file(
+                    rdlc,
+                    importers,
+                    file,
+                    spec.defines,
+                    spec.incdirs,
+                    argparse_options,
+                )
         except RDLCompileError as e:
-            log.error("Failed when reading file: %s", file)
-            raise e
+            raise DesignCompileError(spec.name, file) from e
 
-    with progress_message("Elaborating PeakRDL design"):
-        try:
+    if show_progress:
+        elaborate_progress: Any = progress_message("Elaborating PeakRDL design")
+    else:
+        elaborate_progress = nullcontext()
+    try:
+        with elaborate_progress, profiling.phase("elaborate"):
             root = rdlc.elaborate(
-                top_def_name=app.config.peakrdl_top_component,
+                top_def_name=spec.top_component,
                 inst_name=None,
-                parameters=app.config.peakrdl_parameters,
+                parameters=spec.parameters,
             )
-            DS.root_node = root
-        except RDLCompileError as e:
-            log.error("Failed to elaborate PeakRDL design")
-            raise e
+    except RDLCompileError as e:
+        raise DesignCompileError(spec.name, None) from e
+
+    return root, sorted(rdlc.included_files), pre_snapshot
+
+
+def _compile_design_worker(spec: DesignSpec, importer_set: ImporterSet) -> CompileResult:
+    """
+    Entry point of worker processes that compile designs concurrently
+    """
+    importers = importer_set.load(get_input_extensions([spec]))
+    return compile_design(spec, importers, importer_set.get_argparse_options())
+
+
+def _log_compile_error(e: DesignCompileError) -> None:
+    if e.design_name is None:
+        design_str = ""
+    else:
+        design_str = f" (design: {e.design_name})"
+
+    if e.file is not None:
+        log.error("Failed when reading file: %s%s", e.file, design_str)
+    else:
+        log.error("Failed to elaborate PeakRDL design%s", design_str)
+
+
+def _join_compile_futures(futures: Dict[Optional[str], "Future"], results: Dict[Optional[str], CompileResult]) -> None:
+    from systemrdl.messages import RDLCompileError # pylint: disable=import-outside-toplevel
+    for design_name, future in futures.items():
+        try:
+            results[design_name] = future.result()
+        except DesignCompileError as e:
+            _log_compile_error(e)
+            raise RDLCompileError("Failed to compile PeakRDL design") from None
+
+
+def _get_max_workers(app: "Sphinx", n_designs: int) -> int:
+    max_workers = app.config.peakrdl_compile_workers or os.cpu_count() or 1
+    return min(max_workers, n_designs)
+
+
+def _get_resident_design(spec: DesignSpec, settings_key: str) -> Optional[Design]:
+    """
+    Get a design that was kept from a previous build in this process, if its
+    sources did not change since.
+    """
+    resident = DS.resident_designs.get(spec.name)
+    if resident is None:
+        return None
+    resident_key, snapshot, design = resident
+    if resident_key != settings_key or not snapshot.is_current():
+        return None
+    design.spec = spec
+    return design
+
+
+def start_compile_callback(app: "Sphinx", cfg: "Config") -> None:
+    """
+    Called by the 'config-inited' event, after the PeakRDL config was loaded.
+
+    If enabled, start compiling designs in worker processes so that it
+    overlaps with Sphinx loading its environment.
+    Results are collected in compile_input_callback()
+    """
+    if not cfg.peakrdl_compile_background:
+        return
+
+    specs = []
+    for spec in get_design_specs(cfg):
+        settings_key = cache.get_settings_key(spec)
+        if cfg.peakrdl_resident_design and _get_resident_design(spec, settings_key) is not None:
+            continue
+        if cfg.peakrdl_cache_design and cache.is_design_cached(app, spec.name, settings_key):
+            # Loading from the cache is faster
+            continue
+        specs.append(spec)
+
+    if not specs:
+        return
+
+    DS.compile_executor = ProcessPoolExecutor(max_workers=_get_max_workers(app, len(specs)))
+    for spec in specs:
+        DS.compile_futures[spec.name] = DS.compile_executor.submit(
+            _compile_design_worker, spec, DS.importer_set
+        )
+
+
+def compile_input_callback(app: "Sphinx") -> None:
+    """
+    Called by the 'builder-inited' event.
+
+    Compile/import and elaborate all input.
+    This is done before Sphinx discovers its source documents, since some of
+    them are generated from the design.
+
+    If several designs need to be compiled, they are compiled concurrently
+    in worker processes.
+    """
+    clear_designs()
+    DS.node_hashes = {}
+    DS.reg_content_cache = {}
+    DS.ancestor_prefix_cache = {}
+    DS.unsettled_sources = set()
+    DS.xref_target_cache = LRUCache(app.config.peakrdl_xref_cache_size)
+    DS.xref_uri_cache = LRUCache(app.config.peakrdl_xref_cache_size)
+
+    # Designs that are already being compiled in the background
+    background_futures = DS.compile_futures
+    background_executor = DS.compile_executor
+    DS.compile_futures = {}
+    DS.compile_executor = None
+
+    specs = get_design_specs(app.config)
+    if not specs:
+        return
+
+    # Load designs that were cached
+    settings_keys = {}
+    snapshots: Dict[Optional[str], cache.SourceSnapshot] = {}
+    pending: List[DesignSpec] = []
+    loaded: Dict[Optional[str], Design] = {}
+    for spec in specs:
+        settings_keys[spec.name] = cache.get_settings_key(spec)
+        if spec.name in background_futures:
+            pending.append(spec)
+            continue
+        if app.config.peakrdl_resident_design:
+            design = _get_resident_design(spec, settings_keys[spec.name])
+            if design is not None:
+                if spec.name is None:
+                    log.info("Using resident PeakRDL design")
+                else:
+                    log.info("Using resident PeakRDL design: %s", spec.name)
+                loaded[spec.name] = design
+                snapshots[spec.name] = DS.resident_designs[spec.name][1]
+                continue
+        if app.config.peakrdl_cache_design:
+            with profiling.phase("design_cache_load"):
+                cached = cache.load_design(app, spec.name, settings_keys[spec.name])
+            if cached is not None:
+                if spec.name is None:
+                    log.info("Using cached PeakRDL design")
+                else:
+                    log.info("Using cached PeakRDL design: %s", spec.name)
+                root, fingerprint, snapshots[spec.name] = cached
+                loaded[spec.name] = Design(spec, root, fingerprint)
+                continue
+        pending.append(spec)
+
+    # Compile the rest
+    results: Dict[Optional[str], CompileResult] = {}
+    if background_executor is not None:
+        with progress_message("Waiting for PeakRDL design compilation"), \
+                profiling.phase("compile_wait"):
+            try:
+                _join_compile_futures(background_futures, results)
+            finally:
+                background_executor.shutdown()
+    remaining = [spec for spec in pending if spec.name not in results]
+
+    if len(remaining) == 1:
+        spec = remaining[0]
+        try:
+            results[spec.name] = compile_design(
+                spec, DS.importers, DS.argparse_options, show_progress=True
+            )
+        except DesignCompileError as e:
+            _log_compile_error(e)
+            raise e.__cause__ # type: ignore
+    elif remaining:
+        with progress_message(f"Compiling {len(remaining)} PeakRDL designs"), \
+                profiling.phase("compile_designs"), \
+                ProcessPoolExecutor(max_workers=_get_max_workers(app, len(remaining))) as executor:
+            futures = {
+                spec.name: executor.submit(_compile_design_worker, spec, DS.importer_set)
+                for spec in remaining
+            }
+            _join_compile_futures(futures, results)
+
+    for spec in pending:
+        root, included_files, pre_snapshot = results[spec.name]
+        source_files = list(spec.input_files) + included_files
+        snapshot = cache.SourceSnapshot(source_files, spec.incdirs)
+        source_digests = cache.get_source_digests(source_files)
+        if not pre_snapshot.is_consistent(snapshot, source_digests):
+            # The design may not match the sources as they are now. Don't
+            # remember it, so that the next build compiles it again
+            if spec.name is None:
+                log.info("PeakRDL sources changed while compiling. Not caching the design")
+            else:
+                log.info("PeakRDL sources changed while compiling. Not caching the design: %s", spec.name)
+            loaded[spec.name] = Design(spec, root, None)
+            DS.unsettled_sources.update(os.path.abspath(path) for path in source_files)
+            continue
+
+        snapshots[spec.name] = snapshot
+        fingerprint = cache.get_design_fingerprint(settings_keys[spec.name], source_digests)
+        loaded[spec.name] = Design(spec, root, fingerprint)
+
+        if app.config.peakrdl_cache_design:
+            with profiling.phase("design_cache_store"):
+                cache.store_design(
+                    app, spec.name, settings_keys[spec.name],
+                    source_digests, snapshots[spec.name], root
+                )
+
+    # Register designs in the order they were configured
+    for spec in specs:
+        add_design(loaded[spec.name])
+
+    if app.config.peakrdl_resident_design:
+        # Keep designs for the next build in this process
+        DS.resident_designs = {
+            spec.name: (settings_keys[spec.name], snapshots[spec.name], loaded[spec.name])
+            for spec in specs
+            if spec.name in snapshots
+        }
+    else:
+        DS.resident_designs = {}
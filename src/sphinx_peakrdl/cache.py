@@ -0,0 +1,323 @@
+"""
+Persistent on-disk cache of the elaborated design.
+
+Compiling and elaborating a large design can dominate an incremental Sphinx
+build, even when none of the RDL sources changed. The elaborated RootNode is
+pickled into the Sphinx doctree directory, along with a fingerprint of
+everything that went into producing it.
+"""
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Iterable, Any, BinaryIO, List
+import os
+import time
+import json
+import pickle
+import shutil
+import hashlib
+
+from peakrdl.__about__ import __version__ as peakrdl_version
+from sphinx.util import logging
+
+from . import design_state as DS
+
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from systemrdl.node import RootNode
+    from .designs import DesignSpec
+
+log = logging.getLogger(__name__)
+
+CACHE_DIRNAME = "peakrdl"
+DESIGN_CACHE_FILENAME = "design.pickle"
+
+# Bump if the layout of cached designs changes
+CACHE_FORMAT_VERSION = 2
+
+# Errors raised when an object cannot be pickled. For example, AttributeError
+# is raised for local objects, and RecursionError for very deep hierarchies
+PICKLE_ERRORS = (pickle.PicklingError, RecursionError, AttributeError, TypeError)
+
+
+def get_cache_dir(app: "Sphinx") -> str:
+    return os.path.join(app.doctreedir, CACHE_DIRNAME)
+
+
+def get_design_cache_path(app: "Sphinx", design_name: Optional[str]) -> str:
+    if design_name is None:
+        filename = DESIGN_CACHE_FILENAME
+    else:
+        filename = f"design-{design_name}.pickle"
+    return os.path.join(get_cache_dir(app), filename)
+
+
+def file_digest(path: str) -> Optional[str]:
+    """
+    Get the digest of a file's contents.
+    Returns None if the file no longer exists.
+    """
+    h = hashlib.sha1()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                h.update(chunk)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+def get_source_digests(paths: Iterable[str]) -> Dict[str, Optional[str]]:
+    return {path: file_digest(path) for path in paths}
+
+
+def get_file_stats(paths: Iterable[str]) -> Dict[str, Optional[Tuple[int, int]]]:
+    """
+    Get the modification time and size of files.
+    Missing files are None.
+    """
+    stats: Dict[str, Optional[Tuple[int, int]]] = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            stats[path] = None
+        else:
+            stats[path] = (st.st_mtime_ns, st.st_size)
+    return stats
+
+
+def get_dir_listings(paths: Iterable[str]) -> Dict[str, Optional[List[str]]]:
+    """
+    Get the names of the entries in directories.
+    Missing directories are None.
+    """
+    listings: Dict[str, Optional[List[str]]] = {}
+    for path in paths:
+        try:
+            listings[path] = sorted(os.listdir(path))
+        except OSError:
+            listings[path] = None
+    return listings
+
+
+class SourceSnapshot:
+    """
+    Snapshot of a design's sources that can be checked for changes without
+    reading any of them.
+
+    Files are compared by modification time and size. Include directories are
+    compared by their list of entries, since adding or removing a file can
+    change which file an include resolves to. Comparing listings rather than
+    modification times ignores editors that save files by renaming a
+    temporary file.
+    """
+    def __init__(self, files: Iterable[str], incdirs: Iterable[str]) -> None:
+        self.file_stats = get_file_stats(files)
+        self.incdir_listings = get_dir_listings(incdirs)
+
+    def files_changed(self) -> bool:
+        return get_file_stats(self.file_stats.keys()) != self.file_stats
+
+    def incdirs_changed(self) -> bool:
+        return get_dir_listings(self.incdir_listings.keys()) != self.incdir_listings
+
+    def is_current(self) -> bool:
+        return not self.incdirs_changed() and not self.files_changed()
+
+
+class PreCompileSnapshot:
+    """
+    State of a design's sources just before it is compiled.
+
+    Files saved while the design compiles, for example by an editor while
+    sphinx-autobuild rebuilds, may or may not be part of the elaborated
+    design. Such a design cannot be identified by the digests of its sources,
+    so it shall not be cached.
+
+    Which files are included is only known once compiling is done. Included
+    files are instead checked by their modification time.
+    """
+    def __init__(self, input_files: Iterable[str], incdirs: Iterable[str]) -> None:
+        self.started_ns = time.time_ns()
+        self.input_digests = get_source_digests(input_files)
+        self.incdir_listings = get_dir_listings(incdirs)
+
+    def is_consistent(self, snapshot: SourceSnapshot, source_digests: Dict[str, Optional[str]]) -> bool:
+        """
+        Check that the sources, as they were after compiling, did not change
+        since compiling started
+        """
+        if snapshot.incdir_listings != self.incdir_listings:
+            return False
+        for path, digest in self.input_digests.items():
+            if source_digests.get(path) != digest:
+                return False
+        for path, stat in snapshot.file_stats.items():
+            if path in self.input_digests:
+                continue
+            if stat is None or stat[0] >= self.started_ns:
+                return False
+        return True
+
+
+def get_systemrdl_version() -> str:
+    try:
+        from importlib.metadata import version # pylint: disable=import-outside-toplevel
+    except ImportError:
+        # Python 3.7. Fall back to importing the compiler itself
+        from systemrdl.__about__ import __version__ # pylint: disable=import-outside-toplevel
+        return __version__
+    return version("systemrdl-compiler")
+
+
+def get_settings_key(spec: "DesignSpec") -> str:
+    """
+    Digest of all settings, other than the source file contents, that affect
+    the elaborated design.
+    """
+    if DS.importer_set.cfg_path:
+        cfg_toml_digest = file_digest(DS.importer_set.cfg_path)
+    else:
+        cfg_toml_digest = None
+
+    settings = {
+        "format_version": CACHE_FORMAT_VERSION,
+        "input_files": spec.input_files,
+        "incdirs": spec.incdirs,
+        "defines": spec.defines,
+        "parameters": spec.parameters,
+        "top_component": spec.top_component,
+        "cfg_toml": [DS.importer_set.cfg_path, cfg_toml_digest],
+        "systemrdl_version": get_systemrdl_version(),
+        "peakrdl_version": peakrdl_version,
+        "importers": [
+            [importer.name, importer.dist_name, importer.dist_version]
+            for importer in DS.importers
+        ],
+    }
+    s = json.dumps(settings, sort_keys=True, default=repr)
+    return hashlib.sha1(s.encode("utf-8")).hexdigest()
+
+
+def get_design_fingerprint(settings_key: str, source_digests: Dict[str, Optional[str]]) -> str:
+    """
+    Single digest that identifies an elaborated design
+    """
+    h = hashlib.sha1(settings_key.encode("utf-8"))
+    for path, digest in sorted(source_digests.items()):
+        h.update(f"{path}:{digest}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _read_header(f: BinaryIO, settings_key: str) -> Optional[Tuple[Dict[str, Any], bool]]:
+    """
+    Read the header of a cached design.
+    Returns (header, refreshed), or None if the cache is stale. If sources
+    were merely touched, the header's snapshot is refreshed.
+
+    The header is pickled separately so that a stale cache can be rejected
+    without unpickling the entire design
+    """
+    header = pickle.load(f)
+    if header["settings_key"] != settings_key:
+        return None
+
+    snapshot: SourceSnapshot = header["snapshot"]
+    if snapshot.incdirs_changed():
+        return None
+    if snapshot.files_changed():
+        # Sources were modified, or merely touched
+        if get_source_digests(header["source_digests"].keys()) != header["source_digests"]:
+            return None
+        header["snapshot"] = SourceSnapshot(snapshot.file_stats.keys(), snapshot.incdir_listings.keys())
+        return header, True
+    return header, False
+
+
+def _rewrite_header(path: str, header: Dict[str, Any], design_offset: int) -> None:
+    """
+    Replace the header of a cached design, so that sources that were merely
+    touched are not digested again by every build.
+
+    The pickled design is copied as-is, without unpickling it
+    """
+    tmp_path = path + ".tmp"
+    try:
+        with open(path, "rb") as src, open(tmp_path, "wb") as dst:
+            pickle.dump(header, dst, pickle.HIGHEST_PROTOCOL)
+            src.seek(design_offset)
+            shutil.copyfileobj(src, dst)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        log.warning("Unable to update PeakRDL design cache: %s", e)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def is_design_cached(app: "Sphinx", design_name: Optional[str], settings_key: str) -> bool:
+    """
+    Check whether an up-to-date cache of a design exists, without loading it
+    """
+    path = get_design_cache_path(app, design_name)
+    try:
+        with open(path, "rb") as f:
+            result = _read_header(f, settings_key)
+            design_offset = f.tell()
+    except Exception: # pylint: disable=broad-exception-caught
+        return False
+
+    if result is None:
+        return False
+    header, refreshed = result
+    if refreshed:
+        _rewrite_header(path, header, design_offset)
+    return True
+
+
+def load_design(app: "Sphinx", design_name: Optional[str], settings_key: str) -> Optional[Tuple["RootNode", str, SourceSnapshot]]:
+    """
+    Load a previously elaborated design from the cache.
+
+    Returns (root_node, design_fingerprint, source_snapshot), or None if the
+    cache is missing or stale.
+    """
+    path = get_design_cache_path(app, design_name)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "rb") as f:
+            result = _read_header(f, settings_key)
+            if result is None:
+                return None
+            header, refreshed = result
+            design_offset = f.tell()
+            root = pickle.load(f)
+    except Exception as e: # pylint: disable=broad-exception-caught
+        log.warning("Ignoring unreadable PeakRDL design cache: %s", e)
+        return None
+
+    if refreshed:
+        _rewrite_header(path, header, design_offset)
+    return root, get_design_fingerprint(settings_key, header["source_digests"]), header["snapshot"]
+
+
+def store_design(app: "Sphinx", design_name: Optional[str], settings_key: str, source_digests: Dict[str, Optional[str]], snapshot: SourceSnapshot, root: "RootNode") -> None:
+    os.makedirs(get_cache_dir(app), exist_ok=True)
+    path = get_design_cache_path(app, design_name)
+    tmp_path = path + ".tmp"
+
+    header = {
+        "settings_key": settings_key,
+        "source_digests": source_digests,
+        "snapshot": snapshot,
+    }
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(header, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(root, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except PICKLE_ERRORS as e:
+        log.warning("Unable to cache PeakRDL design: %s", e)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
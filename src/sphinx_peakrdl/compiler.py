@@ -0,0 +1,27 @@
+"""
+SystemRDL compiler.
+
+Importing the compiler is expensive, so this module is only imported once a
+design is actually compiled.
+"""
+from typing import TYPE_CHECKING, List, Set, Optional, Dict
+
+from systemrdl import RDLCompiler
+
+if TYPE_CHECKING:
+    from systemrdl.compiler import FileInfo
+
+
+class TrackingRDLCompiler(RDLCompiler):
+    """
+    RDLCompiler that keeps track of all the files that were included while
+    compiling, so that they can be fingerprinted.
+    """
+    def __init__(self, **kwargs) -> None: # type: ignore
+        super().__init__(**kwargs)
+        self.included_files: Set[str] = set()
+
+    def compile_file(self, path: str, incl_search_paths: Optional[List[str]] = None, defines: Optional[Dict[str, str]] = None) -> "FileInfo":
+        file_info = super().compile_file(path, incl_search_paths, defines)
+        self.included_files.update(file_info.included_files)
+        return file_info
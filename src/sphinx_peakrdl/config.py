@@ -1,12 +1,14 @@
 from typing import TYPE_CHECKING
 import logging
-import argparse
 
 from sphinx.util import logging
-from peakrdl.config.loader import load_cfg
-from peakrdl.plugins.importer import get_importer_plugins
 
 from . import design_state as DS
+from .markdown.render import RENDER_CACHE
+from .pages import validate_page_rules
+from .designs import normalize_defines, validate_design_config, get_design_specs
+from .importers import get_importer_set, get_input_extensions
+from .export import EXPORT_FORMATS
 
 if TYPE_CHECKING:
     from sphinx.application import Sphinx
@@ -22,39 +24,62 @@ def setup_config(app: "Sphinx") -> None:
     app.add_config_value("peakrdl_parameters", {}, "env", [dict])
     app.add_config_value("peakrdl_defines", {}, "env", [dict])
     app.add_config_value("peakrdl_top_component", None, "env", [str])
+    app.add_config_value("peakrdl_designs", {}, "env", [dict])
+    app.add_config_value("peakrdl_compile_workers", None, "", [int])
+    app.add_config_value("peakrdl_compile_background", False, "", [bool])
+    app.add_config_value("peakrdl_cache_design", True, "", [bool])
+    app.add_config_value("peakrdl_cache_importers", True, "", [bool])
+    app.add_config_value("peakrdl_resident_design", False, "", [bool])
 
     app.add_config_value("peakrdl_default_link_to", "html", "env", [str])
+    app.add_config_value("peakrdl_xref_cache_size", 4096, "", [int])
+    app.add_config_value("peakrdl_inventory", True, "", [bool])
+    app.add_config_value("peakrdl_inventories", {}, "env", [dict])
+    app.add_config_value("peakrdl_inventory_timeout", 30, "", [int, float])
 
     # Control PeakRDL-html output
     app.add_config_value("peakrdl_html_enable", True, "env", [bool])
     app.add_config_value("peakrdl_html_title", None, "env", [str])
     app.add_config_value("peakrdl_html_extra_doc_properties", [], "env", [list])
+    app.add_config_value("peakrdl_html_background", False, "", [bool])
+    app.add_config_value("peakrdl_html_incremental", True, "", [bool])
+
+    # Register map export
+    app.add_config_value("peakrdl_export_formats", [], "", [list])
+    app.add_config_value("peakrdl_export_compress", False, "", [bool])
 
     # Inline doc settings
     app.add_config_value("peakrdl_doc_wrap_section", True, "env", [bool])
+    app.add_config_value("peakrdl_desc_cache_size", 1024, "", [int])
+    app.add_config_value("peakrdl_prerender_desc", False, "", [bool])
+    app.add_config_value("peakrdl_regmap_max_rows", 5000, "env", [int])
+    app.add_config_value("peakrdl_generated_dir", "_peakrdl", "env", [str])
+    app.add_config_value("peakrdl_generated_pages", {}, "env", [dict])
+
+    # Build profiling
+    app.add_config_value("peakrdl_profile", None, "", [str])
+    app.add_config_value("peakrdl_profile_cprofile", False, "", [bool])
+    app.add_config_value("peakrdl_profile_memory", False, "", [bool])
 
 
 def elaborate_config_callback(app: "Sphinx", cfg: "Config") -> None:
-    # Load PeakRDL configuration
-    DS.peakrdl_cfg = load_cfg(cfg.peakrdl_cfg_toml)
-    DS.importers = get_importer_plugins(DS.peakrdl_cfg)
-
-    # Make a dummy argparse options namespace to satisfy importer plugins
-    arg_parser = argparse.ArgumentParser()
-    for importer in DS.importers:
-        importer_arg_group = arg_parser.add_argument_group(importer.name)
-        importer.add_importer_arguments(importer_arg_group)
-    DS.argparse_options = arg_parser.parse_args([])
-
-    # transform defines of key:None --> key:""
-    new_defines = {}
-    for key, value in cfg.peakrdl_defines.items():
-        if value is None:
-            new_defines[key] = ""
-        else:
-            new_defines[key] = value
-    cfg.peakrdl_defines = new_defines
+    cfg.peakrdl_defines = normalize_defines(cfg.peakrdl_defines)
+
+    RENDER_CACHE.max_size = cfg.peakrdl_desc_cache_size
 
     # Validate
     if cfg.peakrdl_default_link_to not in {"doc", "html"}:
         raise ValueError("Config 'peakrdl_default_link_to' shall be either 'doc' or 'html")
+    validate_design_config(cfg.peakrdl_designs)
+    validate_page_rules(cfg.peakrdl_generated_pages)
+    for fmt in cfg.peakrdl_export_formats:
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Config 'peakrdl_export_formats' contains unknown format '{fmt}'. Shall be one of: {', '.join(EXPORT_FORMATS)}")
+    for name, value in cfg.peakrdl_inventories.items():
+        if not (isinstance(value, (tuple, list)) and len(value) == 2):
+            raise ValueError(f"Config 'peakrdl_inventories' entry '{name}' shall be a (base_uri, inventory_location) tuple")
+
+    # Load PeakRDL configuration and the importers needed by the input files
+    DS.importer_set = get_importer_set(app, cfg.peakrdl_cfg_toml, cfg.peakrdl_cache_importers)
+    DS.importers = DS.importer_set.load(get_input_extensions(get_design_specs(cfg)))
+    DS.argparse_options = DS.importer_set.get_argparse_options()
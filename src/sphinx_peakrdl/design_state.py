@@ -6,24 +6,84 @@ for this data to be pickled and retained across builds.
 Hate global variables? Me too, but I think we'll be fine this one time.
 """
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Dict, Set, Tuple, Any
 
 if TYPE_CHECKING:
     from argparse import Namespace
+    from concurrent.futures import Executor, Future
+
+    from docutils import nodes
 
-    from peakrdl.config.loader import AppConfig
     from peakrdl.plugins.importer import ImporterPlugin
-    from systemrdl.node import AddrmapNode
+
+    from .cache import SourceSnapshot
+    from .designs import Design
+    from .importers import ImporterSet
+    from .inventory import Inventory
+    from .utils import LRUCache
 
 
-# PeakRDL Config TOML data
-peakrdl_cfg: "AppConfig"
+# All available importer plugins, and the PeakRDL TOML they were loaded from
+importer_set: "ImporterSet"
 
-# List of importer plugins
+# Importer plugins needed by the input files
 importers: List["ImporterPlugin"]
 
 # Dummy argparse namespace preloaded with importer args
 # This is a hack to satisfy calling requirements of importer plugins
 argparse_options: "Namespace"
 
-root_node: Optional["AddrmapNode"] = None
+# Elaborated designs
+# The design from 'peakrdl_input_files' has no name (None)
+designs: Dict[Optional[str], "Design"] = {}
+
+# Designs kept across builds in the same process, if enabled
+# design name --> (settings key, source snapshot, design)
+resident_designs: Dict[Optional[str], Tuple[str, "SourceSnapshot", "Design"]] = {}
+
+# Names of the named designs that nodes belong to
+# id(node.env) --> design name
+design_names: Dict[int, str] = {}
+
+# Memoized node content hashes for the current designs
+# node id --> hash
+node_hashes: Dict[str, str] = {}
+
+# Rendered field content shared by registers of the same type
+# See RDLDocNodeDirective.get_reg_content_key()
+reg_content_cache: Dict[Tuple[Any, ...], Tuple["nodes.table", "nodes.definition_list"]] = {}
+
+# Memoized crumbtrail and address formula of each ancestor in info headers
+# See RDLDocNodeDirective.get_ancestor_prefix()
+ancestor_prefix_cache: Dict[Tuple[str, Optional[str], str], Tuple[List["nodes.Node"], str, int]] = {}
+
+# Memoized cross-reference resolution
+# (target, relative_to, target_type, html_available) --> (docname, anchor) or None
+xref_target_cache: "LRUCache"
+# (referencing directory, docname) --> relative uri
+xref_uri_cache: "LRUCache"
+
+# Inventories of other projects, from 'peakrdl_inventories'
+inventories: List["Inventory"] = []
+
+# Descriptions that were rendered ahead of time, pickled
+# (md_string, src_path) --> pickled list of docutils nodes
+prerendered_descs: Dict[Tuple[str, str], bytes] = {}
+
+# Pages of paginated rdl:doctree directives that were generated for this build
+# page docname --> docname prefix of the set of pages it is part of
+doctree_page_prefixes: Dict[str, str] = {}
+
+# Sources of designs that changed while they were compiled
+# Their contents may not match the design, so documents that depend on them
+# are treated as outdated again in the next build
+unsettled_sources: Set[str] = set()
+
+# Designs being compiled in the background, if enabled
+# design name --> future
+compile_executor: Optional["Executor"] = None
+compile_futures: Dict[Optional[str], "Future"] = {}
+
+# Background PeakRDL-html export, if enabled
+html_export_executor: Optional["Executor"] = None
+html_export_futures: List["Future"] = []
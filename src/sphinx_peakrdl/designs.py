@@ -0,0 +1,141 @@
+"""
+Elaborated designs.
+
+A project documents the design from 'peakrdl_input_files', which has no name,
+as well as any number of additional named designs from 'peakrdl_designs'.
+Nodes of a named design are identified as "<design>:<path>" in directives and
+cross-references.
+"""
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
+
+from . import design_state as DS
+from .path_index import PathIndex
+
+if TYPE_CHECKING:
+    from sphinx.config import Config
+    from systemrdl.node import Node, RootNode
+
+DESIGN_SEPARATOR = ":"
+
+DESIGN_SPEC_KEYS = {
+    "input_files", "incdirs", "defines", "parameters", "top_component", "html_title",
+}
+
+
+class DesignSpec:
+    """
+    Everything needed to compile a design
+    """
+    def __init__(self, name: Optional[str], input_files: List[str], incdirs: List[str], defines: Dict[str, str], parameters: Dict[str, Any], top_component: Optional[str], html_title: Optional[str] = None) -> None:
+        self.name = name
+        self.input_files = input_files
+        self.incdirs = incdirs
+        self.defines = defines
+        self.parameters = parameters
+        self.top_component = top_component
+        self.html_title = html_title
+
+
+class Design:
+    def __init__(self, spec: DesignSpec, root_node: "RootNode", fingerprint: Optional[str]) -> None:
+        self.spec = spec
+        self.name = spec.name
+        self.root_node = root_node
+        self.fingerprint = fingerprint
+
+        # Lookup index of all nodes in root_node
+        self.path_index = PathIndex(root_node)
+
+
+def normalize_defines(defines: Dict[str, Optional[str]]) -> Dict[str, str]:
+    # transform defines of key:None --> key:""
+    new_defines = {}
+    for key, value in defines.items():
+        if value is None:
+            new_defines[key] = ""
+        else:
+            new_defines[key] = value
+    return new_defines
+
+
+def get_design_specs(cfg: "Config") -> List[DesignSpec]:
+    specs = []
+    if cfg.peakrdl_input_files:
+        specs.append(DesignSpec(
+            None,
+            cfg.peakrdl_input_files,
+            cfg.peakrdl_incdirs,
+            cfg.peakrdl_defines,
+            cfg.peakrdl_parameters,
+            cfg.peakrdl_top_component,
+            cfg.peakrdl_html_title,
+        ))
+
+    for name, d in cfg.peakrdl_designs.items():
+        specs.append(DesignSpec(
+            name,
+            d["input_files"],
+            d.get("incdirs", []),
+            normalize_defines(d.get("defines", {})),
+            d.get("parameters", {}),
+            d.get("top_component"),
+            d.get("html_title"),
+        ))
+    return specs
+
+
+def validate_design_config(designs: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Validate the 'peakrdl_designs' config
+    """
+    for name, d in designs.items():
+        if not name.isidentifier():
+            raise ValueError(f"Config 'peakrdl_designs' has an invalid design name: '{name}'")
+        unknown = set(d) - DESIGN_SPEC_KEYS
+        if unknown:
+            raise ValueError(f"Config 'peakrdl_designs' entry '{name}' has unknown keys: {sorted(unknown)}")
+        if not d.get("input_files"):
+            raise ValueError(f"Config 'peakrdl_designs' entry '{name}' does not specify any 'input_files'")
+
+
+def add_design(design: Design) -> None:
+    DS.designs[design.name] = design
+    if design.name is not None:
+        DS.design_names[id(design.root_node.env)] = design.name
+
+
+def clear_designs() -> None:
+    DS.designs = {}
+    DS.design_names = {}
+
+
+def split_design(path: str) -> Tuple[Optional[str], str]:
+    """
+    Split "<design>:<path>" into its design name and path.
+    Paths without a design name refer to the unnamed design.
+    """
+    design_name, sep, rdl_path = path.partition(DESIGN_SEPARATOR)
+    if not sep:
+        return None, path
+    return design_name, rdl_path
+
+
+def get_node_design(rdl_node: "Node") -> Optional[str]:
+    """
+    Get the name of the design that a node belongs to
+    """
+    return DS.design_names.get(id(rdl_node.env))
+
+
+def get_node_id(rdl_node: "Node") -> str:
+    """
+    Get the identifier of a node, unique across all designs.
+
+    This is the node's path without array suffixes, prefixed with the name of
+    its design, if any.
+    """
+    path = rdl_node.get_path(array_suffix="", empty_array_suffix="")
+    design_name = get_node_design(rdl_node)
+    if design_name is None:
+        return path
+    return f"{design_name}{DESIGN_SEPARATOR}{path}"
@@ -1,4 +1,4 @@
-from typing import Sequence, Optional, List, Tuple
+from typing import TYPE_CHECKING, Sequence, Optional, List, Tuple, Any
 
 from sphinx.domains import Domain
 from sphinx.util.docutils import SphinxDirective
@@ -8,14 +8,16 @@ from sphinx import addnodes
 from docutils import nodes
 from docutils.parsers.rst import directives
 
-from systemrdl.node import Node, RegNode, AddressableNode, SignalNode, RootNode
-from systemrdl.rdltypes.references import PropertyReference
-from systemrdl.source_ref import FileSourceRef, DetailedFileSourceRef
-
-from ..utils import lookup_rdl_node, FieldList, Table, alpha_from_int
+from .. import design_state as DS
+from .. import profiling
+from ..designs import get_node_id
+from ..utils import lookup_rdl_node, get_src_paths, get_desc_source, FieldList, Table, alpha_from_int
 
 from ..markdown.render import render_to_docutils
 
+if TYPE_CHECKING:
+    from systemrdl.node import Node, RegNode, AddressableNode
+
 
 logger = logging.getLogger(__name__)
 
@@ -63,12 +65,13 @@ class RDLDocNodeDirective(SphinxDirective):
             return []
 
         # Generate content
-        return self.make_rdl_node_doc(rdl_node)
+        with profiling.phase(self.name, self.env.docname, self.target):
+            return self.make_rdl_node_doc(rdl_node)
 
     #---------------------------------------------------------------------------
     # General Utilities
     #---------------------------------------------------------------------------
-    def get_rdl_xref(self, rdl_node: Node, text: Optional[str] = None) -> addnodes.pending_xref:
+    def get_rdl_xref(self, rdl_node: "Node", text: Optional[str] = None) -> addnodes.pending_xref:
         """
         Given an RDL node, create a pending xref docutils object.
         """
@@ -76,7 +79,7 @@ class RDLDocNodeDirective(SphinxDirective):
             refdoc=self.env.docname,
             refdomain="rdl",
             reftype="", # TODO: do i care about this?
-            reftarget=rdl_node.get_path(array_suffix="", empty_array_suffix=""),
+            reftarget=get_node_id(rdl_node),
             refwarn=False, # Don't emit a warning if can't be linked
         )
         self.set_source_info(xref)
@@ -90,25 +93,34 @@ class RDLDocNodeDirective(SphinxDirective):
         xref += nodes.inline(text=text, classes=["xref"])
         return xref
 
-    def get_rdl_desc(self, rdl_node: Node) -> nodes.paragraph:
+    def note_rdl_dependencies(self, rdl_node: "Node") -> None:
         """
-        Given an RDL node, get its description and pass it though markdown processing
+        Record which RDL node and source files this node's generated content
+        depends on
         """
-        desc = rdl_node.get_property("desc") or ""
+        from systemrdl.node import RootNode # pylint: disable=import-outside-toplevel
 
-        src_ref = rdl_node.property_src_ref.get("desc", rdl_node.inst_src_ref)
-        if isinstance(src_ref, FileSourceRef):
-            path = src_ref.path
-        else:
-            path = "UNKNOWN"
+        self.domain.note_rdl_node(self.env.docname, rdl_node)
 
-        # Note: Computing the line number for EVERY src ref may be time consuming
-        # I may want to remove this in the future
-        if isinstance(src_ref, DetailedFileSourceRef):
-            line = src_ref.line
-        else:
-            line = 0
+        paths = get_src_paths(rdl_node)
 
+        # Content includes a summary of all children
+        for child in rdl_node.children():
+            paths.update(get_src_paths(child))
+
+        # Crumbtrail and absolute address depend on all ancestors
+        parent = rdl_node.parent
+        while not isinstance(parent, RootNode):
+            paths.update(get_src_paths(parent))
+            parent = parent.parent
+
+        self.domain.note_rdl_sources(self.env.docname, paths)
+
+    def get_rdl_desc(self, rdl_node: "Node") -> nodes.paragraph:
+        """
+        Given an RDL node, get its description and pass it though markdown processing
+        """
+        desc, path, line = get_desc_source(rdl_node)
         desc_nodes = render_to_docutils(desc, path, line)
 
         p = nodes.paragraph()
@@ -118,61 +130,99 @@ class RDLDocNodeDirective(SphinxDirective):
     def stringify_array_dims(self, dims: List[int]) -> str:
         return "".join([f"[{dim}]" for dim in dims])
 
-    def get_info_header(self, rdl_node: AddressableNode) -> nodes.field_list:
+    def get_array_suffixes(self, rdl_node: "AddressableNode", iterator_idx: int) -> Tuple[str, str]:
+        """
+        Get a node's crumbtrail array dimensions, and its term of the absolute
+        address formula, using iterators starting at iterator_idx
+        """
+        if not rdl_node.array_dimensions:
+            return "", ""
+
+        dims_str = ""
+        for i in range(len(rdl_node.array_dimensions)):
+            dims_str += f"[{alpha_from_int(iterator_idx + i)}]"
+
+        if len(rdl_node.array_dimensions) == 1:
+            # Is single-dimensional node.
+            addr_term = f" + {alpha_from_int(iterator_idx)}*{rdl_node.array_stride:#x}"
+        else:
+            # Equation is more complex
+            mults = ""
+            dim_parts = []
+            for i, dim in reversed(list(enumerate(rdl_node.array_dimensions))):
+                dim_parts.append(f"{mults}{alpha_from_int(iterator_idx + i)}")
+                mults = f"{dim}*{mults}"
+            dim_parts_joined = " + ".join(reversed(dim_parts))
+            addr_term = f" + ({dim_parts_joined}) * {rdl_node.array_stride:#x}"
+        return dims_str, addr_term
+
+    def get_ancestor_prefix(self, rdl_node: "AddressableNode") -> Tuple[List[nodes.Node], str, int]:
+        """
+        Get the crumbtrail and absolute address formula contributed by a node
+        and all of its ancestors, when it is an ancestor of a documented node.
+
+        Returns (crumbtrail_nodes, address_terms, n_iterators).
+        These are memoized, so that each node only extends its parent's result.
+        """
+        from systemrdl.node import RootNode # pylint: disable=import-outside-toplevel
+
+        key = (self.env.docname, self.options.get("link-to"), get_node_id(rdl_node))
+        cached = DS.ancestor_prefix_cache.get(key)
+        if cached is not None:
+            return cached
+
+        parent = rdl_node.parent
+        if isinstance(parent, RootNode):
+            crumbtrail_nodes: List[nodes.Node] = []
+            addr_terms = ""
+            iterator_idx = 0
+        else:
+            parent_nodes, addr_terms, iterator_idx = self.get_ancestor_prefix(parent)
+            crumbtrail_nodes = list(parent_nodes)
+
+        crumbtrail_nodes.append(self.get_rdl_xref(rdl_node))
+        dims_str, addr_term = self.get_array_suffixes(rdl_node, iterator_idx)
+        if dims_str:
+            crumbtrail_nodes.append(nodes.inline(text=dims_str))
+        crumbtrail_nodes.append(nodes.inline(text="."))
+
+        cached = (
+            crumbtrail_nodes,
+            addr_terms + addr_term,
+            iterator_idx + len(rdl_node.array_dimensions or []),
+        )
+        DS.ancestor_prefix_cache[key] = cached
+        return cached
+
+    def get_info_header(self, rdl_node: "AddressableNode") -> nodes.field_list:
         """
         Build the node doc's summary header objects
         """
+        from systemrdl.node import RootNode # pylint: disable=import-outside-toplevel
+
         fl = FieldList()
 
+        parent = rdl_node.parent
+        if isinstance(parent, RootNode):
+            prefix_nodes: List[nodes.Node] = []
+            addr_terms = ""
+            iterator_idx = 0
+        else:
+            prefix_nodes, addr_terms, iterator_idx = self.get_ancestor_prefix(parent)
+
         # Build crumbtrail
+        # A docutils node can only have one parent, so the memoized prefix is
+        # copied into each header
         crumbtrail = nodes.paragraph()
-        current_node = rdl_node
-        path_nodes: List[Tuple[int, AddressableNode]] = []
-        i = 0
-        iterator_idx = 0
-        while True:
-            path_nodes.append((i, current_node))
-            i += 1
-            if isinstance(current_node.parent, RootNode):
-                break
-            current_node = current_node.parent
-        path_nodes.reverse()
-        for i, path_node in path_nodes:
-            if i == 0:
-                crumbtrail.append(nodes.inline(text=path_node.inst_name))
-            else:
-                crumbtrail.append(self.get_rdl_xref(path_node))
-
-            if path_node.array_dimensions:
-                dims_str = ""
-                for _ in path_node.array_dimensions:
-                    dims_str += f"[{alpha_from_int(iterator_idx)}]"
-                    iterator_idx += 1
-                crumbtrail.append(nodes.inline(text=dims_str))
-
-            if i != 0:
-                # Is not last
-                crumbtrail.append(nodes.inline(text="."))
+        crumbtrail.extend([node.deepcopy() for node in prefix_nodes])
+        crumbtrail.append(nodes.inline(text=rdl_node.inst_name))
+        dims_str, addr_term = self.get_array_suffixes(rdl_node, iterator_idx)
+        if dims_str:
+            crumbtrail.append(nodes.inline(text=dims_str))
         fl.add_row("Path", crumbtrail)
 
         # Build absolute address formula
-        abs_addr_str = f"{rdl_node.raw_absolute_address:#x}"
-        iterator_idx = 0
-        for _, path_node in path_nodes:
-            if path_node.array_dimensions:
-                if len(path_node.array_dimensions) == 1:
-                    # Is single-dimensional node.
-                    abs_addr_str += f" + {alpha_from_int(iterator_idx)}*{path_node.array_stride:#x}"
-                else:
-                    # Equation is more complex
-                    mults = ""
-                    dim_parts = []
-                    for i, dim in reversed(list(enumerate(path_node.array_dimensions))):
-                        dim_parts.append(f"{mults}{alpha_from_int(iterator_idx + i)}")
-                        mults = f"{dim}*{mults}"
-                    dim_parts_joined = " + ".join(reversed(dim_parts))
-                    abs_addr_str += f" + ({dim_parts_joined}) * {path_node.array_stride:#x}"
-                iterator_idx += len(path_node.array_dimensions)
+        abs_addr_str = f"{rdl_node.raw_absolute_address:#x}" + addr_terms + addr_term
         fl.add_row("Absolute Address", abs_addr_str)
 
         if rdl_node.array_dimensions:
@@ -182,7 +232,9 @@ class RDLDocNodeDirective(SphinxDirective):
         return fl.as_node()
 
     #---------------------------------------------------------------------------
-    def make_rdl_node_doc(self, rdl_node: Node) -> Sequence[nodes.Element]:
+    def make_rdl_node_doc(self, rdl_node: "Node") -> Sequence[nodes.Element]:
+        from systemrdl.node import RegNode, AddressableNode # pylint: disable=import-outside-toplevel
+
         if isinstance(rdl_node, RegNode):
             doc_nodes = self.make_rdl_reg_doc(rdl_node)
         elif isinstance(rdl_node, AddressableNode):
@@ -196,8 +248,10 @@ class RDLDocNodeDirective(SphinxDirective):
             )
             return []
 
+        self.note_rdl_dependencies(rdl_node)
+
         if self.options["wrap-section"]:
-            ref_id = rdl_node.get_path(array_suffix="", empty_array_suffix="")
+            ref_id = get_node_id(rdl_node)
             heading = nodes.section()
             heading.attributes["ids"] = [ref_id]
             heading.append(nodes.title(text=rdl_node.get_property("name")))
@@ -205,19 +259,78 @@ class RDLDocNodeDirective(SphinxDirective):
             doc_nodes = [heading]
 
             # information about this doc node's location it in the domain
-            self.domain.data["rdl_docnodes"][ref_id] = self.env.docname
+            self.domain.note_docnode(self.env.docname, ref_id)
         return doc_nodes
 
 
-    def make_rdl_reg_doc(self, rdl_node: RegNode) -> Sequence[nodes.Element]:
+    def get_reg_content_key(self, rdl_node: "RegNode") -> Optional[Tuple]:
+        """
+        Get a key that identifies the rendered field content of a register.
+
+        Registers that share the same original definition and the same field
+        property values render identical field content.
+        Returns None if the content references other nodes, and is therefore
+        instance-specific.
+        """
+        from systemrdl.source_ref import FileSourceRef # pylint: disable=import-outside-toplevel
+
+        key: List[Any] = [id(rdl_node.inst.original_def)]
+        for field in rdl_node.fields():
+            reset_value = field.get_property("reset")
+            if not (reset_value is None or isinstance(reset_value, int)):
+                return None
+
+            desc_src_ref = field.property_src_ref.get("desc", field.inst_src_ref)
+            if isinstance(desc_src_ref, FileSourceRef):
+                desc_path = desc_src_ref.path
+            else:
+                desc_path = None
+
+            key.append((
+                field.inst_name,
+                field.msb,
+                field.lsb,
+                field.get_property("sw"),
+                field.get_property("onread"),
+                field.get_property("onwrite"),
+                reset_value,
+                field.get_property("name"),
+                field.get_property("desc"),
+                desc_path,
+            ))
+        return tuple(key)
+
+
+    def make_rdl_reg_doc(self, rdl_node: "RegNode") -> Sequence[nodes.Element]:
         # Info Field List Header
         fl = self.get_info_header(rdl_node)
 
         # Description
         desc_paragraph = self.get_rdl_desc(rdl_node)
 
+        # Field content is only built once per register type, and copied into
+        # each instance
+        key = self.get_reg_content_key(rdl_node)
+        if key is None:
+            table, def_list = self.make_rdl_reg_field_content(rdl_node)
+        else:
+            cached = DS.reg_content_cache.get(key)
+            if cached is None:
+                cached = self.make_rdl_reg_field_content(rdl_node)
+                DS.reg_content_cache[key] = cached
+            table = cached[0].deepcopy()
+            def_list = cached[1].deepcopy()
+
+        return [fl, desc_paragraph, table, def_list]
+
+
+    def make_rdl_reg_field_content(self, rdl_node: "RegNode") -> Tuple[nodes.table, nodes.definition_list]:
+        # pylint: disable=import-outside-toplevel
+        from systemrdl.node import SignalNode
+        from systemrdl.rdltypes.references import PropertyReference
+
         # Field Table
-        table = Table(["Bits", "Identifier", "Access", "Reset", "Name"])
+        table =Table(["Bits", "Identifier", "Access", "Reset", "Name"])
         for field in reversed(rdl_node.fields()):
             # Is actual field
             if field.width == 1:
@@ -271,11 +384,13 @@ class RDLDocNodeDirective(SphinxDirective):
             dli.append(dl_term)
             dli.append(dl_def)
 
-        return [fl, desc_paragraph, table.as_node(), def_list]
+        return table.as_node(), def_list
 
 
-    def make_rdl_grouplike_doc(self, rdl_node: AddressableNode) -> Sequence[nodes.Element]:
+    def make_rdl_grouplike_doc(self, rdl_node: "AddressableNode") -> Sequence[nodes.Element]:
         # Info Field List Header
+        from systemrdl.node import AddressableNode # pylint: disable=import-outside-toplevel
+
         fl = self.get_info_header(rdl_node)
 
         # Description
@@ -1,13 +1,17 @@
-from typing import Sequence, Optional
+from typing import TYPE_CHECKING, Sequence, Optional, List
 
 from docutils import nodes
 
+from sphinx import addnodes
 from sphinx.util import logging
 
-from systemrdl.node import Node, AddressableNode
-
 from .docnode import RDLDocNodeDirective, link_to_option
 from ..utils import lookup_rdl_node
+from ..pages import paginate_option, plan_children, get_doctree_prefix, GeneratedPage
+from .. import profiling
+
+if TYPE_CHECKING:
+    from systemrdl.node import Node
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +19,7 @@ class RDLDocTreeDirective(RDLDocNodeDirective):
 
     option_spec = {
         "link-to": link_to_option,
+        "paginate": paginate_option,
         # TODO: option for top to have heading or not
         # TODO: option to skip top
     }
@@ -34,10 +39,20 @@ class RDLDocTreeDirective(RDLDocNodeDirective):
         # Always add headings
         self.options["wrap-section"] = True
 
-        return [self.make_rdl_node_doctree(rdl_node)]
+        # Only warn once about pages that were not generated
+        self.warned_missing_pages = False
+
+        paginate = self.options.get("paginate")
+        if paginate is not None:
+            self.domain.note_paginated_doctree(self.env.docname, rdl_node, paginate, self.options.get("link-to"))
+
+        with profiling.phase(self.name, self.env.docname, self.target):
+            return [self.make_rdl_node_doctree(rdl_node)]
 
 
-    def make_rdl_node_doctree(self, rdl_node: Node) -> nodes.Element:
+    def make_rdl_node_doctree(self, rdl_node: "Node") -> nodes.Element:
+        from systemrdl.node import AddressableNode # pylint: disable=import-outside-toplevel
+
         result = self.make_rdl_node_doc(rdl_node)
 
         # result is guaranteed to be 1 element that is the <section> node
@@ -45,11 +60,69 @@ class RDLDocTreeDirective(RDLDocNodeDirective):
         assert len(result) == 1
         content = result[0]
 
-        for child in rdl_node.children():
-            if not isinstance(child, AddressableNode):
-                break
-
-            child_content = self.make_rdl_node_doctree(child)
-            content += child_content
+        paginate = self.options.get("paginate")
+        if paginate is None:
+            for child in rdl_node.children():
+                if not isinstance(child, AddressableNode):
+                    break
+
+                child_content = self.make_rdl_node_doctree(child)
+                content += child_content
+            return content
+
+        # Children that are documented in separate generated pages are linked
+        # using a toctree instead
+        page_docnames = []
+        prefix = get_doctree_prefix(self.config.peakrdl_generated_dir, self.env.docname, paginate)
+        for item in plan_children(rdl_node, paginate, prefix):
+            if isinstance(item, GeneratedPage):
+                if item.docname in self.env.found_docs:
+                    page_docnames.append(item.docname)
+                    continue
+                self.domain.note_missing_page(self.env.docname, item.docname)
+                self.warn_missing_page(item.docname)
+                for page_node in item.rdl_nodes:
+                    content += self.make_rdl_node_doctree(page_node)
+            else:
+                content += self.make_rdl_node_doctree(item)
+
+        if page_docnames:
+            content += self.make_toctree(page_docnames)
 
         return content
+
+    def warn_missing_page(self, docname: str) -> None:
+        """
+        Pages are generated before documents are parsed, from what the
+        previous build recorded and by scanning the sources of documents that
+        changed. That scan cannot see every paginated doctree, for example
+        ones in included files. Their content is inlined for now, and their
+        pages are generated by the next build.
+        """
+        if self.warned_missing_pages:
+            return
+        logger.warning(
+            "Pages of paginated rdl:doctree %s were not generated yet (e.g. '%s'), "
+            "so their content is inlined instead. They will be generated by the next build.",
+            self.target, docname,
+            location=self.get_location(),
+        )
+        self.warned_missing_pages = True
+
+    def make_toctree(self, docnames: List[str]) -> nodes.Element:
+        toctree = addnodes.toctree()
+        toctree["parent"] = self.env.docname
+        toctree["entries"] = [(None, docname) for docname in docnames]
+        toctree["includefiles"] = list(docnames)
+        toctree["maxdepth"] = 1
+        toctree["caption"] = None
+        toctree["glob"] = False
+        toctree["hidden"] = False
+        toctree["includehidden"] = False
+        toctree["numbered"] = 0
+        toctree["titlesonly"] = True
+        self.set_source_info(toctree)
+
+        wrapper = nodes.compound(classes=["toctree-wrapper"])
+        wrapper.append(toctree)
+        return wrapper
@@ -0,0 +1,244 @@
+from typing import TYPE_CHECKING, Sequence, Optional, List, Iterator, Tuple
+import heapq
+import itertools
+import fnmatch
+
+from docutils import nodes
+from docutils.parsers.rst import directives
+
+from sphinx.util import logging
+
+from .docnode import RDLDocNodeDirective, link_to_option
+from ..utils import lookup_rdl_node, get_src_paths, Table
+from .. import profiling
+
+if TYPE_CHECKING:
+    from systemrdl.node import Node, RegNode
+
+logger = logging.getLogger(__name__)
+
+def sort_option(argument) -> str:
+    return directives.choice(argument, ("address", "register"))
+
+
+class RegInstances:
+    """
+    All instances of a register, unrolled from the arrays it and its ancestors
+    are part of.
+
+    Addresses are not computed per instance by walking the hierarchy. Instead,
+    each unrolled array dimension contributes index * stride to a common base
+    address.
+    """
+    def __init__(self, rdl_node: "RegNode") -> None:
+        from systemrdl.node import RootNode, AddressableNode # pylint: disable=import-outside-toplevel
+
+        self.rdl_node = rdl_node
+
+        # Absolute address of the first instance
+        self.base = 0
+
+        # Sizes and strides of unrolled array dimensions, outermost first
+        self.dims: List[int] = []
+        self.strides: List[int] = []
+
+        # Path with a "{}" placeholder for each unrolled dimension's index
+        path_segments = []
+
+        node: Node = rdl_node
+        while not isinstance(node, RootNode):
+            assert isinstance(node, AddressableNode)
+            self.base += node.raw_address_offset
+            suffix = ""
+            if node.array_dimensions:
+                assert node.array_stride is not None
+                stride = node.array_stride
+                dim_strides = []
+                for dim in reversed(node.array_dimensions):
+                    dim_strides.append(stride)
+                    stride *= dim
+                dim_strides.reverse()
+
+                if node.current_idx is None:
+                    # Unrolled
+                    suffix = "[{}]" * len(node.array_dimensions)
+                    self.dims[:0] = node.array_dimensions
+                    self.strides[:0] = dim_strides
+                else:
+                    # Specific element
+                    suffix = "".join(f"[{idx}]" for idx in node.current_idx)
+                    self.base += sum(idx * stride for idx, stride in zip(node.current_idx, dim_strides))
+            path_segments.append(node.inst_name.replace("{", "{{").replace("}", "}}") + suffix)
+            node = node.parent
+        self.path_format = ".".join(reversed(path_segments))
+
+    @property
+    def count(self) -> int:
+        n = 1
+        for dim in self.dims:
+            n *= dim
+        return n
+
+    def __iter__(self) -> Iterator[Tuple[int, Tuple[int, ...]]]:
+        """
+        Yield (address, indexes) of all instances.
+
+        Instances are enumerated with the innermost index varying fastest.
+        Array elements do not overlap, so addresses are ascending.
+        """
+        if not self.dims:
+            yield self.base, ()
+            return
+
+        last_dim = self.dims[-1]
+        last_stride = self.strides[-1]
+        outer_strides = self.strides[:-1]
+        for outer_idx in itertools.product(*[range(dim) for dim in self.dims[:-1]]):
+            address = self.base + sum(idx * stride for idx, stride in zip(outer_idx, outer_strides))
+            for idx in range(last_dim):
+                yield address + idx * last_stride, outer_idx + (idx,)
+
+    def get_path(self, indexes: Tuple[int, ...]) -> str:
+        return self.path_format.format(*indexes)
+
+
+def iter_rows(i: int, instances: RegInstances) -> Iterator[Tuple[int, int, Tuple[int, ...]]]:
+    """
+    Yield (address, i, indexes) of all instances of the i-th register.
+    The register's index breaks ties when merging
+    """
+    for address, indexes in instances:
+        yield address, i, indexes
+
+
+def merge_by_address(reg_instances: List[RegInstances]) -> Iterator[Tuple[int, int, Tuple[int, ...]]]:
+    """
+    Yield (address, i, indexes) of all instances of all registers, in address
+    order.
+
+    Each register's instances are already in address order, so they only need
+    to be merged, rather than sorted
+    """
+    return heapq.merge(*[
+        iter_rows(i, instances)
+        for i, instances in enumerate(reg_instances)
+    ])
+
+
+class RDLRegMapDirective(RDLDocNodeDirective):
+    """
+    Flat table of every register instance within a node, with its absolute
+    address
+    """
+
+    option_spec = {
+        "link-to": link_to_option,
+        "match": directives.unchanged_required,
+        "sort": sort_option,
+        "max-rows": directives.nonnegative_int,
+    }
+
+    def run(self) -> Sequence[nodes.Node]:
+        # Try to lookup node
+        relative_to_path: Optional[str] = self.env.ref_context.get("rdl:relative-to")
+        rdl_node = lookup_rdl_node(self.target, relative_to_path)
+        if rdl_node is None:
+            logger.warning(
+                "RDL target not found: %s",
+                self.target,
+                location=self.get_location(),
+            )
+            return []
+
+        with profiling.phase(self.name, self.env.docname, self.target):
+            return self.make_regmap(rdl_node)
+
+    def iter_regs(self, rdl_node: "Node") -> Iterator["RegNode"]:
+        """
+        Find all registers within a node, in design order.
+
+        The document depends on every node visited, since any of them can add,
+        remove or move registers.
+        """
+        from systemrdl.node import RegNode, AddressableNode # pylint: disable=import-outside-toplevel
+
+        self.domain.note_rdl_node(self.env.docname, rdl_node)
+        self.domain.note_rdl_sources(self.env.docname, get_src_paths(rdl_node))
+
+        if isinstance(rdl_node, RegNode):
+            yield rdl_node
+            return
+        for child in rdl_node.children():
+            if isinstance(child, AddressableNode):
+                yield from self.iter_regs(child)
+
+    def make_regmap(self, rdl_node: "Node") -> List[nodes.Node]:
+        # Addresses also depend on the ancestors of the node
+        self.note_rdl_dependencies(rdl_node)
+
+        pattern: Optional[str] = self.options.get("match")
+        reg_instances = []
+        for reg in self.iter_regs(rdl_node):
+            if pattern is not None:
+                path = reg.get_path(array_suffix="", empty_array_suffix="")
+                if not fnmatch.fnmatchcase(path, pattern):
+                    continue
+            reg_instances.append(RegInstances(reg))
+
+        if not reg_instances:
+            logger.warning(
+                "No registers found in RDL node: %s",
+                self.target,
+                location=self.get_location(),
+            )
+            return []
+
+        rows: Iterator[Tuple[int, int, Tuple[int, ...]]]
+        if self.options.get("sort", "address") == "address":
+            rows = merge_by_address(reg_instances)
+        else:
+            # Grouped by register, in design order
+            rows = itertools.chain.from_iterable(
+                iter_rows(i, instances)
+                for i, instances in enumerate(reg_instances)
+            )
+
+        total = sum(instances.count for instances in reg_instances)
+        max_rows: int = self.options.get("max-rows", self.config.peakrdl_regmap_max_rows)
+        truncated = 0 < max_rows < total
+        if truncated:
+            rows = itertools.islice(rows, max_rows)
+            if "max-rows" not in self.options:
+                logger.warning(
+                    "Register map of %s lists %d register instances, but is limited to the first %d. "
+                    "Set the ':max-rows:' option or 'peakrdl_regmap_max_rows' to change the limit.",
+                    self.target, total, max_rows,
+                    location=self.get_location(),
+                )
+
+        # Pad addresses to the same width so that they line up
+        max_address = max(
+            instances.base + sum((dim - 1) * stride for dim, stride in zip(instances.dims, instances.strides))
+            for instances in reg_instances
+        )
+        hex_digits = max(1, (max_address.bit_length() + 3) // 4)
+
+        # Row nodes are built as the table consumes them, so the addresses of
+        # all instances never need to be held at once
+        names = [instances.rdl_node.get_property("name") for instances in reg_instances]
+        table = Table(["Address", "Identifier", "Name"])
+        table_node = table.as_node(
+            [
+                f"0x{address:0{hex_digits}x}",
+                self.get_rdl_xref(reg_instances[i].rdl_node, reg_instances[i].get_path(indexes)),
+                names[i],
+            ]
+            for address, i, indexes in rows
+        )
+
+        result: List[nodes.Node] = [table_node]
+        if truncated:
+            result.append(nodes.paragraph(
+                text=f"Showing the first {max_rows} of {total} register instances."
+            ))
+        return result
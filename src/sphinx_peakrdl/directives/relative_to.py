@@ -4,6 +4,8 @@ from sphinx.util.docutils import SphinxDirective
 from sphinx.util import logging
 
 from .. import design_state as DS
+from ..utils import lookup_rdl_node
+from ..inventory import is_inventory_node
 
 if TYPE_CHECKING:
     from docutils.nodes import Node
@@ -25,15 +27,17 @@ class RDLRelativeToDirective(SphinxDirective):
         if path == "None":
             path = None
 
-        # Validate that the path exists
-        if DS.root_node is None:
+        if path is None:
+            self.env.ref_context.pop("rdl:relative-to", None)
             return []
-        try:
-            node = DS.root_node.find_by_path(path)
-        except (ValueError, IndexError):
-            node = None
 
-        if node is None:
+        # Validate that the path exists, either locally or in another
+        # project's inventory
+        if not DS.designs and not DS.inventories:
+            return []
+        node = lookup_rdl_node(path)
+
+        if node is None and not is_inventory_node(path):
             location = self.state_machine.get_source_and_line(self.lineno)
             logger.warning(
                 "RDL target not found: %s", path,
@@ -1,20 +1,69 @@
-from typing import Optional, Set, Dict, Any
+from typing import TYPE_CHECKING, Optional, Set, Dict, Any, Iterable, Tuple, Iterator, Union
+import sys
+import posixpath
 
 from docutils.nodes import Element
 from sphinx.domains import Domain
 from sphinx.util import logging
 from docutils import nodes
-from systemrdl.node import Node, FieldNode
 
 from .roles import xrefs
 from .directives.relative_to import RDLRelativeToDirective
 from .directives.docnode import RDLDocNodeDirective
 from .directives.doctree import RDLDocTreeDirective
-from .html import HTML_INDEX
+from .directives.regmap import RDLRegMapDirective
+from .html import get_html_index
+from .designs import get_node_id, get_node_design
 from .utils import lookup_rdl_node
+from . import design_state as DS
+from . import cache
+from . import profiling
+from . import inventory
+
+if TYPE_CHECKING:
+    from systemrdl.node import Node
 
 logger = logging.getLogger(__name__)
 
+# Marks a reference that was not looked up yet
+_UNRESOLVED = object()
+
+# Key of a trie entry that marks that the path up to it is documented.
+# Path segments are never empty, so this cannot collide with one.
+# Documented paths that have no documented children are stored as True rather
+# than {_DOCUMENTED: True}, since most documented nodes are leaves
+_DOCUMENTED = ""
+
+
+def _trie_add(trie: Dict[str, Any], path: str) -> None:
+    *segments, last = path.split(".")
+    for segment in segments:
+        # Interned segments are pickled once, and referenced thereafter
+        segment = sys.intern(segment)
+        child = trie.get(segment)
+        if child is None:
+            child = trie[segment] = {}
+        elif child is True:
+            child = trie[segment] = {_DOCUMENTED: True}
+        trie = child
+
+    last = sys.intern(last)
+    if last in trie and trie[last] is not True:
+        trie[last][_DOCUMENTED] = True
+    else:
+        trie[last] = True
+
+
+def _trie_iter(trie: Dict[str, Any], prefix: str = "") -> Iterator[str]:
+    for segment, child in trie.items():
+        if segment == _DOCUMENTED:
+            yield prefix[:-1]
+        elif child is True:
+            yield prefix + segment
+        else:
+            yield from _trie_iter(child, prefix + segment + ".")
+
+
 class PeakRDLDomain(Domain):
     name = "rdl"
     label = "PeakRDL"
@@ -27,17 +76,133 @@ class PeakRDLDomain(Domain):
         "relative-to": RDLRelativeToDirective,
         "docnode": RDLDocNodeDirective,
         "doctree": RDLDocTreeDirective,
+        "regmap": RDLRegMapDirective,
     }
 
     initial_data = {
-        # rdl_path --> docname
-        "rdl_docnodes": {}
+        # docname --> trie of the rdl_paths the document contains docnodes of
+        # Each trie level maps a path segment to the next level
+        "rdl_docnodes": {},
+
+        # docname --> set of RDL source file paths the document depends on
+        "rdl_doc_sources": {},
+
+        # RDL source file path --> digest of its contents when last read
+        "rdl_source_digests": {},
+
+        # docname --> {rdl_path: node content hash} of the nodes that the
+        # document renders or references, as of when it was last read
+        "rdl_doc_nodes": {},
+
+        # docname --> list of (rdl_path, paginate, link_to) of the paginated
+        # rdl:doctree directives in the document
+        "rdl_paginated_doctrees": {},
+
+        # docname --> set of docnames of generated pages that did not exist
+        # when the document was read
+        "rdl_missing_pages": {},
+
+        # docname --> digest of the document's source when last read
+        "rdl_doc_digests": {},
     }
+    data_version = 5
+
+    # rdl_path --> docname
+    # Derived from data["rdl_docnodes"] when first needed. Not pickled.
+    _docnode_index: Optional[Dict[str, str]] = None
+
+    def clear_doc(self, docname: str) -> None:
+        if self.data["rdl_docnodes"].pop(docname, None) is not None:
+            self._docnode_index = None
+        self.data["rdl_doc_sources"].pop(docname, None)
+        self.data["rdl_doc_nodes"].pop(docname, None)
+        self.data["rdl_paginated_doctrees"].pop(docname, None)
+        self.data["rdl_missing_pages"].pop(docname, None)
+        self.data["rdl_doc_digests"].pop(docname, None)
 
     def merge_domaindata(self, docnames: Set[str], otherdata: Dict[str, Any]) -> None:
-        for rdl_path, docname in otherdata["rdl_docnodes"].items():
+        for docname in docnames:
+            trie = otherdata["rdl_docnodes"].get(docname)
+            if trie is not None:
+                self.data["rdl_docnodes"][docname] = trie
+                self._docnode_index = None
+
+        for docname, doc_sources in otherdata["rdl_doc_sources"].items():
+            if docname in docnames:
+                self.data["rdl_doc_sources"][docname] = doc_sources
+
+        for path, digest in otherdata["rdl_source_digests"].items():
+            self.data["rdl_source_digests"].setdefault(path, digest)
+
+        for docname, doc_nodes in otherdata["rdl_doc_nodes"].items():
             if docname in docnames:
-                self.data["rdl_docnodes"][rdl_path] = docname
+                self.data["rdl_doc_nodes"][docname] = doc_nodes
+
+        for key in ("rdl_paginated_doctrees", "rdl_missing_pages", "rdl_doc_digests"):
+            for docname, value in otherdata[key].items():
+                if docname in docnames:
+                    self.data[key][docname] = value
+
+    def note_docnode(self, docname: str, rdl_path: str) -> None:
+        """
+        Record that a document contains the docnode of an RDL node
+        """
+        _trie_add(self.data["rdl_docnodes"].setdefault(docname, {}), rdl_path)
+        self._docnode_index = None
+
+    def get_docnode_docname(self, rdl_path: str) -> Optional[str]:
+        """
+        Get the document that contains the docnode of an RDL node
+        """
+        if self._docnode_index is None:
+            self._docnode_index = {}
+            for docname in sorted(self.data["rdl_docnodes"]):
+                for path in _trie_iter(self.data["rdl_docnodes"][docname]):
+                    self._docnode_index[path] = docname
+        return self._docnode_index.get(rdl_path)
+
+    def note_rdl_node(self, docname: str, rdl_node: "Node") -> None:
+        """
+        Record that a document renders or references an RDL node.
+        The document is re-read if the node's content hash changes.
+        """
+        from .fingerprint import get_node_hash # pylint: disable=import-outside-toplevel
+
+        doc_nodes = self.data["rdl_doc_nodes"].setdefault(docname, {})
+        doc_nodes[get_node_id(rdl_node)] = get_node_hash(rdl_node)
+
+    def note_paginated_doctree(self, docname: str, rdl_node: "Node", paginate: Union[str, int], link_to: Optional[str]) -> None:
+        """
+        Record a paginated rdl:doctree, so that its pages are generated even if
+        it cannot be found by scanning the document's source
+        """
+        spec = (get_node_id(rdl_node), paginate, link_to)
+        specs = self.data["rdl_paginated_doctrees"].setdefault(docname, [])
+        if spec not in specs:
+            specs.append(spec)
+
+    def note_missing_page(self, docname: str, page_docname: str) -> None:
+        """
+        Record that a generated page did not exist when a document was read.
+        The document is re-read once it does.
+        """
+        self.data["rdl_missing_pages"].setdefault(docname, set()).add(page_docname)
+
+    def note_rdl_sources(self, docname: str, paths: Iterable[str]) -> None:
+        """
+        Record RDL source files that a document depends on.
+        If any of these change, the document is re-read.
+        """
+        doc_sources: Set[str] = self.data["rdl_doc_sources"].setdefault(docname, set())
+        source_digests = self.data["rdl_source_digests"]
+        for path in paths:
+            doc_sources.add(path)
+            if path not in source_digests:
+                if path in DS.unsettled_sources:
+                    # Design may not match the file. Check again next build
+                    source_digests[path] = None
+                else:
+                    source_digests[path] = cache.file_digest(path)
 
     def html_is_available(self, builder_name: str) -> bool:
         """
@@ -55,37 +220,70 @@ class PeakRDLDomain(Domain):
     def resolve_xref(self, env, fromdocname, builder, typ, target, node, contnode) -> Optional[Element]:
         """
         Resolve RDL references.
+
+        The same references tend to appear many times, so where they link to
+        is memoized for the duration of the build.
         """
         relative_to_path: Optional[str] = node.get("rdl:relative-to")
-        rdl_node = lookup_rdl_node(target, relative_to_path)
+        target_type: str = node.get("rdl:target-type", self.env.config.peakrdl_default_link_to)
+        html_available = self.html_is_available(builder.name)
 
-        if rdl_node is None:
-            return None
+        with profiling.phase("resolve_xref"):
+            key = (target, relative_to_path, target_type, html_available)
+            link = DS.xref_target_cache.get(key, _UNRESOLVED)
+            if link is _UNRESOLVED:
+                link = self.get_link(target, relative_to_path, target_type, html_available)
+                DS.xref_target_cache.put(key, link)
 
-        # Build link
-        target_type: str = node.get("rdl:target-type", self.env.config.peakrdl_default_link_to)
+            if link is None:
+                return None
+            docname, anchor = link
+            if docname is None:
+                # Node from another project's inventory. anchor is its URI
+                uri = ""
+                if inventory.is_relative_uri(anchor):
+                    uri = inventory.get_root_relative_prefix(builder, fromdocname)
+            else:
+                uri = self.get_relative_uri(builder, fromdocname, docname)
+
+        refnode = nodes.reference('', '', internal=docname is not None)
+        refnode['refuri'] = uri + anchor
+        refnode += contnode
+        return refnode
+
+    def get_link(self, target: str, relative_to_path: Optional[str], target_type: str, html_available: bool) -> Optional[Tuple[Optional[str], str]]:
+        """
+        Get where a reference links to, as (docname, anchor).
+        Nodes of other projects are linked to as (None, uri).
+        Returns None if it cannot be linked.
+        """
+        rdl_node = lookup_rdl_node(target, relative_to_path)
+        if rdl_node is None:
+            uri = inventory.get_inventory_uri(target, relative_to_path, target_type)
+            if uri is None:
+                return None
+            return None, uri
 
         if target_type == "html":
             # User prefers a link to PeakRDL-html output
-            if self.html_is_available(builder.name):
-                return self.make_html_refnode(builder, fromdocname, contnode, rdl_node)
+            if html_available:
+                return self.get_html_link(rdl_node)
             else:
-                return self.make_docnode_refnode(builder, fromdocname, contnode, rdl_node)
+                return self.get_docnode_link(rdl_node)
         elif target_type == "doc":
             # User prefers a link to internal doc
-            result = self.make_docnode_refnode(builder, fromdocname, contnode, rdl_node)
+            result = self.get_docnode_link(rdl_node)
             if result is not None:
                 return result
 
             # No docnode available to link to.
             # Fall back to html if available
-            if self.html_is_available(builder.name):
-                return self.make_html_refnode(builder, fromdocname, contnode, rdl_node)
-            else:
-                return None
+            if html_available:
+                return self.get_html_link(rdl_node)
+        return None
 
-
-    def make_html_refnode(self, builder, fromdocname, contnode, rdl_node: Node) -> nodes.reference:
+    def get_html_link(self, rdl_node: "Node") -> Tuple[str, str]:
+        from systemrdl.node import FieldNode # pylint: disable=import-outside-toplevel
 
         if isinstance(rdl_node, FieldNode):
             # Target is a field.
@@ -96,28 +294,35 @@ class PeakRDLDomain(Domain):
             targetid = None
 
         path = rdl_node.get_path(empty_array_suffix="")
-        uri = builder.get_relative_uri(fromdocname, HTML_INDEX)
-
-        node = nodes.reference('', '', internal=True)
+        docname = get_html_index(get_node_design(rdl_node))
         if targetid:
-            node['refuri'] = uri + f"?p={path}#{targetid}"
+            return docname, f"?p={path}#{targetid}"
         else:
-            node['refuri'] = uri + f"?p={path}"
+            return docname, f"?p={path}"
 
-        node += contnode
-        return node
+    def get_docnode_link(self, rdl_node: "Node") -> Optional[Tuple[str, str]]:
+        ref_id = get_node_id(rdl_node)
 
-    def make_docnode_refnode(self, builder, fromdocname, contnode, rdl_node: Node) -> Optional[nodes.reference]:
-        ref_id = rdl_node.get_path(array_suffix="", empty_array_suffix="")
-
-        ref_docname: Optional[str] = self.data["rdl_docnodes"].get(ref_id)
+        ref_docname = self.get_docnode_docname(ref_id)
         if ref_docname is None:
             # No docnode to link to. Give up
             return None
+        return ref_docname, f"#{ref_id}"
+
+    def get_relative_uri(self, builder, fromdocname: str, docname: str) -> str:
+        """
+        Memoized builder.get_relative_uri().
 
-        uri = builder.get_relative_uri(fromdocname, ref_docname)
-        node = nodes.reference('', '', internal=True)
-        node['refuri'] = uri + f"#{ref_id}"
+        Relative URIs only depend on the directory of the referencing page, so
+        they are shared by all pages in a directory. Links to the page itself
+        are the exception.
+        """
+        if fromdocname == docname:
+            return builder.get_relative_uri(fromdocname, docname)
 
-        node += contnode
-        return node
+        key = (posixpath.dirname(builder.get_target_uri(fromdocname)), docname)
+        uri = DS.xref_uri_cache.get(key)
+        if uri is None:
+            uri = builder.get_relative_uri(fromdocname, docname)
+            DS.xref_uri_cache.put(key, uri)
+        return uri
@@ -0,0 +1,259 @@
+"""
+Machine-readable export of every register and field instance.
+
+Alongside the documentation, the html builders write a CSV or JSON Lines file
+per design listing the absolute address, access, reset value and
+documentation URL of every register and field. Rows are streamed to the file
+as the design is walked, so the full register map is never held in memory.
+"""
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Iterator, Tuple, IO
+import os
+import io
+import csv
+import gzip
+import json
+import hashlib
+
+from sphinx.util import logging
+
+from . import design_state as DS
+from . import profiling
+from .utils import progress_message
+from .directives.regmap import RegInstances, merge_by_address
+
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from sphinx.builders import Builder
+    from systemrdl.node import RegNode
+    from .designs import Design
+    from .domain import PeakRDLDomain
+
+log = logging.getLogger(__name__)
+
+EXPORT_ROOT = "peakrdl-export"
+MANIFEST_FILENAME = ".sphinx-peakrdl-manifest.json"
+EXPORT_FORMATS = ("csv", "jsonl")
+
+# Bump if the content of exported files changes
+EXPORT_VERSION = 1
+
+COLUMNS = ["kind", "path", "address", "width", "lsb", "access", "reset", "url"]
+
+
+def get_export_filename(design_name: Optional[str], fmt: str, compress: bool) -> str:
+    if design_name is None:
+        filename = f"regmap.{fmt}"
+    else:
+        filename = f"regmap-{design_name}.{fmt}"
+    if compress:
+        filename += ".gz"
+    return filename
+
+
+class RegTemplate:
+    """
+    Content shared by all instances of a register
+    """
+    def __init__(self, rdl_node: "RegNode", url: str) -> None:
+        self.url = url
+        self.width: int = rdl_node.get_property("regwidth")
+
+        # (name, lsb, width, access, reset) of each field
+        self.fields: List[Tuple[str, int, int, str, Optional[int]]] = []
+        reg_reset: Optional[int] = 0
+        for field in rdl_node.fields():
+            reset = field.get_property("reset")
+            if not isinstance(reset, int):
+                # No reset, or reset to a signal or another field
+                reset = None
+                reg_reset = None
+            elif reg_reset is not None:
+                reg_reset |= reset << field.lsb
+            self.fields.append((
+                field.inst_name, field.lsb, field.width,
+                field.get_property("sw").name, reset,
+            ))
+        self.reset = reg_reset
+
+
+def get_node_url(builder: "Builder", domain: "PeakRDLDomain", rdl_node: "RegNode") -> str:
+    """
+    Get the URL of a register's docnode, relative to the output directory.
+    Falls back to the PeakRDL-HTML page if the register has no docnode.
+    """
+    link = domain.get_docnode_link(rdl_node)
+    if link is None:
+        if not domain.html_is_available(builder.name):
+            return ""
+        link = domain.get_html_link(rdl_node)
+    docname, anchor = link
+    return builder.get_target_uri(docname) + anchor
+
+
+def iter_records(templates: List[RegTemplate], reg_instances: List[RegInstances]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield a record of every register and field instance, in address order
+    """
+    for address, i, indexes in merge_by_address(reg_instances):
+        template = templates[i]
+        path = reg_instances[i].get_path(indexes)
+        yield {
+            "kind": "reg",
+            "path": path,
+            "address": address,
+            "width": template.width,
+            "lsb": None,
+            "access": None,
+            "reset": template.reset,
+            "url": template.url,
+        }
+        for name, lsb, width, access, reset in template.fields:
+            yield {
+                "kind": "field",
+                "path": f"{path}.{name}",
+                "address": address,
+                "width": width,
+                "lsb": lsb,
+                "access": access,
+                "reset": reset,
+                "url": template.url,
+            }
+
+
+def write_csv(f: IO[str], records: Iterator[Dict[str, Any]]) -> None:
+    writer = csv.writer(f, lineterminator="\n")
+    writer.writerow(COLUMNS)
+    for record in records:
+        record["address"] = f"{record['address']:#x}"
+        if record["reset"] is not None:
+            record["reset"] = f"{record['reset']:#x}"
+        writer.writerow(["" if record[column] is None else record[column] for column in COLUMNS])
+
+
+def write_jsonl(f: IO[str], records: Iterator[Dict[str, Any]]) -> None:
+    for record in records:
+        f.write(json.dumps(record))
+        f.write("\n")
+
+
+def open_export(path: str, compress: bool) -> IO[str]:
+    if compress:
+        # mtime=0 so that identical content produces identical files
+        return io.TextIOWrapper(gzip.GzipFile(path, "wb", mtime=0), encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def write_export(path: str, fmt: str, compress: bool, records: Iterator[Dict[str, Any]]) -> None:
+    """
+    Write the export to a temporary file first, so that an interrupted build
+    does not leave a truncated file behind
+    """
+    tmp_path = path + ".tmp"
+    with open_export(tmp_path, compress) as f:
+        if fmt == "csv":
+            write_csv(f, records)
+        else:
+            write_jsonl(f, records)
+    os.replace(tmp_path, path)
+
+
+def get_manifest(design: "Design", fmt: str, templates: List[RegTemplate]) -> Dict[str, Any]:
+    """
+    Get the manifest that identifies the content of an export.
+
+    URLs can change without the design changing, if docnodes move to other
+    documents
+    """
+    urls_digest = hashlib.sha256("\n".join(t.url for t in templates).encode("utf-8")).hexdigest()
+    return {
+        "design_fingerprint": design.fingerprint,
+        "format": fmt,
+        "version": EXPORT_VERSION,
+        "urls_digest": urls_digest,
+    }
+
+
+def read_manifests(output_dir: str) -> Dict[str, Any]:
+    try:
+        with open(os.path.join(output_dir, MANIFEST_FILENAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def is_export_current(output_dir: str, filename: str, manifest: Dict[str, Any], prev_manifests: Dict[str, Any]) -> bool:
+    if manifest["design_fingerprint"] is None:
+        return False
+
+    prev_manifest = dict(prev_manifests.get(filename, {}))
+    size = prev_manifest.pop("size", None)
+    if prev_manifest != manifest:
+        return False
+
+    try:
+        return os.path.getsize(os.path.join(output_dir, filename)) == size
+    except OSError:
+        return False
+
+
+def write_export_callback(app: "Sphinx") -> List[Any]:
+    """
+    Called by the 'html-collect-pages' event.
+
+    Write the register map export of each design
+    """
+    from systemrdl.node import RegNode # pylint: disable=import-outside-toplevel
+
+    if not DS.designs:
+        return []
+
+    formats: List[str] = app.config.peakrdl_export_formats
+    if not formats:
+        return []
+
+    if app.builder.name not in {"html", "dirhtml"}:
+        # URLs are not meaningful for other builders
+        return []
+
+    compress: bool = app.config.peakrdl_export_compress
+    output_dir = os.path.join(app.builder.outdir, EXPORT_ROOT)
+    os.makedirs(output_dir, exist_ok=True)
+    prev_manifests = read_manifests(output_dir)
+    manifests = {}
+
+    domain: "PeakRDLDomain" = app.env.get_domain("rdl") # type: ignore
+    for design in DS.designs.values():
+        regs = [
+            rdl_node for rdl_node in design.root_node.top.descendants()
+            if isinstance(rdl_node, RegNode)
+        ]
+        templates = [RegTemplate(reg, get_node_url(app.builder, domain, reg)) for reg in regs]
+
+        for fmt in formats:
+            filename = get_export_filename(design.name, fmt, compress)
+            manifest = get_manifest(design, fmt, templates)
+            if is_export_current(output_dir, filename, manifest, prev_manifests):
+                log.info("PeakRDL %s export is up to date", fmt.upper())
+            else:
+                # Instances are generated per record, so each format walks
+                # the design again rather than keeping them
+                reg_instances = [RegInstances(reg) for reg in regs]
+                with progress_message(f"Writing PeakRDL {fmt.upper()} export"), profiling.phase("regmap_export"):
+                    write_export(
+                        os.path.join(output_dir, filename), fmt, compress,
+                        iter_records(templates, reg_instances),
+                    )
+            manifests[filename] = dict(manifest, size=os.path.getsize(os.path.join(output_dir, filename)))
+
+    # Remove exports of designs or formats that are no longer configured
+    for filename in prev_manifests:
+        if filename not in manifests:
+            try:
+                os.remove(os.path.join(output_dir, filename))
+            except OSError:
+                pass
+
+    with open(os.path.join(output_dir, MANIFEST_FILENAME), "w", encoding="utf-8") as f:
+        json.dump(manifests, f)
+
+    return []
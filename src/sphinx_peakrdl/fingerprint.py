@@ -0,0 +1,107 @@
+"""
+Semantic content hashes of elaborated RDL nodes.
+
+A node's hash covers everything that is rendered when the node is documented:
+its properties, address and array information, a summary of its children,
+and the location of its ancestors.
+Unlike file-level dependencies, these hashes are stable if unrelated content
+in the same source file is edited.
+"""
+from typing import Any, List
+import hashlib
+
+from systemrdl.node import Node, AddressableNode, FieldNode, RootNode
+from systemrdl.rdltypes import PropertyReference, UserEnum, UserStruct, is_user_enum
+
+from . import design_state as DS
+from .designs import get_node_id
+
+
+def _value_token(value: Any) -> str:
+    """
+    Convert a property value into a stable string representation
+    """
+    if isinstance(value, Node):
+        return "node:" + value.get_path()
+    if isinstance(value, PropertyReference):
+        return f"ref:{value.node.get_path()}->{value.name}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_value_token(v) for v in value) + "]"
+    if isinstance(value, type) and is_user_enum(value):
+        members = [
+            f"{m.name}={m.value}:{m.rdl_name!r}:{m.rdl_desc!r}"
+            for m in value.members.values()
+        ]
+        return f"enum:{value.type_name}{{{','.join(members)}}}"
+    if isinstance(value, UserEnum):
+        return f"{type(value).type_name}::{value.name}"
+    if isinstance(value, UserStruct):
+        members = [
+            f"{k}={_value_token(v)}"
+            for k, v in value.members.items()
+        ]
+        return f"struct:{type(value).type_name}{{{','.join(members)}}}"
+    return repr(value)
+
+
+def _add_node_props(parts: List[str], rdl_node: Node) -> None:
+    parts.append(f"{type(rdl_node).__name__}:{rdl_node.inst_name}")
+    for prop_name in rdl_node.list_properties():
+        parts.append(f"{prop_name}={_value_token(rdl_node.get_property(prop_name))}")
+
+    if isinstance(rdl_node, AddressableNode):
+        parts.append(f"@{rdl_node.raw_address_offset:#x}+{rdl_node.size:#x}")
+        if rdl_node.array_dimensions:
+            parts.append(f"{rdl_node.array_dimensions}*{rdl_node.array_stride:#x}")
+    elif isinstance(rdl_node, FieldNode):
+        parts.append(f"[{rdl_node.msb}:{rdl_node.lsb}]")
+
+
+def get_node_hash(rdl_node: Node) -> str:
+    """
+    Get the content hash of a node.
+
+    Results are memoized for the duration of the build, keyed by the same
+    node id used to identify docnodes.
+    """
+    node_id = get_node_id(rdl_node)
+    node_hash = DS.node_hashes.get(node_id)
+    if node_hash is None:
+        node_hash = DS.node_hashes[node_id] = compute_node_hash(rdl_node)
+    return node_hash
+
+
+def compute_node_hash(rdl_node: Node) -> str:
+    """
+    Compute the content hash of a node, without memoization.
+
+    Use this for nodes that are not part of a registered design, such as
+    copies of a design in another process, since their node ids are not
+    unique.
+    """
+    parts: List[str] = []
+    _add_node_props(parts, rdl_node)
+
+    if isinstance(rdl_node, AddressableNode):
+        parts.append(f"abs@{rdl_node.raw_absolute_address:#x}")
+
+    # Crumbtrail and address formula depend on ancestors
+    parent = rdl_node.parent
+    while not isinstance(parent, RootNode):
+        parts.append(f"^{parent.inst_name}{parent.array_dimensions}*{parent.array_stride}")
+        parent = parent.parent
+
+    # Summary of children
+    for child in rdl_node.children():
+        parts.append("{")
+        if isinstance(child, FieldNode):
+            # Fields are fully documented within their register
+            _add_node_props(parts, child)
+        else:
+            parts.append(f"{type(child).__name__}:{child.inst_name}")
+            parts.append(f"name={_value_token(child.get_property('name'))}")
+            if isinstance(child, AddressableNode):
+                parts.append(f"@{child.raw_address_offset:#x}{child.array_dimensions}")
+        parts.append("}")
+
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
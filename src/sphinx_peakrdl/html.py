@@ -1,16 +1,168 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Iterable
+from concurrent.futures import ProcessPoolExecutor
 import os
+import json
 
-from peakrdl_html import HTMLExporter
+from sphinx.util import logging
 
 from . import design_state as DS
+from . import profiling
 from .utils import progress_message
 
 if TYPE_CHECKING:
     from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+    from .designs import Design
+
+log = logging.getLogger(__name__)
 
 HTML_ROOT = "peakrdl-html"
 HTML_INDEX = HTML_ROOT + "/index"
+MANIFEST_FILENAME = ".sphinx-peakrdl-manifest.json"
+
+
+def get_html_root(design_name: Optional[str]) -> str:
+    """
+    Get the output directory of a design's PeakRDL-HTML, relative to the
+    builder's output directory
+    """
+    if design_name is None:
+        return HTML_ROOT
+    return f"{HTML_ROOT}-{design_name}"
+
+
+def get_html_index(design_name: Optional[str]) -> str:
+    return get_html_root(design_name) + "/index"
+
+
+def get_export_kwargs(app: "Sphinx", design: "Design") -> Dict[str, Any]:
+    if design.spec.html_title is None:
+        title = f"{design.root_node.top.inst_name} Register Reference"
+    else:
+        title = design.spec.html_title
+
+    return {
+        "output_dir": os.path.join(app.builder.outdir, get_html_root(design.name)),
+        "title": title,
+        "home_url": app.builder.get_relative_uri(get_html_index(design.name), app.config.root_doc),
+        "extra_doc_properties": app.config.peakrdl_html_extra_doc_properties,
+        "design_fingerprint": design.fingerprint,
+        "incremental": app.config.peakrdl_html_incremental,
+    }
+
+
+def get_exporter_version() -> str:
+    try:
+        from importlib.metadata import version # pylint: disable=import-outside-toplevel
+    except ImportError:
+        # Python 3.7. Fall back to importing the exporter itself
+        from peakrdl_html.__about__ import __version__ # pylint: disable=import-outside-toplevel
+        return __version__
+    return version("peakrdl-html")
+
+
+def get_manifest(title: str, home_url: str, extra_doc_properties: List[str], design_fingerprint: Optional[str]) -> Dict[str, Any]:
+    """
+    Get the manifest that identifies the content of an HTML export
+    """
+    return {
+        "design_fingerprint": design_fingerprint,
+        "title": title,
+        "home_url": home_url,
+        "extra_doc_properties": extra_doc_properties,
+        "exporter_version": get_exporter_version(),
+    }
+
+
+def read_manifest(output_dir: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(os.path.join(output_dir, MANIFEST_FILENAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_export_current(output_dir: str, manifest: Dict[str, Any]) -> bool:
+    """
+    Check whether the existing HTML export in output_dir was generated from
+    the same design and settings, and that none of its files were removed or
+    altered
+    """
+    if manifest["design_fingerprint"] is None:
+        return False
+
+    prev_manifest = read_manifest(output_dir)
+    if prev_manifest is None:
+        return False
+
+    prev_files: Dict[str, int] = prev_manifest.pop("files", {})
+    prev_manifest.pop("digests", None)
+    if prev_manifest != manifest:
+        return False
+
+    for relpath, size in prev_files.items():
+        try:
+            if os.path.getsize(os.path.join(output_dir, relpath)) != size:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def write_manifest(output_dir: str, manifest: Dict[str, Any], files: Iterable[str], digests: Dict[str, str]) -> None:
+    """
+    Write the manifest of an HTML export, along with the sizes of the files it
+    generated, and the digests of their content
+    """
+    file_sizes = {
+        relpath: os.path.getsize(os.path.join(output_dir, relpath))
+        for relpath in sorted(files)
+    }
+    manifest = dict(manifest, files=file_sizes, digests=digests)
+    with open(os.path.join(output_dir, MANIFEST_FILENAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+
+
+def is_html_current(export_kwargs: Dict[str, Any]) -> bool:
+    manifest = get_manifest(
+        export_kwargs["title"],
+        export_kwargs["home_url"],
+        export_kwargs["extra_doc_properties"],
+        export_kwargs["design_fingerprint"],
+    )
+    return is_export_current(export_kwargs["output_dir"], manifest)
+
+
+def start_html_export_callback(app: "Sphinx", env: "BuildEnvironment", docnames: List[str]) -> None:
+    """
+    Called by the 'env-before-read-docs' event, after the design was elaborated.
+
+    If enabled, start the HTML export in a worker process so that it overlaps
+    with Sphinx reading and writing documents.
+    """
+    if not DS.designs:
+        return
+
+    if not (app.config.peakrdl_html_enable and app.config.peakrdl_html_background):
+        return
+
+    from sphinx.builders.html import StandaloneHTMLBuilder # pylint: disable=import-outside-toplevel
+    if not isinstance(app.builder, StandaloneHTMLBuilder):
+        # HTML will not be collected by this builder
+        return
+
+    from .html_export import export_html # pylint: disable=import-outside-toplevel
+
+    for design in DS.designs.values():
+        export_kwargs = get_export_kwargs(app, design)
+        if is_html_current(export_kwargs):
+            continue
+
+        if DS.html_export_executor is None:
+            DS.html_export_executor = ProcessPoolExecutor(max_workers=1)
+        DS.html_export_futures.append(DS.html_export_executor.submit(
+            export_html, design.root_node, **export_kwargs
+        ))
 
 
 def write_html_callback(app: "Sphinx") -> None:
@@ -19,27 +171,33 @@ def write_html_callback(app: "Sphinx") -> None:
 
     Export HTML
     """
-    if DS.root_node is None:
+    if not DS.designs:
         return []
 
     if not app.config.peakrdl_html_enable:
         return []
 
-    e = HTMLExporter(
-        extra_doc_properties=app.config.peakrdl_html_extra_doc_properties
-    )
+    if DS.html_export_executor is not None:
+        # Export was already started in the background
+        with progress_message("Waiting for PeakRDL HTML"), profiling.phase("html_export_wait"):
+            try:
+                for future in DS.html_export_futures:
+                    future.result()
+            finally:
+                DS.html_export_executor.shutdown()
+                DS.html_export_executor = None
+                DS.html_export_futures = []
+        return []
 
-    if app.config.peakrdl_html_title is None:
-        title = f"{DS.root_node.top.inst_name} Register Reference"
-    else:
-        title = app.config.peakrdl_html_title
-
-    with progress_message("Writing PeakRDL HTML"):
-        e.export(
-            DS.root_node,
-            os.path.join(app.builder.outdir, HTML_ROOT),
-            title=title,
-            home_url=app.builder.get_relative_uri(HTML_INDEX, app.config.root_doc)
-        )
+    for design in DS.designs.values():
+        export_kwargs = get_export_kwargs(app, design)
+        if is_html_current(export_kwargs):
+            log.info("PeakRDL HTML is up to date")
+            continue
+
+        from .html_export import export_html # pylint: disable=import-outside-toplevel
+
+        with progress_message("Writing PeakRDL HTML"), profiling.phase("html_export"):
+            export_html(design.root_node, **export_kwargs)
 
     return []
@@ -0,0 +1,249 @@
+"""
+PeakRDL-HTML export.
+
+Importing PeakRDL-HTML is expensive, so this module is only imported once an
+export is actually needed.
+"""
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Set
+import os
+import math
+import shutil
+import filecmp
+import hashlib
+
+from peakrdl_html import HTMLExporter
+from peakrdl_html.exporter import PeakRDLJSEncoder
+from peakrdl_html.search_indexer import SearchIndexer
+from systemrdl.source_ref import FileSourceRef, DetailedFileSourceRef
+
+from .fingerprint import compute_node_hash
+from .html import MANIFEST_FILENAME, get_manifest, read_manifest, write_manifest
+
+if TYPE_CHECKING:
+    from systemrdl.node import RootNode, Node
+
+# Same as HTMLExporter.write_ral_data()
+RAL_NODES_PER_FILE = 16384
+
+# Digest key of the search index, which is split into several files
+SEARCH_KEY = "search/"
+
+
+class IncrementalSearchIndexer(SearchIndexer):
+    """
+    Search indexer that does not write the search index again if it is
+    unchanged since the previous export
+    """
+    def __init__(self, exporter: "IncrementalHTMLExporter") -> None:
+        super().__init__()
+        self.exporter = exporter
+
+    def get_digest(self) -> str:
+        h = hashlib.sha1()
+        for word in sorted(self.index):
+            h.update(f"{word}:{sorted(self.index[word])}\n".encode("utf-8"))
+        return h.hexdigest()
+
+    def write_index_js(self, output_dir: str) -> None:
+        if not self.exporter.reuse_files(SEARCH_KEY, self.get_digest(), self.exporter.get_prev_files(SEARCH_KEY)):
+            super().write_index_js(output_dir)
+
+
+class IncrementalHTMLExporter(HTMLExporter):
+    """
+    HTML exporter that records a digest of every page and data file it
+    generates.
+
+    If given the digests of a previous export, files whose digest is
+    unchanged are not written again.
+    """
+    def __init__(self, prev_output_dir: Optional[str] = None, prev_files: Optional[Dict[str, int]] = None, prev_digests: Optional[Dict[str, str]] = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.prev_output_dir = prev_output_dir
+        self.prev_files = prev_files or {}
+        self.prev_digests = prev_digests or {}
+
+        # relpath --> digest of the generated content
+        self.digests: Dict[str, str] = {}
+
+        # relpaths of files of the previous export that were not written again
+        self.reused_files: Set[str] = set()
+
+    @property
+    def indexer(self) -> SearchIndexer:
+        return self._indexer
+
+    @indexer.setter
+    def indexer(self, indexer: SearchIndexer) -> None:
+        # HTMLExporter.export() creates a plain SearchIndexer
+        if indexer is not None and not isinstance(indexer, IncrementalSearchIndexer):
+            indexer = IncrementalSearchIndexer(self)
+        self._indexer = indexer
+
+    def get_prev_files(self, prefix: str) -> List[str]:
+        return [relpath for relpath in self.prev_files if relpath.startswith(prefix)]
+
+    def reuse_files(self, key: str, digest: str, relpaths: List[str]) -> bool:
+        """
+        Record the digest of some generated content, and check whether the
+        files of the previous export that contain it can be kept as-is
+        """
+        self.digests[key] = digest
+        if self.prev_output_dir is None or self.prev_digests.get(key) != digest or not relpaths:
+            return False
+        for relpath in relpaths:
+            if not os.path.exists(os.path.join(self.prev_output_dir, relpath)):
+                return False
+        self.reused_files.update(relpaths)
+        return True
+
+    def get_page_hash(self, this_id: int, node: "Node", children: Dict[int, "Node"]) -> str:
+        # The export may run in a worker process with a copy of the design,
+        # so the build's memoized node hashes do not apply
+        parts = [compute_node_hash(node), str(this_id)]
+
+        # Child IDs and sizes are rendered as links and reserved address gaps
+        for child_id, child in children.items():
+            parts.append(f"{child_id}:{child.total_size:#x}")
+
+        # Source links
+        src_ref = node.def_src_ref or node.inst_src_ref
+        if isinstance(src_ref, DetailedFileSourceRef):
+            parts.append(f"{src_ref.path}:{src_ref.line}")
+        elif isinstance(src_ref, FileSourceRef):
+            parts.append(src_ref.path)
+
+        return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def write_page(self, this_id: int, node: "Node", children: Dict[int, "Node"]) -> None:
+        relpath = f"content/{self.get_node_uid(node)}.html"
+        if self.reuse_files(relpath, self.get_page_hash(this_id, node, children), [relpath]):
+            return
+        super().write_page(this_id, node, children)
+
+    def write_ral_data(self) -> None:
+        # Same as HTMLExporter.write_ral_data(), except that unchanged
+        # RALData files are not written again
+        n_files = math.ceil(len(self.RALData) / RAL_NODES_PER_FILE)
+        encoder = PeakRDLJSEncoder(separators=(',', ':'))
+
+        PageInfo = {
+            "title" : self.title
+        }
+        path = os.path.join(self.output_dir, "data/data_index.js")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("var N_RAL_FILES = %d;\n" % n_files)
+            f.write("var N_RAL_NODES_PER_FILE = %d;\n" % RAL_NODES_PER_FILE)
+            f.write("var RootNodeIds = ")
+            f.write(encoder.encode(self.RootNodeIds))
+            f.write(";\n")
+            f.write("var PageInfo = ")
+            f.write(encoder.encode(PageInfo))
+            f.write(";\n")
+
+        for file_idx in range(n_files):
+            start = file_idx * RAL_NODES_PER_FILE
+            end = min((file_idx + 1) * RAL_NODES_PER_FILE, len(self.RALData))
+            data = encoder.encode(self.RALData[start:end])
+            relpath = f"data/ral-data-{file_idx}.json"
+            digest = hashlib.sha1(data.encode("utf-8")).hexdigest()
+            if self.reuse_files(relpath, digest, [relpath]):
+                continue
+            with open(os.path.join(self.output_dir, relpath), 'w', encoding='utf-8') as f:
+                f.write(data)
+
+    def get_generated_files(self) -> Set[str]:
+        """
+        Get the relpaths of all files of this export, including the ones that
+        were kept from the previous export
+        """
+        files = set(self.reused_files)
+        for dirpath, _, filenames in os.walk(self.output_dir):
+            for filename in filenames:
+                files.add(os.path.relpath(os.path.join(dirpath, filename), self.output_dir))
+        return files
+
+
+def sync_staged_export(staging_dir: str, output_dir: str, stale_files: List[str]) -> None:
+    """
+    Move files from a staged export into the output directory, only replacing
+    files whose contents changed, and remove files of the previous export that
+    are no longer generated.
+    Each file is replaced atomically, and the index page is updated last.
+    """
+    index_relpath = "index.html"
+    for dirpath, _, filenames in os.walk(staging_dir):
+        for filename in filenames:
+            src = os.path.join(dirpath, filename)
+            relpath = os.path.relpath(src, staging_dir)
+            if relpath == index_relpath:
+                continue
+            dst = os.path.join(output_dir, relpath)
+            if os.path.exists(dst) and filecmp.cmp(src, dst, shallow=False):
+                continue
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            os.replace(src, dst)
+
+    for relpath in stale_files:
+        path = os.path.join(output_dir, relpath)
+        if os.path.exists(path):
+            os.remove(path)
+
+    os.replace(
+        os.path.join(staging_dir, index_relpath),
+        os.path.join(output_dir, index_relpath)
+    )
+    shutil.rmtree(staging_dir)
+
+
+def export_html(root: "RootNode", output_dir: str, title: str, home_url: str, extra_doc_properties: List[str], design_fingerprint: Optional[str], incremental: bool) -> None:
+    manifest = get_manifest(title, home_url, extra_doc_properties, design_fingerprint)
+
+    # Files of the previous export are removed if they are no longer generated.
+    # Unchanged files can be kept if only the design changed
+    prev_manifest = read_manifest(output_dir)
+    prev_files: Dict[str, int] = {}
+    prev_digests = None
+    if prev_manifest is not None:
+        prev_files = prev_manifest.pop("files", {})
+        prev_digests = prev_manifest.pop("digests", None)
+        prev_manifest["design_fingerprint"] = design_fingerprint
+        if not incremental or prev_manifest != manifest:
+            prev_digests = None
+
+    # Invalidate the previous manifest in case the export is interrupted
+    manifest_path = os.path.join(output_dir, MANIFEST_FILENAME)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    if not os.path.exists(output_dir):
+        e = IncrementalHTMLExporter(
+            extra_doc_properties=extra_doc_properties
+        )
+        export_dir = output_dir
+    else:
+        # Export to a staging area. Only files that changed are moved into
+        # the output directory
+        e = IncrementalHTMLExporter(
+            prev_output_dir=None if prev_digests is None else output_dir,
+            prev_files=prev_files,
+            prev_digests=prev_digests,
+            extra_doc_properties=extra_doc_properties
+        )
+        export_dir = output_dir + ".tmp"
+        if os.path.exists(export_dir):
+            shutil.rmtree(export_dir)
+
+    e.export(
+        root,
+        export_dir,
+        title=title,
+        home_url=home_url,
+    )
+    files = e.get_generated_files()
+
+    if export_dir != output_dir:
+        stale_files = [relpath for relpath in prev_files if relpath not in files]
+        sync_staged_export(export_dir, output_dir, stale_files)
+
+    write_manifest(output_dir, manifest, files, e.digests)
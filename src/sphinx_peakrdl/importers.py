@@ -0,0 +1,256 @@
+"""
+Discovery of PeakRDL importer plugins.
+
+Discovering importers means loading the PeakRDL TOML config, scanning
+entry-points and importing every importer plugin, just to learn which file
+extensions they handle and the defaults of their command-line options.
+The outcome only changes if installed packages or the PeakRDL TOML change, so
+it is cached in the Sphinx doctree directory, and only importers that are
+needed by the input files are loaded.
+
+Caching relies on internals of PeakRDL's config loader. If those are not
+available, importers are discovered on every build instead.
+"""
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Iterable, Set
+import os
+import sys
+import pickle
+import hashlib
+import argparse
+import importlib
+
+from sphinx.util import logging
+
+from . import cache
+
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from peakrdl.plugins.importer import ImporterPlugin
+    from .designs import DesignSpec
+
+log = logging.getLogger(__name__)
+
+IMPORTERS_CACHE_FILENAME = "importers.pickle"
+
+# Suffixes of the metadata directories of installed distributions.
+# Their names contain the distribution's name and version
+DIST_INFO_SUFFIXES = (".dist-info", ".egg-info")
+
+
+class ImporterInfo:
+    """
+    Everything needed to load an importer plugin without discovering it again
+    """
+    def __init__(self, name: str, module: str, qualname: str, dist_name: Optional[str], dist_version: Optional[str], file_extensions: List[str]) -> None:
+        self.name = name
+        self.module = module
+        self.qualname = qualname
+        self.dist_name = dist_name
+        self.dist_version = dist_version
+        self.file_extensions = file_extensions
+
+    @classmethod
+    def from_importer(cls, importer: "ImporterPlugin") -> "ImporterInfo":
+        importer_cls = type(importer)
+        return cls(
+            importer.name,
+            importer_cls.__module__,
+            importer_cls.__qualname__,
+            importer.dist_name,
+            importer.dist_version,
+            list(importer.file_extensions),
+        )
+
+    def load(self) -> "ImporterPlugin":
+        obj: Any = importlib.import_module(self.module)
+        for attr in self.qualname.split("."):
+            obj = getattr(obj, attr)
+
+        # Same as get_importer_plugins(): always use the plugin's registered name
+        obj.name = self.name
+        return obj(dist_name=self.dist_name, dist_version=self.dist_version)
+
+
+class ImporterSet:
+    """
+    Result of discovering all available importer plugins
+    """
+    def __init__(self, cfg_path: str, python_search_paths: Optional[List[str]], importers: List[ImporterInfo], default_options: Dict[str, Any]) -> None:
+        # Path to the PeakRDL TOML that was used. Empty if none
+        self.cfg_path = cfg_path
+
+        # Additional import paths from the PeakRDL TOML. None if unknown, in
+        # which case they were only added to sys.path of this process
+        self.python_search_paths = python_search_paths
+
+        self.importers = importers
+
+        # Defaults of all importer command-line options
+        self.default_options = default_options
+
+    def get_argparse_options(self) -> argparse.Namespace:
+        """
+        Make a dummy argparse options namespace to satisfy importer plugins
+        """
+        return argparse.Namespace(**self.default_options)
+
+    def load(self, extensions: Set[str]) -> List["ImporterPlugin"]:
+        """
+        Load the importer plugins that handle any of the given file extensions
+        """
+        for path in self.python_search_paths or []:
+            if path not in sys.path:
+                sys.path.append(path)
+
+        return [
+            info.load()
+            for info in self.importers
+            if extensions.intersection(info.file_extensions)
+        ]
+
+
+def get_input_extensions(specs: Iterable["DesignSpec"]) -> Set[str]:
+    """
+    Get the extensions of all input files that are not SystemRDL
+    """
+    extensions = set()
+    for spec in specs:
+        for path in spec.input_files:
+            ext = os.path.splitext(path)[1].strip(".")
+            if ext != "rdl":
+                extensions.add(ext)
+    return extensions
+
+
+def find_cfg_toml(cfg_toml: Optional[str]) -> Optional[str]:
+    """
+    Find the PeakRDL TOML the same way PeakRDL does.
+    Returns an empty string if there is none, or None if it cannot be found
+    without loading it.
+    """
+    if cfg_toml is not None:
+        return cfg_toml
+
+    try:
+        # pylint: disable=import-outside-toplevel
+        from peakrdl.config.loader import _discover_cfg_file
+    except ImportError:
+        # Private to PeakRDL, so it may be gone
+        return None
+    return _discover_cfg_file() or ""
+
+
+def get_python_search_paths(peakrdl_cfg: Any) -> Optional[List[str]]:
+    """
+    Get the import paths that load_cfg() added to sys.path.
+    Returns None if they cannot be determined.
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        from peakrdl.config.loader import BOOTSTRAP_SCHEMA
+        bootstrap_cfg = BOOTSTRAP_SCHEMA.extract(peakrdl_cfg.raw_data, peakrdl_cfg.path, "")
+        return list(bootstrap_cfg["peakrdl"]["python_search_paths"])
+    except (ImportError, AttributeError, KeyError, TypeError):
+        # Private to PeakRDL, so it may be gone or have changed
+        return None
+
+
+def get_installed_dists() -> List[str]:
+    """
+    Get the names and versions of all installed distributions.
+
+    Rather than reading every distribution's metadata, this only lists the
+    names of their metadata directories.
+    """
+    dists = []
+    for path in sys.path:
+        try:
+            entries = os.listdir(path or ".")
+        except OSError:
+            continue
+        dists.extend(entry for entry in entries if entry.endswith(DIST_INFO_SUFFIXES))
+    return sorted(dists)
+
+
+def get_cache_key(cfg_path: str) -> str:
+    h = hashlib.sha1(sys.version.encode("utf-8"))
+    h.update(f"{cfg_path}:{cache.file_digest(cfg_path) if cfg_path else None}\n".encode("utf-8"))
+    for dist in get_installed_dists():
+        h.update(f"{dist}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def discover_importers(cfg_path: Optional[str]) -> ImporterSet:
+    """
+    Load the PeakRDL TOML and all importer plugins
+    """
+    # pylint: disable=import-outside-toplevel
+    from peakrdl.config.loader import load_cfg
+    from peakrdl.plugins.importer import get_importer_plugins
+
+    peakrdl_cfg = load_cfg(cfg_path or None)
+    importers = get_importer_plugins(peakrdl_cfg)
+
+    arg_parser = argparse.ArgumentParser()
+    for importer in importers:
+        importer_arg_group = arg_parser.add_argument_group(importer.name)
+        importer.add_importer_arguments(importer_arg_group)
+    default_options = vars(arg_parser.parse_args([]))
+
+    # load_cfg() already added these to sys.path. Remember them so that
+    # importers can be loaded again without loading the config.
+    return ImporterSet(
+        peakrdl_cfg.path,
+        get_python_search_paths(peakrdl_cfg),
+        [ImporterInfo.from_importer(importer) for importer in importers],
+        default_options,
+    )
+
+
+def _load_cached(path: str, key: str) -> Optional[ImporterSet]:
+    try:
+        with open(path, "rb") as f:
+            if pickle.load(f) != key:
+                return None
+            return pickle.load(f)
+    except Exception: # pylint: disable=broad-exception-caught
+        return None
+
+
+def _store_cached(path: str, key: str, importer_set: ImporterSet) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(key, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(importer_set, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except cache.PICKLE_ERRORS as e:
+        log.warning("Unable to cache PeakRDL importer plugins: %s", e)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def get_importer_set(app: "Sphinx", cfg_toml: Optional[str], use_cache: bool) -> ImporterSet:
+    """
+    Get all available importer plugins, from the cache if possible
+    """
+    cfg_path = find_cfg_toml(cfg_toml)
+    if not use_cache:
+        return discover_importers(cfg_path)
+
+    if cfg_path is None:
+        log.info("Cannot cache PeakRDL importers with this version of PeakRDL")
+        return discover_importers(cfg_path)
+
+    path = os.path.join(cache.get_cache_dir(app), IMPORTERS_CACHE_FILENAME)
+    key = get_cache_key(cfg_path)
+    importer_set = _load_cached(path, key)
+    if importer_set is None:
+        importer_set = discover_importers(cfg_path)
+        if importer_set.python_search_paths is None:
+            log.info("Cannot cache PeakRDL importers with this version of PeakRDL")
+        else:
+            _store_cached(path, key, importer_set)
+    return importer_set
@@ -0,0 +1,81 @@
+"""
+Incremental rebuild support.
+
+Documents record which RDL nodes they embed or reference, as well as the
+source files those nodes came from.
+If any of those source files change, the content hashes of the nodes each
+affected document uses are compared against the new elaboration. Only the
+documents whose nodes actually changed are re-read.
+"""
+from typing import TYPE_CHECKING, List, Set
+
+from sphinx.util import logging
+
+from . import cache
+from . import design_state as DS
+from .utils import lookup_rdl_node
+
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+    from .domain import PeakRDLDomain
+
+log = logging.getLogger(__name__)
+
+
+def get_outdated_callback(app: "Sphinx", env: "BuildEnvironment", added: Set[str], changed: Set[str], removed: Set[str]) -> List[str]:
+    """
+    Called by the 'env-get-outdated' event, after the design was elaborated.
+
+    Of the documents that depend on any RDL sources that changed, re-read only
+    the ones whose rendered nodes or xref targets changed.
+    """
+    domain: "PeakRDLDomain" = env.get_domain("rdl") # type: ignore
+
+    # Find which source files were modified since they were last read
+    source_digests = domain.data["rdl_source_digests"]
+    changed_sources = set()
+    for path, digest in source_digests.items():
+        new_digest = cache.file_digest(path)
+        if new_digest != digest:
+            changed_sources.add(path)
+            source_digests[path] = new_digest
+        if path in DS.unsettled_sources:
+            # Check again in the next build
+            source_digests[path] = None
+
+    candidates = set()
+    for docname, doc_sources in domain.data["rdl_doc_sources"].items():
+        if docname in added or docname in changed or docname in removed:
+            continue
+        if not doc_sources.isdisjoint(changed_sources):
+            candidates.add(docname)
+    if not candidates:
+        return []
+
+    outdated = [
+        docname for docname in sorted(candidates)
+        if is_doc_outdated(domain, docname)
+    ]
+
+    log.info(
+        "%d of %d documents that depend on modified RDL sources are outdated",
+        len(outdated), len(candidates)
+    )
+    return outdated
+
+
+def is_doc_outdated(domain: "PeakRDLDomain", docname: str) -> bool:
+    from .fingerprint import get_node_hash # pylint: disable=import-outside-toplevel
+
+    if not DS.designs:
+        return True
+
+    for rdl_path, node_hash in domain.data["rdl_doc_nodes"].get(docname, {}).items():
+        rdl_node = lookup_rdl_node(rdl_path)
+        if rdl_node is None:
+            return True
+        if get_node_hash(rdl_node) != node_hash:
+            return True
+    return False
+
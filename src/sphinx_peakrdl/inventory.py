@@ -0,0 +1,244 @@
+"""
+Inventories of documented RDL nodes, for linking between projects.
+
+Similar to the objects.inv file that intersphinx uses, each HTML build writes
+an inventory that maps the id of every RDL node to its docnode and
+PeakRDL-HTML URIs. Other projects list these inventories in
+'peakrdl_inventories'. Any rdl:* reference that cannot be resolved locally is
+then resolved against them, without compiling the design.
+"""
+from typing import TYPE_CHECKING, Dict, Tuple, Optional, Iterator, IO
+import os
+import re
+import zlib
+import hashlib
+import posixpath
+from urllib.request import urlopen
+
+from sphinx.util import logging
+
+from . import design_state as DS
+from . import cache
+from .designs import split_design, get_node_id, DESIGN_SEPARATOR
+
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from sphinx.builders import Builder
+    from .domain import PeakRDLDomain
+
+log = logging.getLogger(__name__)
+
+INVENTORY_FILENAME = "peakrdl.inv"
+INVENTORY_VERSION_LINE = "# sphinx-peakrdl inventory version 1"
+
+# Stands in for the node id in URIs. Docnode anchors are the node's id, so
+# this keeps the inventory compact
+ID_PLACEHOLDER = "$"
+
+# Last fetched copies of remote inventories, within the cache directory
+FETCHED_INVENTORIES_DIRNAME = "inventories"
+
+ARRAY_SUFFIX_RE = re.compile(r"\[[^\]]*\]")
+
+
+class Inventory:
+    """
+    Inventory of another project
+    """
+    def __init__(self, name: str, base_uri: str, entries: Dict[str, Tuple[str, str]]) -> None:
+        self.name = name
+
+        # URI of the other project's output. URIs in the inventory are
+        # relative to this
+        self.base_uri = base_uri
+
+        # node id --> (docnode uri, html uri). Empty if not available
+        self.entries = entries
+
+    def lookup(self, target: str, relative_to_path: Optional[str] = None) -> Optional[Tuple[str, str]]:
+        """
+        Find a node the same way as lookup_rdl_node().
+        Inventories only list nodes without array indexes.
+        """
+        target = ARRAY_SUFFIX_RE.sub("", target)
+        design_name, path = split_design(target)
+
+        if relative_to_path is not None:
+            rel_design_name, rel_path = split_design(ARRAY_SUFFIX_RE.sub("", relative_to_path))
+            if design_name is None or design_name == rel_design_name:
+                if rel_design_name is None:
+                    rel_id = f"{rel_path}.{path}"
+                else:
+                    rel_id = f"{rel_design_name}{DESIGN_SEPARATOR}{rel_path}.{path}"
+                entry = self.entries.get(rel_id)
+                if entry is not None:
+                    return entry
+
+        return self.entries.get(target)
+
+
+def is_inventory_node(target: str) -> bool:
+    """
+    Whether a node exists in any of the loaded inventories
+    """
+    return any(inv.lookup(target) is not None for inv in DS.inventories)
+
+
+def get_inventory_uri(target: str, relative_to_path: Optional[str], target_type: str) -> Optional[str]:
+    """
+    Get the URI of a node from the first inventory that has it.
+
+    Returns None if no inventory has the node, or if it is not available as
+    the preferred target type, nor as a fallback.
+    """
+    for inv in DS.inventories:
+        entry = inv.lookup(target, relative_to_path)
+        if entry is None:
+            continue
+        doc_uri, html_uri = entry
+        if target_type == "doc":
+            uri = doc_uri or html_uri
+        else:
+            uri = html_uri or doc_uri
+        if uri:
+            return posixpath.join(inv.base_uri, uri)
+    return None
+
+
+def is_relative_uri(uri: str) -> bool:
+    return "://" not in uri and not uri.startswith("/")
+
+
+def get_root_relative_prefix(builder: "Builder", fromdocname: str) -> str:
+    """
+    Get the relative path from a page to the root of the output
+    """
+    page_dir = posixpath.dirname(builder.get_target_uri(fromdocname))
+    if not page_dir:
+        return ""
+    return posixpath.relpath(".", page_dir) + "/"
+
+#-------------------------------------------------------------------------------
+# Writing
+#-------------------------------------------------------------------------------
+def iter_entries(builder: "Builder", domain: "PeakRDLDomain") -> Iterator[Tuple[str, str, str]]:
+    html_available = domain.html_is_available(builder.name)
+    for design in DS.designs.values():
+        for rdl_node in design.path_index.nodes.values():
+            node_id = get_node_id(rdl_node)
+
+            doc_uri = ""
+            doc_link = domain.get_docnode_link(rdl_node)
+            if doc_link is not None:
+                doc_uri = builder.get_target_uri(doc_link[0]) + doc_link[1].replace(node_id, ID_PLACEHOLDER)
+
+            html_uri = ""
+            if html_available:
+                html_docname, html_anchor = domain.get_html_link(rdl_node)
+                html_uri = builder.get_target_uri(html_docname) + html_anchor
+
+            if doc_uri or html_uri:
+                yield node_id, doc_uri, html_uri
+
+
+def write_inventory(f: IO[bytes], project: str, entries: Iterator[Tuple[str, str, str]]) -> None:
+    f.write(f"{INVENTORY_VERSION_LINE}\n".encode("utf-8"))
+    f.write(f"# Project: {project}\n".encode("utf-8"))
+    f.write(b"# The remainder of this file is compressed using zlib.\n")
+
+    compressor = zlib.compressobj(9)
+    for node_id, doc_uri, html_uri in entries:
+        line = f"{node_id}\t{doc_uri}\t{html_uri}\n"
+        f.write(compressor.compress(line.encode("utf-8")))
+    f.write(compressor.flush())
+
+
+def write_inventory_callback(app: "Sphinx", exception: Optional[Exception]) -> None:
+    """
+    Called by the 'build-finished' event.
+    """
+    if exception is not None or not app.config.peakrdl_inventory:
+        return
+
+    if app.builder.name not in {"html", "dirhtml"} or not DS.designs:
+        return
+
+    domain: "PeakRDLDomain" = app.env.get_domain("rdl") # type: ignore
+    with open(os.path.join(app.outdir, INVENTORY_FILENAME), "wb") as f:
+        write_inventory(f, app.config.project, iter_entries(app.builder, domain))
+
+#-------------------------------------------------------------------------------
+# Reading
+#-------------------------------------------------------------------------------
+def read_inventory(data: bytes) -> Dict[str, Tuple[str, str]]:
+    lines = data.split(b"\n", 3)
+    if len(lines) != 4 or lines[0].decode("utf-8") != INVENTORY_VERSION_LINE:
+        raise ValueError("not a sphinx-peakrdl inventory, or unsupported version")
+
+    entries = {}
+    for line in zlib.decompress(lines[3]).decode("utf-8").splitlines():
+        node_id, doc_uri, html_uri = line.split("\t")
+        entries[node_id] = (doc_uri.replace(ID_PLACEHOLDER, node_id), html_uri)
+    return entries
+
+
+def get_fetched_inventory_path(app: "Sphinx", location: str) -> str:
+    filename = hashlib.sha1(location.encode("utf-8")).hexdigest() + ".inv"
+    return os.path.join(cache.get_cache_dir(app), FETCHED_INVENTORIES_DIRNAME, filename)
+
+
+def store_fetched_inventory(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def fetch_inventory(app: "Sphinx", location: str) -> bytes:
+    if "://" not in location:
+        with open(os.path.join(app.confdir, location), "rb") as f:
+            return f.read()
+
+    with urlopen(location, timeout=app.config.peakrdl_inventory_timeout) as f:
+        data = f.read()
+    # Only keep copies that can be read back
+    read_inventory(data)
+    try:
+        store_fetched_inventory(get_fetched_inventory_path(app, location), data)
+    except OSError as e:
+        log.warning("Failed to keep a copy of PeakRDL inventory %s: %s", location, e)
+    return data
+
+
+def load_inventories_callback(app: "Sphinx") -> None:
+    """
+    Called by the 'builder-inited' event.
+    """
+    DS.inventories = []
+    for name, (base_uri, location) in app.config.peakrdl_inventories.items():
+        if location is None:
+            location = posixpath.join(base_uri, INVENTORY_FILENAME)
+        try:
+            entries = read_inventory(fetch_inventory(app, location))
+        except Exception as e: # pylint: disable=broad-exception-caught
+            if "://" not in location:
+                log.warning("Failed to load PeakRDL inventory '%s' from %s: %s", name, location, e)
+                continue
+
+            # Fall back to the last copy that was fetched
+            try:
+                with open(get_fetched_inventory_path(app, location), "rb") as f:
+                    entries = read_inventory(f.read())
+            except Exception: # pylint: disable=broad-exception-caught
+                log.warning("Failed to load PeakRDL inventory '%s' from %s: %s", name, location, e)
+                continue
+            log.warning(
+                "Failed to load PeakRDL inventory '%s' from %s: %s. Using the copy fetched by a previous build",
+                name, location, e,
+            )
+        DS.inventories.append(Inventory(name, base_uri, entries))
@@ -1,4 +1,11 @@
+"""
+Markdown parsers.
+
+This module imports the entire MyST/markdown-it stack, so it is only imported
+once a description actually needs to be rendered.
+"""
 from typing import TYPE_CHECKING, Callable
+import functools
 
 from markdown_it.renderer import RendererProtocol, RendererHTML
 
@@ -38,5 +45,11 @@ def _get_md_parser(renderer: Callable[["MarkdownIt"], RendererProtocol]) -> "Mar
 
     return md
 
-MD_DOCUTILS = _get_md_parser(PeakRDLDocutilsRenderer)
-MD_HTML = _get_md_parser(RendererHTML)
+@functools.lru_cache(maxsize=None)
+def get_docutils_parser() -> "MarkdownIt":
+    return _get_md_parser(PeakRDLDocutilsRenderer)
+
+
+@functools.lru_cache(maxsize=None)
+def get_html_parser() -> "MarkdownIt":
+    return _get_md_parser(RendererHTML)
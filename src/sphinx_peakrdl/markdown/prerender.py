@@ -0,0 +1,81 @@
+"""
+Render all descriptions of the elaborated designs ahead of time.
+
+Directives otherwise render each description as they encounter it, one node
+at a time. If enabled, every unique description is instead rendered up-front
+in a pool of worker processes, and directives pick up the results from
+design_state.prerendered_descs.
+"""
+from typing import TYPE_CHECKING, List, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+from sphinx.util import logging
+
+from .. import design_state as DS
+from .. import profiling
+from ..utils import get_desc_source, progress_message
+from .render import render_to_pickle
+
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+log = logging.getLogger(__name__)
+
+# Number of chunks handed to each worker process.
+# More chunks balance the load better, at the cost of more overhead
+CHUNKS_PER_WORKER = 4
+
+
+def collect_descs() -> Set[Tuple[str, str]]:
+    """
+    Get the unique (md_string, src_path) of all non-empty descriptions in all
+    designs
+    """
+    descs = set()
+    for design in DS.designs.values():
+        for rdl_node in design.path_index.nodes.values():
+            desc, path, _ = get_desc_source(rdl_node)
+            if desc:
+                descs.add((desc, path))
+    return descs
+
+
+def _prerender_worker(key: Tuple[str, str]) -> bytes:
+    return render_to_pickle(*key)
+
+
+def prerender_descs_callback(app: "Sphinx", env: "BuildEnvironment", docnames: List[str]) -> None:
+    """
+    Called by the 'env-before-read-docs' event.
+
+    Parallel reading forks after this event, so the results are inherited by
+    all reader processes.
+    """
+    DS.prerendered_descs = {}
+
+    if not app.config.peakrdl_prerender_desc:
+        return
+
+    if not docnames:
+        # Nothing will be read. Don't bother
+        return
+
+    max_workers = os.cpu_count() or 1
+    if max_workers < 2:
+        # Rendering lazily is faster than rendering everything up-front in
+        # a single process
+        return
+
+    keys = sorted(collect_descs())
+    if not keys:
+        return
+
+    max_workers = min(max_workers, len(keys))
+    chunksize = max(1, len(keys) // (max_workers * CHUNKS_PER_WORKER))
+    with progress_message(f"Rendering {len(keys)} PeakRDL descriptions"), \
+            profiling.phase("prerender_desc"), \
+            ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_prerender_worker, keys, chunksize=chunksize)
+        DS.prerendered_descs = dict(zip(keys, results))
@@ -1,31 +1,122 @@
-from typing import List
+from typing import TYPE_CHECKING, List, Optional, Iterator
 import os
+import pickle
 
 from docutils import nodes
 from docutils.utils import new_document
+from sphinx.util import logging
 
-from .md_parsers import MD_DOCUTILS, MD_HTML
+from .. import design_state as DS
+from .. import profiling
+from ..utils import LRUCache
+
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+
+logger = logging.getLogger(__name__)
+
+
+# Rendered markdown, keyed by (md_string, src_path).
+# Register types that are instantiated many times share identical
+# descriptions. Rather than re-parsing each one, a copy of the previously
+# rendered docutils subtree is handed back.
+RENDER_CACHE = LRUCache(1024)
+
+
+def _copy_with_offset(node: nodes.Node, src_line_offset: int) -> nodes.Node:
+    """
+    Deep-copy a docutils subtree, shifting line numbers as it is copied
+    """
+    if not isinstance(node, nodes.Element):
+        return node.deepcopy()
+
+    obj = node.copy()
+    if obj.line is not None:
+        obj.line += src_line_offset
+    obj.extend([_copy_with_offset(child, src_line_offset) for child in node.children])
+    return obj
+
+
+def _iter_tree(node: nodes.Node) -> Iterator[nodes.Node]:
+    yield node
+    if isinstance(node, nodes.Element):
+        for child in node.children:
+            yield from _iter_tree(child)
+
+
+def _shift_lines(node: nodes.Node, src_line_offset: int) -> None:
+    """
+    Shift line numbers of a docutils subtree in-place
+    """
+    for n in _iter_tree(node):
+        if isinstance(n, nodes.Element) and n.line is not None:
+            n.line += src_line_offset
 
-def render_to_docutils(md_string: str, src_path: str, src_line_offset: int = 0) -> List[nodes.Element]:
-    MD_DOCUTILS.options["document"] = new_document(src_path)
+
+def _render(md_string: str, src_path: str) -> List[nodes.Node]:
+    # Markdown parsers are expensive to import, so only do so when needed
+    from .md_parsers import get_docutils_parser # pylint: disable=import-outside-toplevel
+    md = get_docutils_parser()
+
+    md.options["document"] = new_document(src_path)
 
     env = {
         "relative-images": os.path.dirname(src_path)
     }
 
-    doc = MD_DOCUTILS.render(md_string, env)
+    doc = md.render(md_string, env)
     assert isinstance(doc, nodes.document)
 
-    if src_line_offset != 0:
-        for node in doc.traverse(nodes.Element):
-            if node.line is not None:
-                node.line += src_line_offset
-
     # MyST renderer will produce a top-level document.
     # Return the children so that they can be grafted into an existing document
     return doc.children
 
 
+def render_to_pickle(md_string: str, src_path: str) -> bytes:
+    """
+    Render markdown, and pickle the resulting nodes detached from the
+    document they were rendered into.
+    """
+    result = _render(md_string, src_path)
+    for node in result:
+        node.parent = None
+        for n in _iter_tree(node):
+            n.document = None
+    return pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+
+
+def render_to_docutils(md_string: str, src_path: str, src_line_offset: int = 0) -> List[nodes.Element]:
+    key = (md_string, src_path)
+    with profiling.phase("markdown"):
+        prerendered = DS.prerendered_descs.get(key)
+        if prerendered is not None:
+            # Unpickling already produces a fresh copy
+            result = pickle.loads(prerendered)
+            for node in result:
+                _shift_lines(node, src_line_offset)
+            return result
+
+        cached = RENDER_CACHE.get(key)
+        if cached is None:
+            cached = _render(md_string, src_path)
+            RENDER_CACHE.put(key, cached)
+
+        # Always hand back a copy since the caller will graft it into its document
+        return [_copy_with_offset(node, src_line_offset) for node in cached]
+
+
 def render_to_html(md_string: str) -> str:
-    doc = MD_HTML.render(md_string)
+    from .md_parsers import get_html_parser # pylint: disable=import-outside-toplevel
+    doc = get_html_parser().render(md_string)
     return doc
+
+
+def report_cache_stats_callback(app: "Sphinx", exception: Optional[Exception]) -> None:
+    """
+    Called by the 'build-finished' event.
+    """
+    if RENDER_CACHE.hits or RENDER_CACHE.misses:
+        logger.info(
+            "PeakRDL markdown render cache: %d hits, %d misses",
+            RENDER_CACHE.hits, RENDER_CACHE.misses
+        )
@@ -0,0 +1,612 @@
+"""
+Generated source documents.
+
+Some features split register documentation into many documents that users do
+not write themselves. These are written as ordinary reStructuredText sources
+into a directory within the Sphinx source tree before Sphinx discovers its
+sources, so they are read (and written) like any other document, including by
+Sphinx's parallel reader and writer.
+
+Files are only rewritten if their content changed, so that Sphinx does not
+consider unchanged pages to be outdated.
+"""
+from typing import TYPE_CHECKING, Dict, List, Optional, Union, Iterator, Any, Tuple, Set
+import os
+import re
+import json
+import hashlib
+import fnmatch
+
+from sphinx.util import logging
+from sphinx.project import Project
+
+from . import design_state as DS
+from .utils import lookup_rdl_node
+from .designs import get_node_id, DESIGN_SEPARATOR
+
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+    from systemrdl.node import Node, AddressableNode
+    from .domain import PeakRDLDomain
+
+log = logging.getLogger(__name__)
+
+GENERATED_SUFFIX = ".rst"
+
+# Subdirectory of generated pages of paginated rdl:doctree directives
+DOCTREE_SUBDIR = "doctree"
+
+# Lists the files in the generated directory that were generated
+MANIFEST_FILENAME = ".sphinx-peakrdl-manifest.json"
+
+GENERATED_HEADER = ".. This file was generated by sphinx-peakrdl. Do not edit.\n\n"
+
+# (node id, paginate, link_to) of a paginated rdl:doctree
+DoctreeSpec = Tuple[str, Union[str, int], Optional[str]]
+
+PAGE_RULE_KEYS = {"design", "match", "depth", "directive", "title", "link-to", "paginate"}
+
+
+def paginate_option(argument: Optional[str]) -> Union[str, int]:
+    """
+    Validate the rdl:doctree ':paginate:' option.
+    Either "addrmap", "regfile", or a number of registers per page
+    """
+    if argument is None:
+        raise ValueError("argument required but none supplied")
+    argument = argument.strip()
+    if argument in ("addrmap", "regfile"):
+        return argument
+    try:
+        n = int(argument)
+    except ValueError:
+        raise ValueError('expected "addrmap", "regfile" or a number of registers') from None
+    if n < 1:
+        raise ValueError("number of registers per page must be positive")
+    return n
+
+
+class GeneratedPage:
+    """
+    A generated document that holds part of a paginated rdl:doctree
+    """
+    def __init__(self, docname: str, rdl_nodes: List["AddressableNode"], title: Optional[str] = None) -> None:
+        self.docname = docname
+        self.rdl_nodes = rdl_nodes
+
+        # Pages that hold a chunk of registers have a title of their own
+        self.title = title
+
+
+def get_text_digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def get_generated_dir(app: "Sphinx") -> str:
+    return os.path.join(app.srcdir, app.config.peakrdl_generated_dir)
+
+
+def get_page_path(rdl_node: "Node") -> str:
+    """
+    Path of a node's generated page, relative to its subdirectory.
+    Nodes of named designs are placed in a subdirectory of the design's name
+    """
+    return get_node_id(rdl_node).replace(DESIGN_SEPARATOR, "/")
+
+
+def get_doctree_prefix(gen_dirname: str, docname: str, paginate: Union[str, int]) -> str:
+    """
+    Get the docname prefix of the pages that a paginated rdl:doctree in a
+    document generates.
+
+    Each document and paginate mode gets a set of pages of its own, so that
+    doctrees of the same node in different documents, or with different modes,
+    do not overwrite each other's pages. Generated pages are part of the set
+    of the doctree that they belong to.
+    """
+    prefix = DS.doctree_page_prefixes.get(docname)
+    if prefix is not None:
+        return prefix
+    return f"{gen_dirname}/{DOCTREE_SUBDIR}/{docname}/{paginate}"
+
+
+def get_doctree_docname(prefix: str, rdl_node: "Node") -> str:
+    return f"{prefix}/{get_page_path(rdl_node)}"
+
+
+def is_page_root(rdl_node: "Node", paginate: Union[str, int]) -> bool:
+    from systemrdl.node import AddrmapNode, RegfileNode # pylint: disable=import-outside-toplevel
+
+    if paginate == "addrmap":
+        return isinstance(rdl_node, AddrmapNode)
+    return isinstance(rdl_node, (AddrmapNode, RegfileNode))
+
+
+def plan_children(rdl_node: "Node", paginate: Union[str, int], prefix: str) -> List[Union["AddressableNode", GeneratedPage]]:
+    """
+    Decide how each child of a node in a paginated rdl:doctree is documented.
+
+    Returns an ordered list of children that are inlined into the current
+    page, and generated pages that are linked from the current page's toctree.
+    """
+    from systemrdl.node import AddressableNode, RegNode # pylint: disable=import-outside-toplevel
+
+    children = []
+    for child in rdl_node.children():
+        if not isinstance(child, AddressableNode):
+            break
+        children.append(child)
+
+    regs = [child for child in children if isinstance(child, RegNode)]
+    chunk_regs = isinstance(paginate, int) and len(regs) > paginate
+
+    plan: List[Union[AddressableNode, GeneratedPage]] = []
+    reg_idx = 0
+    for child in children:
+        if is_page_root(child, paginate):
+            plan.append(GeneratedPage(get_doctree_docname(prefix, child), [child]))
+        elif chunk_regs and isinstance(child, RegNode):
+            # Registers are grouped into pages of N
+            idx = reg_idx
+            reg_idx += 1
+            if idx % paginate != 0:
+                # Already part of a previous chunk
+                continue
+            chunk = regs[idx:idx + paginate]
+            docname = get_doctree_docname(prefix, rdl_node) + f"-regs{idx // paginate}"
+            title = f"{rdl_node.get_property('name')}: {chunk[0].inst_name} - {chunk[-1].inst_name}"
+            plan.append(GeneratedPage(docname, chunk, title))
+        else:
+            plan.append(child)
+    return plan
+
+
+def iter_doctree_pages(rdl_node: "Node", paginate: Union[str, int], prefix: str) -> Iterator[GeneratedPage]:
+    """
+    Recursively find all pages that a paginated rdl:doctree generates
+    """
+    for item in plan_children(rdl_node, paginate, prefix):
+        if isinstance(item, GeneratedPage):
+            yield item
+            if item.title is None:
+                yield from iter_doctree_pages(item.rdl_nodes[0], paginate, prefix)
+        else:
+            yield from iter_doctree_pages(item, paginate, prefix)
+
+
+def get_doctree_page_source(page: GeneratedPage, paginate: Union[str, int], link_to: Optional[str]) -> str:
+    # Pages are linked from the toctree of the doctree they belong to.
+    # Pages of a doctree that was just removed are only generated until the
+    # record of the document is updated, which shall not cause warnings
+    lines = [":orphan:", ""]
+    if page.title is None:
+        path = get_node_id(page.rdl_nodes[0])
+        lines.append(f".. rdl:doctree:: {path}")
+        lines.append(f"    :paginate: {paginate}")
+        if link_to:
+            lines.append(f"    :link-to: {link_to}")
+    else:
+        lines.append(page.title)
+        lines.append("=" * len(page.title))
+        for rdl_node in page.rdl_nodes:
+            path = get_node_id(rdl_node)
+            lines.append("")
+            lines.append(f".. rdl:docnode:: {path}")
+            lines.append("    :wrap-section:")
+            if link_to:
+                lines.append(f"    :link-to: {link_to}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def add_doctree_pages(gen: "GeneratedSources", docname: str, rdl_node: "Node", paginate: Union[str, int], link_to: Optional[str]) -> None:
+    """
+    Add all pages that a paginated rdl:doctree in a document generates
+    """
+    prefix = get_doctree_prefix(gen.gen_dirname, docname, paginate)
+    for page in iter_doctree_pages(rdl_node, paginate, prefix):
+        gen.add(page.docname, get_doctree_page_source(page, paginate, link_to))
+        DS.doctree_page_prefixes[page.docname] = prefix
+
+
+def validate_page_rules(rules: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Validate the 'peakrdl_generated_pages' config
+    """
+    for name, rule in rules.items():
+        if name == DOCTREE_SUBDIR or not re.fullmatch(r"[\w.-]+", name):
+            raise ValueError(f"Config 'peakrdl_generated_pages' has an invalid name: '{name}'")
+        unknown = set(rule) - PAGE_RULE_KEYS
+        if unknown:
+            raise ValueError(f"Config 'peakrdl_generated_pages' entry '{name}' has unknown keys: {sorted(unknown)}")
+        if "match" not in rule and "depth" not in rule:
+            raise ValueError(f"Config 'peakrdl_generated_pages' entry '{name}' shall specify 'match', 'depth', or both")
+        if not isinstance(rule.get("depth", 0), int):
+            raise ValueError(f"Config 'peakrdl_generated_pages' entry '{name}' depth shall be an integer")
+        if rule.get("directive", "docnode") not in {"docnode", "doctree"}:
+            raise ValueError(f"Config 'peakrdl_generated_pages' entry '{name}' directive shall be either 'docnode' or 'doctree'")
+        if rule.get("link-to", "html") not in {"doc", "html"}:
+            raise ValueError(f"Config 'peakrdl_generated_pages' entry '{name}' link-to shall be either 'doc' or 'html'")
+        if "paginate" in rule:
+            if rule.get("directive") != "doctree":
+                raise ValueError(f"Config 'peakrdl_generated_pages' entry '{name}' can only paginate doctree pages")
+            paginate_option(str(rule["paginate"]))
+
+
+def get_matching_nodes(rule: Dict[str, Any]) -> List["AddressableNode"]:
+    """
+    Find all addressable nodes that match a page rule, in address order.
+    Nodes at the same address, such as a block and its first child, remain in
+    design order. Arrays are ordered by the address of their first element.
+    """
+    from systemrdl.node import AddressableNode # pylint: disable=import-outside-toplevel
+
+    design = DS.designs.get(rule.get("design"))
+    if design is None:
+        return []
+
+    pattern = rule.get("match")
+    depth = rule.get("depth")
+    matches = []
+    for path, rdl_node in design.path_index.nodes.items():
+        if not isinstance(rdl_node, AddressableNode):
+            continue
+        if depth is not None and path.count(".") != depth:
+            continue
+        if pattern is not None and not fnmatch.fnmatchcase(path, pattern):
+            continue
+        matches.append(rdl_node)
+    matches.sort(key=lambda rdl_node: rdl_node.raw_absolute_address)
+    return matches
+
+
+def add_rule_pages(gen: "GeneratedSources", gen_dirname: str, name: str, rule: Dict[str, Any]) -> None:
+    """
+    Add a page for every node that matches a 'peakrdl_generated_pages' rule,
+    as well as an index page that links to all of them
+    """
+    directive = rule.get("directive", "docnode")
+    link_to = rule.get("link-to")
+    paginate = rule.get("paginate")
+    if paginate is not None:
+        paginate = paginate_option(str(paginate))
+
+    entries = []
+    for rdl_node in get_matching_nodes(rule):
+        lines = [f".. rdl:{directive}:: {get_node_id(rdl_node)}"]
+        if directive == "docnode":
+            lines.append("    :wrap-section:")
+        if link_to:
+            lines.append(f"    :link-to: {link_to}")
+        page_path = get_page_path(rdl_node)
+        docname = f"{gen_dirname}/{name}/{page_path}"
+        if paginate is not None:
+            lines.append(f"    :paginate: {paginate}")
+            add_doctree_pages(gen, docname, rdl_node, paginate, link_to)
+        lines.append("")
+        gen.add(docname, "\n".join(lines))
+        entries.append(page_path)
+
+    title = rule.get("title", name)
+    lines = [title, "=" * len(title), "", ".. toctree::", "    :maxdepth: 1", ""]
+    lines.extend(f"    {entry}" for entry in entries)
+    lines.append("")
+    gen.add(f"{gen_dirname}/{name}/index", "\n".join(lines))
+
+
+class GeneratedSources:
+    """
+    Collects the contents of generated documents and syncs them to the
+    generated source directory.
+
+    The directory holds a manifest of the files that were generated. Only
+    those are ever overwritten or removed, so user-written files that end up
+    in the directory are left alone.
+    """
+    def __init__(self, app: "Sphinx") -> None:
+        self.srcdir = app.srcdir
+        self.gen_dir = get_generated_dir(app)
+        self.gen_dirname: str = app.config.peakrdl_generated_dir
+
+        # docname --> source
+        self.sources: Dict[str, str] = {}
+
+    def add(self, docname: str, source: str) -> None:
+        prev_source = self.sources.get(docname)
+        if prev_source is not None and prev_source != source:
+            log.warning(
+                "Generated PeakRDL document '%s' is requested with conflicting content. "
+                "Only the last one is kept.",
+                docname,
+            )
+        self.sources[docname] = source
+
+    def read_manifest(self) -> Set[str]:
+        try:
+            with open(os.path.join(self.gen_dir, MANIFEST_FILENAME), "r", encoding="utf-8") as f:
+                return set(json.load(f))
+        except (OSError, ValueError):
+            return set()
+
+    def write(self) -> int:
+        """
+        Write all sources whose content changed, and remove stale sources.
+        Returns the number of files written.
+        """
+        prev_generated = self.read_manifest()
+        generated = set()
+        n_written = 0
+        for docname, source in self.sources.items():
+            relpath = docname + GENERATED_SUFFIX
+            path = os.path.join(self.srcdir, relpath)
+            source = GENERATED_HEADER + source
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    prev_source = f.read()
+            except OSError:
+                prev_source = None
+            if prev_source is not None and relpath not in prev_generated:
+                log.warning(
+                    "Not overwriting '%s', which was not generated by sphinx-peakrdl",
+                    path,
+                )
+                continue
+            generated.add(relpath)
+            if prev_source == source:
+                continue
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(source)
+            n_written += 1
+
+        # Remove generated files that are no longer needed
+        for relpath in prev_generated - generated:
+            path = os.path.join(self.srcdir, relpath)
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            # Remove directories that became empty, up to the generated dir
+            dirpath = os.path.dirname(path)
+            while os.path.normpath(dirpath) != os.path.normpath(self.gen_dir):
+                try:
+                    os.rmdir(dirpath)
+                except OSError:
+                    break
+                dirpath = os.path.dirname(dirpath)
+
+        if generated or prev_generated:
+            os.makedirs(self.gen_dir, exist_ok=True)
+            with open(os.path.join(self.gen_dir, MANIFEST_FILENAME), "w", encoding="utf-8") as f:
+                json.dump(sorted(generated), f, indent=0)
+
+        return n_written
+
+#-------------------------------------------------------------------------------
+# Finding paginated doctrees
+#-------------------------------------------------------------------------------
+# Pages have to exist before Sphinx discovers its source documents, which is
+# before any document is parsed. Each rdl:doctree records its pagination when
+# it is parsed, and these records are used as long as the document is
+# unchanged. Sources of new or modified documents are scanned for paginated
+# doctrees instead. The scan may miss some, for example in included files, but
+# their pages are then generated from the record in the next build, and the
+# document is re-read.
+
+_DOCTREE_RE = re.compile(r"^(\s*)\.\.\s+rdl:doctree::\s*(\S+)\s*$")
+_RELATIVE_TO_RE = re.compile(r"^\s*\.\.\s+rdl:relative-to::\s*(\S+)\s*$")
+_OPTION_RE = re.compile(r"^(\s*):([\w-]+):\s*(.*?)\s*$")
+_LITERAL_BLOCK_RE = re.compile(
+    r"^(\s*)(\.\.\s+(code-block|code|sourcecode|parsed-literal)::.*|(?!\.\.\s).*::)\s*$"
+)
+
+# MyST directives are fenced code blocks whose info string is {directive}
+_MYST_FENCE_RE = re.compile(r"^\s*(`{3,}|~{3,}|:{3,})\s*(?:\{([\w:-]+)\})?\s*(.*?)\s*$")
+_MYST_OPTION_RE = re.compile(r"^\s*:?([\w-]+):\s*(.*?)\s*$")
+_MYST_LITERAL_DIRECTIVES = {"code", "code-block", "code-cell", "sourcecode", "literalinclude", "parsed-literal"}
+
+
+def get_doc_filetype(path: str, source_suffix: Dict[str, Optional[str]]) -> Optional[str]:
+    for suffix, filetype in source_suffix.items():
+        if path.endswith(suffix):
+            return filetype or "restructuredtext"
+    return None
+
+
+def find_doc_paths(app: "Sphinx") -> Dict[str, str]:
+    """
+    Find the source documents the same way Sphinx will, excluding generated
+    ones. Returns docname --> absolute path
+    """
+    project = Project(app.srcdir, app.config.source_suffix)
+    exclude_paths = list(app.config.exclude_patterns)
+    exclude_paths.extend(app.config.templates_path)
+    exclude_paths.extend(app.builder.get_asset_paths())
+    include_paths = getattr(app.config, "include_patterns", None)
+    if include_paths is None:
+        # Before Sphinx 5.1
+        docnames = project.discover(exclude_paths)
+    else:
+        docnames = project.discover(exclude_paths, include_paths)
+
+    gen_prefix = app.config.peakrdl_generated_dir.strip("/") + "/"
+    return {
+        docname: str(project.doc2path(docname, True))
+        for docname in docnames
+        if not docname.startswith(gen_prefix)
+    }
+
+
+def find_paginated_doctrees(app: "Sphinx") -> Iterator[Tuple[str, DoctreeSpec]]:
+    """
+    Find paginated rdl:doctree directives of all documents.
+    Yields (docname, (target, paginate, link_to)).
+    """
+    domain: "PeakRDLDomain" = app.env.get_domain("rdl") # type: ignore
+    records = domain.data["rdl_paginated_doctrees"]
+    read_digests = domain.data["rdl_doc_digests"]
+
+    for docname, path in find_doc_paths(app).items():
+        recorded = records.get(docname, [])
+        try:
+            with open(path, "r", encoding=app.config.source_encoding) as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError):
+            continue
+
+        if read_digests.get(docname) == get_text_digest(text):
+            # Unchanged since it was parsed, so the record is complete
+            specs = list(recorded)
+        else:
+            specs = list(recorded)
+            filetype = get_doc_filetype(path, app.config.source_suffix)
+            if filetype == "restructuredtext":
+                scanned = _scan_rst_lines(text.splitlines())
+            elif filetype == "markdown":
+                scanned = _scan_myst_lines(text.splitlines())
+            else:
+                scanned = iter(())
+            for directive in scanned:
+                spec = _resolve_directive(directive)
+                if spec is not None and spec not in specs:
+                    specs.append(spec)
+
+        for spec in specs:
+            yield docname, spec
+
+
+def _resolve_directive(directive: Dict[str, str]) -> Optional[DoctreeSpec]:
+    try:
+        paginate = paginate_option(directive["paginate"])
+    except ValueError:
+        # Reported when the directive itself is parsed
+        return None
+    rdl_node = lookup_rdl_node(directive["target"], directive.get("relative-to"))
+    if rdl_node is None:
+        return None
+    return get_node_id(rdl_node), paginate, directive.get("link-to")
+
+
+def _scan_rst_lines(lines: List[str]) -> Iterator[Dict[str, str]]:
+    relative_to: Optional[str] = None
+    literal_indent: Optional[int] = None
+    for i, line in enumerate(lines):
+        # Skip examples in literal blocks
+        if literal_indent is not None:
+            if not line.strip() or len(line) - len(line.lstrip()) > literal_indent:
+                continue
+            literal_indent = None
+        m = _LITERAL_BLOCK_RE.match(line)
+        if m:
+            literal_indent = len(m.group(1))
+            continue
+
+        m = _RELATIVE_TO_RE.match(line)
+        if m:
+            relative_to = None if m.group(1) == "None" else m.group(1)
+            continue
+
+        m = _DOCTREE_RE.match(line)
+        if not m:
+            continue
+        indent = len(m.group(1))
+        directive = {"target": m.group(2)}
+        if relative_to is not None:
+            directive["relative-to"] = relative_to
+        for option_line in lines[i+1:]:
+            m = _OPTION_RE.match(option_line)
+            if not m or len(m.group(1)) <= indent:
+                break
+            directive[m.group(2)] = m.group(3)
+        if "paginate" in directive:
+            yield directive
+
+
+def _scan_myst_lines(lines: List[str]) -> Iterator[Dict[str, str]]:
+    relative_to: Optional[str] = None
+
+    # Open fences, as (fence, is literal)
+    fences: List[Tuple[str, bool]] = []
+    for i, line in enumerate(lines):
+        m = _MYST_FENCE_RE.match(line)
+        if not m:
+            continue
+        fence, name, argument = m.groups()
+        if fences:
+            open_fence, is_literal = fences[-1]
+            if fence[0] == open_fence[0] and len(fence) >= len(open_fence) and not name and not argument:
+                fences.pop()
+                continue
+            if is_literal:
+                continue
+        fences.append((fence, name is None or name in _MYST_LITERAL_DIRECTIVES))
+
+        if name == "rdl:relative-to":
+            relative_to = None if argument == "None" else argument
+        elif name == "rdl:doctree" and argument:
+            directive = {"target": argument}
+            if relative_to is not None:
+                directive["relative-to"] = relative_to
+            for option_line in lines[i+1:]:
+                if option_line.strip() == "---":
+                    # YAML option block
+                    continue
+                m = _MYST_OPTION_RE.match(option_line)
+                if not m:
+                    break
+                directive[m.group(1)] = m.group(2)
+            if "paginate" in directive:
+                yield directive
+
+
+def generate_pages_callback(app: "Sphinx") -> None:
+    """
+    Called by the 'builder-inited' event, after the design was elaborated.
+
+    Write generated source documents
+    """
+    if not DS.designs:
+        return
+
+    gen = GeneratedSources(app)
+    gen_dirname = app.config.peakrdl_generated_dir
+    DS.doctree_page_prefixes = {}
+
+    for docname, (target, paginate, link_to) in find_paginated_doctrees(app):
+        rdl_node = lookup_rdl_node(target)
+        if rdl_node is None:
+            continue
+        add_doctree_pages(gen, docname, rdl_node, paginate, link_to)
+
+    for name, rule in app.config.peakrdl_generated_pages.items():
+        add_rule_pages(gen, gen_dirname, name, rule)
+
+    n_written = gen.write()
+    if n_written:
+        log.info("Wrote %d generated PeakRDL source documents", n_written)
+
+
+def note_doc_source_callback(app: "Sphinx", docname: str, source: List[str]) -> None:
+    """
+    Called by the 'source-read' event.
+
+    Record the digest of each document's source as it is parsed, to know
+    whether its record of paginated doctrees is still complete
+    """
+    domain: "PeakRDLDomain" = app.env.get_domain("rdl") # type: ignore
+    domain.data["rdl_doc_digests"][docname] = get_text_digest(source[0])
+
+
+def get_outdated_callback(app: "Sphinx", env: "BuildEnvironment", added: Set[str], changed: Set[str], removed: Set[str]) -> List[str]:
+    """
+    Called by the 'env-get-outdated' event.
+
+    Re-read documents whose paginated doctrees inlined pages that were not
+    generated when they were read, but are now.
+    """
+    domain: "PeakRDLDomain" = env.get_domain("rdl") # type: ignore
+    return [
+        docname for docname, page_docnames in domain.data["rdl_missing_pages"].items()
+        if not page_docnames.isdisjoint(env.found_docs)
+    ]
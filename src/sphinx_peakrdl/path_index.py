@@ -0,0 +1,54 @@
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from systemrdl.node import Node, RootNode
+
+# Marks a path that was not looked up yet
+_UNRESOLVED = object()
+
+
+class PathIndex:
+    """
+    Index of all nodes in an elaborated design, keyed by their path with array
+    suffixes stripped.
+
+    This avoids walking the hierarchy using find_by_path() every time a
+    directive or cross-reference looks up a node.
+    """
+    # Number of paths with array indexes or parent references to memoize
+    INDEXED_CACHE_SIZE = 4096
+
+    def __init__(self, root: "RootNode") -> None:
+        # utils imports designs, which imports this module
+        from .utils import LRUCache # pylint: disable=import-outside-toplevel
+
+        self.root = root
+
+        # rdl_path --> node
+        self.nodes: Dict[str, "Node"] = {}
+        for node in root.descendants(skip_not_present=False):
+            self.nodes[node.get_path(array_suffix="", empty_array_suffix="")] = node
+
+        # Memoized results of paths that contain array indexes or parent
+        # references. These are rarer, and resolved lazily. Every element of
+        # an array can be referenced, so only recently used ones are kept.
+        self.indexed_nodes = LRUCache(self.INDEXED_CACHE_SIZE)
+
+    def lookup(self, path: str) -> Optional["Node"]:
+        """
+        Find the node at the given absolute path.
+        Returns None if not found, or the path is invalid.
+        """
+        if "[" not in path and "^" not in path:
+            return self.nodes.get(path)
+
+        node = self.indexed_nodes.get(path, _UNRESOLVED)
+        if node is not _UNRESOLVED:
+            return node
+
+        try:
+            node = self.root.find_by_path(path)
+        except (ValueError, IndexError):
+            node = None
+        self.indexed_nodes.put(path, node)
+        return node
@@ -0,0 +1,181 @@
+"""
+Build-phase timing and profiling instrumentation.
+
+When enabled via the 'peakrdl_profile' config value, records the wall time
+and call count of each build phase, as well as every directive invocation.
+Peak memory is also traced if 'peakrdl_profile_memory' is enabled, since
+tracemalloc slows down the build considerably. A JSON report and a
+human-readable summary are emitted at the end of the build.
+
+Times are inclusive: a phase that runs inside another one is counted in both.
+Only phases that run in the main process are recorded. Work done in parallel
+reader processes, or in the background HTML exporter, is not included.
+"""
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Iterator
+from contextlib import contextmanager
+import os
+import re
+import json
+import time
+import cProfile
+import tracemalloc
+
+from sphinx.util import logging
+
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from sphinx.config import Config
+
+log = logging.getLogger(__name__)
+
+
+class PhaseStats:
+    def __init__(self) -> None:
+        self.wall = 0.0
+        self.calls = 0
+        self.peak_mem: Optional[int] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "wall": self.wall,
+            "calls": self.calls,
+            "peak_mem": self.peak_mem,
+        }
+
+
+class _ActivePhase:
+    def __init__(self) -> None:
+        # Highest peak memory reported by nested phases
+        self.child_peak_mem = 0
+
+
+enabled = False
+cprofile_enabled = False
+memory_enabled = False
+
+phases: Dict[str, PhaseStats] = {}
+directives: List[Dict[str, Any]] = []
+profilers: Dict[str, cProfile.Profile] = {}
+_stack: List[_ActivePhase] = []
+
+
+def _reset_peak_mem() -> None:
+    # tracemalloc.reset_peak() is only available in Python 3.9+
+    # Older versions report the peak since tracing started.
+    if hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+
+
+@contextmanager
+def phase(name: str, docname: Optional[str] = None, target: Optional[str] = None) -> Iterator[None]:
+    """
+    Record the time and memory consumed by a phase of the build.
+
+    If docname is provided, the phase is also recorded as an individual
+    directive invocation.
+    """
+    if not enabled:
+        yield
+        return
+
+    active = _ActivePhase()
+    _stack.append(active)
+
+    # Only profile outermost phases since profilers cannot be nested
+    profiler = None
+    if cprofile_enabled and len(_stack) == 1:
+        profiler = profilers.setdefault(name, cProfile.Profile())
+
+    if memory_enabled:
+        _reset_peak_mem()
+    start = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        wall = time.perf_counter() - start
+        _stack.pop()
+        peak_mem = None
+        if memory_enabled:
+            peak_mem = max(tracemalloc.get_traced_memory()[1], active.child_peak_mem)
+            if _stack:
+                _stack[-1].child_peak_mem = max(_stack[-1].child_peak_mem, peak_mem)
+
+        stats = phases.setdefault(name, PhaseStats())
+        stats.wall += wall
+        stats.calls += 1
+        if peak_mem is not None:
+            stats.peak_mem = max(stats.peak_mem or 0, peak_mem)
+
+        if docname is not None:
+            directives.append({
+                "directive": name,
+                "docname": docname,
+                "target": target,
+                "wall": wall,
+                "peak_mem": peak_mem,
+            })
+
+
+def config_inited_callback(app: "Sphinx", cfg: "Config") -> None:
+    """
+    Called by the 'config-inited' event.
+    """
+    global enabled, cprofile_enabled, memory_enabled # pylint: disable=global-statement
+    enabled = cfg.peakrdl_profile is not None
+    phases.clear()
+    directives.clear()
+    profilers.clear()
+    cprofile_enabled = enabled and cfg.peakrdl_profile_cprofile
+    memory_enabled = enabled and cfg.peakrdl_profile_memory
+    if memory_enabled and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def _format_size(n: int) -> str:
+    return f"{n / (1024 * 1024):.1f} MiB"
+
+
+def build_finished_callback(app: "Sphinx", exception: Optional[Exception]) -> None:
+    """
+    Called by the 'build-finished' event.
+
+    Write the profiling report
+    """
+    if not enabled:
+        return
+
+    report_dir = os.path.join(app.confdir, app.config.peakrdl_profile)
+    os.makedirs(report_dir, exist_ok=True)
+
+    report = {
+        "phases": {name: stats.as_dict() for name, stats in phases.items()},
+        "directives": directives,
+    }
+    report_path = os.path.join(report_dir, "peakrdl-profile.json")
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    for name, profiler in profilers.items():
+        filename = re.sub(r"[^\w.-]", "_", name) + ".prof"
+        profiler.dump_stats(os.path.join(report_dir, filename))
+
+    # Human-readable summary
+    lines = ["PeakRDL build profile:"]
+    for name, stats in sorted(phases.items(), key=lambda x: x[1].wall, reverse=True):
+        line = f"  {name:<40} {stats.wall:9.3f} s {stats.calls:8d} calls"
+        if stats.peak_mem is not None:
+            line += f" {_format_size(stats.peak_mem):>12} peak"
+        lines.append(line)
+    slowest = sorted(directives, key=lambda x: x["wall"], reverse=True)[:10]
+    if slowest:
+        lines.append("  Slowest directives:")
+        for d in slowest:
+            lines.append(
+                f"    {d['wall']:9.3f} s  {d['directive']} {d['target']} ({d['docname']})"
+            )
+    lines.append(f"  Full report: {report_path}")
+    log.info("\n".join(lines))
@@ -2,6 +2,10 @@ from typing import Tuple
 
 from sphinx.roles import XRefRole
 
+from .. import design_state as DS
+from ..utils import lookup_rdl_node, get_src_paths
+from ..designs import split_design
+
 class RDLRefRole(XRefRole):
     """
     cross-reference to an RDL node.
@@ -18,7 +22,7 @@ class RDLRefRole(XRefRole):
             title = target
             if title.startswith("~"):
                 # First character is tilde. Only show the leaf node in the title
-                title = title.lstrip("~")
+                title = split_design(title.lstrip("~"))[1]
                 didx = title.rfind(".")
                 if didx != -1:
                     title = title[didx + 1:]
@@ -32,6 +36,14 @@ class RDLRefRole(XRefRole):
         target = target.lstrip("~")
         target = target.replace("|", "")
 
+        # Document needs to be re-read if the target node changes
+        if DS.designs:
+            rdl_node = lookup_rdl_node(target, refnode["rdl:relative-to"])
+            if rdl_node is not None:
+                domain = env.get_domain("rdl")
+                domain.note_rdl_node(env.docname, rdl_node)
+                domain.note_rdl_sources(env.docname, get_src_paths(rdl_node))
+
         return title, target
 
 class RDLHTMLRefRole(RDLRefRole):
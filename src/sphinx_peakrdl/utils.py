@@ -1,6 +1,7 @@
-from typing import Optional, List, Tuple, Union
+from typing import TYPE_CHECKING, Optional, List, Tuple, Union, Set, Any, Hashable, Iterable
+from collections import OrderedDict
+import os
 
-from systemrdl.node import Node
 from sphinx import version_info as sphinx_version
 from docutils import nodes
 
@@ -11,32 +12,79 @@ else:
 
 
 from . import design_state as DS
+from .designs import split_design
 
+if TYPE_CHECKING:
+    from systemrdl.node import Node
 
-def lookup_rdl_node(target: str, relative_to_path: Optional[str] = None) -> Optional[Node]:
 
-    if relative_to_path is not None:
-        relative_to_node = DS.root_node.find_by_path(relative_to_path)
-    else:
-        relative_to_node = None
+def lookup_rdl_node(target: str, relative_to_path: Optional[str] = None) -> Optional["Node"]:
+    """
+    Find a node by its path.
+
+    Paths of nodes in named designs are prefixed with "<design>:".
+    """
+    design_name, path = split_design(target)
 
     # Try relative search first, if set
     rdl_node = None
-    if relative_to_node:
-        try:
-            rdl_node = relative_to_node.find_by_path(target)
-        except (ValueError, IndexError):
-            rdl_node = None
+    if relative_to_path is not None:
+        rel_design_name, rel_path = split_design(relative_to_path)
+        if design_name is None or design_name == rel_design_name:
+            design = DS.designs.get(rel_design_name)
+            if design is not None:
+                rdl_node = design.path_index.lookup(f"{rel_path}.{path}")
 
     # Fall back to global scope
     if rdl_node is None:
-        try:
-            rdl_node = DS.root_node.find_by_path(target)
-        except (ValueError, IndexError):
-            rdl_node = None
+        design = DS.designs.get(design_name)
+        if design is None:
+            # No such design was loaded
+            return None
+        rdl_node = design.path_index.lookup(path)
 
     return rdl_node
 
+def get_src_paths(rdl_node: "Node") -> Set[str]:
+    """
+    Get the paths of all source files that contributed to a node's instance,
+    definition, or property assignments
+    """
+    from systemrdl.source_ref import FileSourceRef # pylint: disable=import-outside-toplevel
+
+    src_refs = [rdl_node.inst_src_ref, rdl_node.def_src_ref]
+    src_refs.extend(rdl_node.property_src_ref.values())
+
+    paths = set()
+    for src_ref in src_refs:
+        if isinstance(src_ref, FileSourceRef):
+            paths.add(os.path.abspath(src_ref.path))
+    return paths
+
+def get_desc_source(rdl_node: "Node") -> Tuple[str, str, int]:
+    """
+    Get a node's description, along with the path and line number of where it
+    was assigned
+    """
+    from systemrdl.source_ref import FileSourceRef, DetailedFileSourceRef # pylint: disable=import-outside-toplevel
+
+    desc = rdl_node.get_property("desc") or ""
+
+    src_ref = rdl_node.property_src_ref.get("desc", rdl_node.inst_src_ref)
+    if isinstance(src_ref, FileSourceRef):
+        path = src_ref.path
+    else:
+        path = "UNKNOWN"
+
+    # Note: Computing the line number for EVERY src ref may be time consuming
+    # I may want to remove this in the future
+    if isinstance(src_ref, DetailedFileSourceRef):
+        line = src_ref.line
+    else:
+        line = 0
+
+    return desc, path, line
+
 def wrap_paragraph(value: Union[nodes.Node, str]) -> nodes.TextElement:
     if isinstance(value, nodes.TextElement):
         # Is already wrapped in a text element
@@ -86,7 +134,14 @@ class Table:
     def add_row(self, row: List[Union[nodes.Node, str]]) -> None:
         self.rows.append(row)
 
-    def as_node(self) -> nodes.table:
+    def as_node(self, rows: Optional[Iterable[List[Union[nodes.Node, str]]]] = None) -> nodes.table:
+        """
+        Build the table from the added rows, or from rows instead if given.
+        rows can be an iterator, which is consumed as the table is built.
+        """
+        if rows is None:
+            rows = self.rows
+
         tgroup = nodes.tgroup(cols=len(self.headings))
         for heading in self.headings:
             tgroup += nodes.colspec()
@@ -104,7 +159,7 @@ class Table:
 
         # Table
         tbody = nodes.tbody()
-        for row_data in self.rows:
+        for row_data in rows:
             row = nodes.row()
             for value in row_data:
                 entry = nodes.entry()
@@ -132,11 +187,43 @@ def alpha_from_int(n: int) -> str:
     return s
 
 
+class LRUCache:
+    """
+    Dictionary with a bounded number of entries.
+    The least recently used entry is evicted first.
+    """
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.max_size <= 0:
+            return
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+
 __all__ = [
     "status_iterator",
     "progress_message",
     "lookup_rdl_node",
+    "get_src_paths",
     "FieldList",
     "Table",
     "alpha_from_int",
+    "LRUCache",
 ]
@@ -0,0 +1,33 @@
+import os
+
+import pytest
+from systemrdl import RDLCompiler
+
+from sphinx_peakrdl import design_state as DS
+from sphinx_peakrdl.designs import Design, DesignSpec, add_design, clear_designs
+
+THIS_DIR = os.path.dirname(__file__)
+
+
+def compile_rdl(name: str):
+    rdlc = RDLCompiler()
+    rdlc.compile_file(os.path.join(THIS_DIR, name))
+    return rdlc.elaborate()
+
+
+@pytest.fixture(scope="session")
+def root():
+    return compile_rdl("soc.rdl")
+
+
+@pytest.fixture
+def design(root):
+    """
+    Register the design as the project's unnamed design
+    """
+    spec = DesignSpec(None, [os.path.join(THIS_DIR, "soc.rdl")], [], {}, {}, None)
+    d = Design(spec, root, None)
+    add_design(d)
+    yield d
+    clear_designs()
+    DS.doctree_page_prefixes = {}
@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+from sphinx_peakrdl.domain import PeakRDLDomain, _trie_add, _trie_iter
+
+
+def make_domain() -> PeakRDLDomain:
+    return PeakRDLDomain(SimpleNamespace(domaindata={}))
+
+
+def test_trie_add_iter():
+    trie = {}
+    for path in ["soc.dma.channel.ctrl", "soc.dma", "soc.regs", "soc.dma.channel.status"]:
+        _trie_add(trie, path)
+
+    # A documented leaf that later gets documented children keeps its entry
+    _trie_add(trie, "soc.regs.en")
+    assert sorted(_trie_iter(trie)) == [
+        "soc.dma",
+        "soc.dma.channel.ctrl",
+        "soc.dma.channel.status",
+        "soc.regs",
+        "soc.regs.en",
+    ]
+
+
+def test_docnode_docname():
+    domain = make_domain()
+    domain.note_docnode("a", "soc.dma")
+    domain.note_docnode("b", "soc.dma.channel.ctrl")
+    assert domain.get_docnode_docname("soc.dma") == "a"
+    assert domain.get_docnode_docname("soc.dma.channel.ctrl") == "b"
+    assert domain.get_docnode_docname("soc.dma.channel") is None
+
+
+def test_clear_doc(design):
+    domain = make_domain()
+    domain.note_docnode("a", "soc.dma")
+    domain.note_docnode("b", "soc.regs")
+    domain.note_rdl_node("a", design.path_index.lookup("soc.dma"))
+    assert domain.get_docnode_docname("soc.dma") == "a"
+
+    domain.clear_doc("a")
+    assert domain.get_docnode_docname("soc.dma") is None
+    assert domain.get_docnode_docname("soc.regs") == "b"
+    assert "a" not in domain.data["rdl_doc_nodes"]
+
+
+def test_merge_domaindata(design):
+    domain = make_domain()
+    domain.note_docnode("a", "soc.dma")
+
+    # Data of a parallel reader process
+    other = make_domain()
+    other.note_docnode("b", "soc.regs")
+    other.note_docnode("c", "soc.late")
+    other.note_rdl_node("b", design.path_index.lookup("soc.regs"))
+
+    domain.merge_domaindata({"b"}, other.data)
+    assert domain.get_docnode_docname("soc.dma") == "a"
+    assert domain.get_docnode_docname("soc.regs") == "b"
+
+    # Only data of the given documents is merged
+    assert domain.get_docnode_docname("soc.late") is None
+    assert list(domain.data["rdl_doc_nodes"]) == ["b"]
+    assert domain.data["rdl_doc_nodes"]["b"] == other.data["rdl_doc_nodes"]["b"]
@@ -0,0 +1,27 @@
+import io
+
+import pytest
+
+from sphinx_peakrdl.inventory import write_inventory, read_inventory, ID_PLACEHOLDER
+
+
+def test_round_trip():
+    entries = [
+        ("soc.dma", f"regs.html#{ID_PLACEHOLDER}", "peakrdl-html/index.html?p=soc.dma"),
+        ("soc.regs", "", "peakrdl-html/index.html?p=soc.regs"),
+        ("other:top.x", f"other/top.html#{ID_PLACEHOLDER}", ""),
+    ]
+    f = io.BytesIO()
+    write_inventory(f, "My Project", iter(entries))
+
+    inv = read_inventory(f.getvalue())
+    assert inv == {
+        "soc.dma": ("regs.html#soc.dma", "peakrdl-html/index.html?p=soc.dma"),
+        "soc.regs": ("", "peakrdl-html/index.html?p=soc.regs"),
+        "other:top.x": ("other/top.html#other:top.x", ""),
+    }
+
+
+def test_unsupported_version():
+    with pytest.raises(ValueError):
+        read_inventory(b"# Sphinx inventory version 2\n# Project: x\n# Version:\n")
@@ -0,0 +1,72 @@
+import pytest
+
+from sphinx_peakrdl import design_state as DS
+from sphinx_peakrdl.pages import (
+    paginate_option, get_doctree_prefix, plan_children, iter_doctree_pages,
+    GeneratedPage,
+)
+
+
+def test_paginate_option():
+    assert paginate_option("addrmap") == "addrmap"
+    assert paginate_option(" regfile ") == "regfile"
+    assert paginate_option("8") == 8
+    for argument in [None, "0", "-1", "block"]:
+        with pytest.raises(ValueError):
+            paginate_option(argument)
+
+
+def test_doctree_prefix_per_doc_and_mode(design):
+    prefixes = {
+        get_doctree_prefix("_gen", docname, paginate)
+        for docname in ["index", "sub/index"]
+        for paginate in ["addrmap", "regfile", 2]
+    }
+    assert len(prefixes) == 6
+    assert get_doctree_prefix("_gen", "sub/index", 2) == "_gen/doctree/sub/index/2"
+
+
+def test_doctree_prefix_of_generated_page(design):
+    # Pages that are generated by a doctree use the prefix of that doctree
+    DS.doctree_page_prefixes["_gen/doctree/index/addrmap/soc.dma"] = "_gen/doctree/index/addrmap"
+    prefix = get_doctree_prefix("_gen", "_gen/doctree/index/addrmap/soc.dma", "addrmap")
+    assert prefix == "_gen/doctree/index/addrmap"
+
+
+# Children of an elaborated node are in address order
+def describe(plan):
+    return [
+        item.docname if isinstance(item, GeneratedPage) else item.inst_name
+        for item in plan
+    ]
+
+
+def test_plan_children_addrmap(design):
+    soc = design.path_index.lookup("soc")
+    plan = plan_children(soc, "addrmap", "p")
+    assert describe(plan) == ["regs", "late", "p/soc.dma"]
+
+    dma = design.path_index.lookup("soc.dma")
+    assert describe(plan_children(dma, "addrmap", "p")) == ["global_ctrl", "channel"]
+
+
+def test_plan_children_regfile(design):
+    dma = design.path_index.lookup("soc.dma")
+    assert describe(plan_children(dma, "regfile", "p")) == ["global_ctrl", "p/soc.dma.channel"]
+
+
+def test_plan_children_chunks(design):
+    soc = design.path_index.lookup("soc")
+    plan = plan_children(soc, 1, "p")
+    assert describe(plan) == ["p/soc-regs0", "p/soc-regs1", "p/soc.dma"]
+    assert [node.inst_name for node in plan[0].rdl_nodes] == ["regs"]
+    assert plan[0].title is not None
+
+    # No chunks if the registers fit in one page
+    assert describe(plan_children(soc, 2, "p")) == ["regs", "late", "p/soc.dma"]
+
+
+def test_iter_doctree_pages(design):
+    soc = design.path_index.lookup("soc")
+    pages = [page.docname for page in iter_doctree_pages(soc, "regfile", "p")]
+    assert pages == ["p/soc.dma", "p/soc.dma.channel"]
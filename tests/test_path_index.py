@@ -0,0 +1,37 @@
+from sphinx_peakrdl.path_index import PathIndex
+
+
+def test_plain_lookup(root):
+    index = PathIndex(root)
+    node = index.lookup("soc.dma.channel.ctrl")
+    assert node.get_path() == "soc.dma.channel[].ctrl"
+    assert index.lookup("soc.nope") is None
+
+
+def test_indexed_lookup(root):
+    index = PathIndex(root)
+    node = index.lookup("soc.dma.channel[2].status")
+    assert node.get_path() == "soc.dma.channel[2].status"
+    assert node.absolute_address == 0x1000 + 0x100 + 2 * 0x10 + 4
+
+    # Memoized
+    assert index.lookup("soc.dma.channel[2].status") is node
+    assert index.indexed_nodes.hits == 1
+
+    # Out of range index
+    assert index.lookup("soc.dma.channel[9].status") is None
+
+
+def test_relative_lookup(root):
+    index = PathIndex(root)
+    node = index.lookup("soc.dma.channel[1].^.global_ctrl")
+    assert node.get_path() == "soc.dma.global_ctrl"
+    assert index.lookup("soc.dma.channel[1].^.nope") is None
+
+
+def test_indexed_lookup_is_bounded(root):
+    index = PathIndex(root)
+    index.indexed_nodes.max_size = 2
+    for i in range(4):
+        assert index.lookup(f"soc.regs[{i}]") is not None
+    assert len(index.indexed_nodes.entries) == 2
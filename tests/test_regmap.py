@@ -0,0 +1,36 @@
+from sphinx_peakrdl.directives.regmap import RegInstances, merge_by_address
+
+
+def test_unrolled_instances(design):
+    instances = RegInstances(design.path_index.lookup("soc.dma.channel.status"))
+    assert instances.count == 4
+    rows = list(instances)
+    assert rows == [(0x1000 + 0x100 + i * 0x10 + 4, (i,)) for i in range(4)]
+    assert instances.get_path((3,)) == "soc.dma.channel[3].status"
+
+
+def test_specific_element(design):
+    instances = RegInstances(design.path_index.lookup("soc.dma.channel[2].ctrl"))
+    assert instances.count == 1
+    assert list(instances) == [(0x1120, ())]
+    assert instances.get_path(()) == "soc.dma.channel[2].ctrl"
+
+
+def test_addresses_match_compiler(design):
+    instances = RegInstances(design.path_index.lookup("soc.dma.channel.ctrl"))
+    for address, indexes in instances:
+        node = design.path_index.lookup(instances.get_path(indexes))
+        assert node.absolute_address == address
+
+
+def test_merge_by_address(design):
+    regs = [
+        RegInstances(design.path_index.lookup(path))
+        for path in ["soc.dma.channel.ctrl", "soc.dma.channel.status", "soc.regs", "soc.late"]
+    ]
+    rows = list(merge_by_address(regs))
+    addresses = [address for address, _, _ in rows]
+    assert addresses == sorted(addresses)
+    assert len(rows) == 4 + 4 + 6 + 1
+    assert rows[0] == (0, 2, (0,))
+    assert rows[-1] == (0x1134, 1, (3,))